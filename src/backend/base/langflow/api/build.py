@@ -21,6 +21,7 @@ from langflow.api.utils import (
     format_exception_message,
     get_top_level_vertices,
     parse_exception,
+    update_cached_graph_from_data,
 )
 from langflow.api.v1.schemas import (
     FlowDataRequest,
@@ -436,12 +437,20 @@ async def generate_flow_events(
             if not data:
                 return await build_graph_from_db(flow_id=flow_id, session=fresh_session, chat_service=chat_service)
 
+            payload = data.model_dump()
+            # Edits that only change the data of nodes keep the results of the vertices upstream of them
+            graph = await update_cached_graph_from_data(
+                flow_id_str, payload, chat_service=chat_service, user_id=str(current_user.id)
+            )
+            if graph is not None:
+                return graph
+
             result = await fresh_session.exec(select(Flow.name).where(Flow.id == flow_id))
             flow_name = result.first()
 
             return await build_graph_from_data(
                 flow_id=flow_id_str,
-                payload=data.model_dump(),
+                payload=payload,
                 user_id=str(current_user.id),
                 flow_name=flow_name,
             )
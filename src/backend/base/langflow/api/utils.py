@@ -11,6 +11,8 @@ from sqlalchemy import delete
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.graph.graph.base import Graph
+from langflow.graph.graph.snapshot import dump_graph_snapshot, load_graph_snapshot
+from langflow.graph.graph.utils import diff_graph_data, process_flow
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models import User
 from langflow.services.database.models.flow import Flow
@@ -158,6 +160,11 @@ async def build_graph_from_data(flow_id: uuid.UUID | str, payload: dict, **kwarg
         kwargs["flow_name"] = flow_name
     str_flow_id = str(flow_id)
     graph = Graph.from_payload(payload, str_flow_id, **kwargs)
+    await _start_run(graph, str_flow_id)
+    return graph
+
+
+async def _start_run(graph: Graph, str_flow_id: str) -> None:
     for vertex_id in graph.has_session_id_vertices:
         vertex = graph.get_vertex(vertex_id)
         if vertex is None:
@@ -170,6 +177,48 @@ async def build_graph_from_data(flow_id: uuid.UUID | str, payload: dict, **kwarg
     graph.set_run_id(run_id)
     graph.set_run_name()
     await graph.initialize_run()
+
+
+async def update_cached_graph_from_data(
+    flow_id: uuid.UUID | str,
+    payload: dict,
+    chat_service: ChatService,
+    user_id: str | None = None,
+) -> Graph | None:
+    """Updates the graph cached for a flow to a new version of its payload.
+
+    Only the vertices whose data changed and the vertices downstream of them lose their built
+    results. The next build of the graph keeps the results of the others if it runs with the same
+    inputs, so they are not built again. The update is made on a copy of the cached graph, as the
+    jobs of a flow can share the graph of an in-memory cache.
+
+    Returns:
+        Graph | None: The updated graph, or None if the flow has no cached graph of the user, if the
+            graph has cycles or if the payload adds or removes vertices or edges. The graph has to be
+            built from the payload in those cases.
+    """
+    str_flow_id = str(flow_id)
+    cached = await chat_service.get_cache(str_flow_id)
+    graph = cached.get("result") if isinstance(cached, dict) else None
+    if not isinstance(graph, Graph) or graph.flow_id != str_flow_id or graph.user_id != user_id:
+        return None
+    # Loops keep their iteration state in their components, so they always start from a new graph
+    if graph.is_cyclic:
+        return None
+    graph_data = process_flow(payload.get("data", payload))
+    if diff_graph_data(graph._vertices, graph._edges, graph_data["nodes"], graph_data["edges"]).is_structural:
+        return None
+    try:
+        if not chat_service.snapshot_graphs:
+            # Snapshot caches load a new graph on every read, the others can return the one other jobs use
+            graph = load_graph_snapshot(dump_graph_snapshot(graph, compress=False))
+        invalidated = graph.update_from_payload(payload)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(f"Could not update the cached graph of flow {str_flow_id}: {exc}")
+        return None
+    graph.reusable_vertices = {vertex.id for vertex in graph.vertices if vertex.built} - invalidated
+    graph.run_manager.vertices_being_run.clear()
+    await _start_run(graph, str_flow_id)
     return graph
 
 
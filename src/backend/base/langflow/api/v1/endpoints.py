@@ -32,6 +32,7 @@ from langflow.events.event_manager import create_stream_tokens_event_manager
 from langflow.exceptions.api import APIException, InvalidChatInputError
 from langflow.exceptions.serialization import SerializationError
 from langflow.graph.graph.base import Graph
+from langflow.graph.graph.template import get_graph_template
 from langflow.graph.schema import RunOutputs
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
@@ -271,9 +272,10 @@ async def simple_run_flow(
         if flow.data is None:
             msg = f"Flow {flow_id_str} has no data"
             raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
+        graph_template = get_graph_template(
+            flow.data, flow_id=flow_id_str, updated_at=flow.updated_at, flow_name=flow.name
+        )
+        graph = graph_template.instantiate(user_id=str(user_id), tweaks=input_request.tweaks or {}, stream=stream)
         inputs = None
         if input_request.input_value is not None:
             inputs = [
@@ -7,9 +7,11 @@ from fastapi_pagination.ext.sqlmodel import paginate
 from sqlalchemy import delete
 from sqlmodel import col, select
 
-from langflow.api.utils import DbSession, custom_params
+from langflow.api.utils import CurrentActiveUser, DbSession, custom_params
+from langflow.graph.graph.profiler import GraphProfiler, get_graph_profile, list_graph_profiles
+from langflow.graph.vertex.result_cache import get_vertex_result_cache_stats
 from langflow.schema.message import MessageResponse
-from langflow.services.auth.utils import get_current_active_user
+from langflow.services.auth.utils import get_current_active_superuser, get_current_active_user
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
 from langflow.services.database.models.transactions.crud import transform_transaction_table
 from langflow.services.database.models.transactions.model import TransactionTable
@@ -18,6 +20,8 @@ from langflow.services.database.models.vertex_builds.crud import (
     get_vertex_builds_by_flow_id,
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
+from langflow.services.deps import get_cache_service, get_settings_service
+from langflow.utils.executors import get_executor_pools_stats
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
@@ -174,3 +178,66 @@ async def get_transactions(
         return await paginate(session, stmt, params=params, transformer=transform_transaction_table)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get("/profiles")
+async def get_profiles(current_user: CurrentActiveUser, flow_id: Annotated[UUID | None, Query()] = None) -> list[dict]:
+    """Lists the run profiles kept by this worker, most recent first.
+
+    Superusers see the profiles of every user; other users only see their own.
+    """
+    user_id = None if current_user.is_superuser else str(current_user.id)
+    return [
+        {
+            "run_id": profiler.run_id,
+            "flow_id": profiler.flow_id,
+            "flow_name": profiler.flow_name,
+            "started_at": profiler.started_at.isoformat(),
+            "duration": profiler.duration,
+            "vertex_builds": len(profiler.builds),
+        }
+        for profiler in list_graph_profiles(str(flow_id) if flow_id else None, user_id=user_id)
+    ]
+
+
+def _get_user_profile(run_id: str, current_user: CurrentActiveUser) -> GraphProfiler:
+    profiler = get_graph_profile(run_id)
+    if profiler is None or (not current_user.is_superuser and profiler.user_id != str(current_user.id)):
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profiler
+
+
+@router.get("/profiles/{run_id}")
+async def get_profile(run_id: str, current_user: CurrentActiveUser) -> dict:
+    """Returns the per-vertex timings of a run."""
+    return _get_user_profile(run_id, current_user).report()
+
+
+@router.get("/profiles/{run_id}/trace")
+async def get_profile_trace(run_id: str, current_user: CurrentActiveUser) -> dict:
+    """Returns the profile of a run in the Chrome trace event format."""
+    return _get_user_profile(run_id, current_user).chrome_trace()
+
+
+@router.get("/executors", dependencies=[Depends(get_current_active_user)])
+async def get_executors() -> list[dict]:
+    """Returns the size and queue depth of the executor pools of this worker."""
+    return get_executor_pools_stats()
+
+
+@router.get("/cache", dependencies=[Depends(get_current_active_superuser)])
+async def get_cache_metrics() -> dict:
+    """Returns the hits, misses, writes, evictions, sizes and latencies of the cache of this worker per namespace."""
+    return {
+        "cache_type": get_settings_service().settings.cache_type,
+        "namespaces": get_cache_service().get_metrics(),
+    }
+
+
+@router.get("/vertex_results", dependencies=[Depends(get_current_active_superuser)])
+async def get_vertex_results_metrics() -> dict:
+    """Returns the hits, misses and stores of the memoized vertex results of this worker."""
+    return {
+        "enabled": get_settings_service().settings.vertex_result_cache_enabled,
+        **get_vertex_result_cache_stats(),
+    }
@@ -5,6 +5,7 @@ from langflow.io import Output
 
 class LCEmbeddingsModel(Component):
     trace_type = "embedding"
+    releasable = True
 
     outputs = [
         Output(display_name="Embeddings", name="embeddings", method="build_embeddings"),
@@ -2,11 +2,13 @@ import importlib
 import json
 import warnings
 from abc import abstractmethod
+from functools import partial
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.language_models.llms import LLM
+from langchain_core.language_models.llms import LLM, BaseLLM
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_core.output_parsers import BaseOutputParser
+from langchain_core.runnables import Runnable, RunnableBinding
 
 from langflow.base.constants import STREAM_INFO_TEXT
 from langflow.custom import Component
@@ -15,12 +17,14 @@ from langflow.inputs import MessageInput
 from langflow.inputs.inputs import BoolInput, InputTypes, MultilineInput
 from langflow.schema.message import Message
 from langflow.template.field.base import Output
+from langflow.utils.executors import run_in_executor_pool
 
 
 class LCModelComponent(Component):
     display_name: str = "Model Name"
     description: str = "Model Description"
     trace_type = "llm"
+    executor = "llm"
 
     # Optional output parser to pass to the runnable. Subclasses may allow the user to input an `output_parser`
     output_parser: BaseOutputParser | None = None
@@ -70,12 +74,13 @@ class LCModelComponent(Component):
                 msg = f"Method '{method_name}' must be defined."
                 raise ValueError(msg)
 
-    def text_response(self) -> Message:
+    async def text_response(self) -> Message:
         input_value = self.input_value
         stream = self.stream
         system_message = self.system_message
-        output = self.build_model()
-        result = self.get_chat_result(
+        # Building a client can read credentials or files, so it stays off the event loop
+        output = await run_in_executor_pool("llm", self.build_model)
+        result = await self.aget_chat_result(
             runnable=output, stream=stream, input_value=input_value, system_message=system_message
         )
         self.status = result
@@ -155,14 +160,35 @@ class LCModelComponent(Component):
             status_message = f"Response: {message.content}"  # type: ignore[assignment]
         return status_message
 
-    def get_chat_result(
+    @staticmethod
+    def supports_native_async(model: LanguageModel, *, stream: bool = False) -> bool:
+        """Checks if the model implements its own async generation or streaming.
+
+        The default async methods of LangChain models run the sync implementation in a thread pool,
+        so they are only worth using when the model overrides them.
+
+        Args:
+            model: The language model, optionally wrapped in bindings (e.g. from `bind_tools`).
+            stream: Whether to check the streaming implementation instead of the generation one.
+
+        Returns:
+            bool: True if the model has a native async implementation.
+        """
+        while isinstance(model, RunnableBinding):
+            model = model.bound
+        for base_class, generate_method in ((LLM, "_acall"), (BaseLLM, "_agenerate"), (BaseChatModel, "_agenerate")):
+            if isinstance(model, base_class):
+                method_name = "_astream" if stream else generate_method
+                return getattr(type(model), method_name) is not getattr(base_class, method_name)
+        return False
+
+    def _build_chat_runnable(
         self,
         *,
         runnable: LanguageModel,
-        stream: bool,
         input_value: str | Message,
         system_message: str | None = None,
-    ):
+    ) -> tuple[Runnable, list | dict]:
         messages: list[BaseMessage] = []
         if not input_value and not system_message:
             msg = "The message you want to send to the model is empty."
@@ -189,30 +215,94 @@ class LCModelComponent(Component):
         if system_message and not system_message_added:
             messages.insert(0, SystemMessage(content=system_message))
         inputs: list | dict = messages or {}
+        # TODO: Depreciated Feature to be removed in upcoming release
+        if hasattr(self, "output_parser") and self.output_parser is not None:
+            runnable |= self.output_parser
+
+        runnable = runnable.with_config(
+            {
+                "run_name": self.display_name,
+                "project_name": self.get_project_name(),
+                "callbacks": self.get_langchain_callbacks(),
+            }
+        )
+        return runnable, inputs
+
+    def _process_chat_message(self, message):
+        result = message.content if hasattr(message, "content") else message
+        if isinstance(message, AIMessage):
+            status_message = self.build_status_message(message)
+            self.status = status_message
+        elif isinstance(result, dict):
+            result = json.dumps(message, indent=4)
+            self.status = result
+        else:
+            self.status = result
+        return result
+
+    def get_chat_result(
+        self,
+        *,
+        runnable: LanguageModel,
+        stream: bool,
+        input_value: str | Message,
+        system_message: str | None = None,
+    ):
+        chat_runnable, inputs = self._build_chat_runnable(
+            runnable=runnable, input_value=input_value, system_message=system_message
+        )
         try:
-            # TODO: Depreciated Feature to be removed in upcoming release
-            if hasattr(self, "output_parser") and self.output_parser is not None:
-                runnable |= self.output_parser
-
-            runnable = runnable.with_config(
-                {
-                    "run_name": self.display_name,
-                    "project_name": self.get_project_name(),
-                    "callbacks": self.get_langchain_callbacks(),
-                }
+            if stream:
+                return chat_runnable.stream(inputs)
+            message = chat_runnable.invoke(inputs)
+            result = self._process_chat_message(message)
+        except Exception as e:
+            if message := self._get_exception_message(e):
+                raise ValueError(message) from e
+            raise
+
+        return result
+
+    async def aget_chat_result(
+        self,
+        *,
+        runnable: LanguageModel,
+        stream: bool,
+        input_value: str | Message,
+        system_message: str | None = None,
+    ):
+        """Async version of `get_chat_result`.
+
+        Uses `ainvoke` and `astream` when the model implements them natively, so the call does not
+        hold a worker thread; the messages and the chain are still prepared in the "llm" pool.
+        Otherwise the sync path runs in the pool, as before.
+
+        Returns:
+            The model response, or an async iterator of chunks when streaming with a native async model.
+        """
+        if not self.supports_native_async(runnable, stream=stream):
+            return await run_in_executor_pool(
+                "llm",
+                partial(
+                    self.get_chat_result,
+                    runnable=runnable,
+                    stream=stream,
+                    input_value=input_value,
+                    system_message=system_message,
+                ),
             )
+        # Prompt templates and callbacks can load files, so only the model call itself runs on the event loop
+        chat_runnable, inputs = await run_in_executor_pool(
+            "llm",
+            partial(
+                self._build_chat_runnable, runnable=runnable, input_value=input_value, system_message=system_message
+            ),
+        )
+        try:
             if stream:
-                return runnable.stream(inputs)
-            message = runnable.invoke(inputs)
-            result = message.content if hasattr(message, "content") else message
-            if isinstance(message, AIMessage):
-                status_message = self.build_status_message(message)
-                self.status = status_message
-            elif isinstance(result, dict):
-                result = json.dumps(message, indent=4)
-                self.status = result
-            else:
-                self.status = result
+                return chat_runnable.astream(inputs)
+            message = await chat_runnable.ainvoke(inputs)
+            result = self._process_chat_message(message)
         except Exception as e:
             if message := self._get_exception_message(e):
                 raise ValueError(message) from e
@@ -60,7 +60,9 @@ class FlowTool(BaseTool):
 
         run_outputs = run_until_complete(
             run_flow(
-                graph=self.graph,
+                # Saved flows get a fresh graph from the subflow cache on every call, so calls
+                # do not share vertex state and the tool arguments are applied as tweaks
+                graph=None if self.flow_id else self.graph,
                 tweaks={key: {"input_value": value} for key, value in tweaks.items()},
                 flow_id=self.flow_id,
                 user_id=self.user_id,
@@ -117,7 +119,7 @@ class FlowTool(BaseTool):
             user_id=self.user_id,
             run_id=run_id,
             session_id=self.session_id,
-            graph=self.graph,
+            graph=None if self.flow_id else self.graph,
         )
         if not run_outputs:
             return "No output"
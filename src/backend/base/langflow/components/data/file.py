@@ -15,6 +15,7 @@ class FileComponent(BaseFileComponent):
     description = "Load a file to be used in your project."
     icon = "file-text"
     name = "File"
+    releasable = True
 
     VALID_EXTENSIONS = TEXT_FILE_TYPES
 
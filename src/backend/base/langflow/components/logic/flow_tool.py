@@ -6,7 +6,6 @@ from typing_extensions import override
 from langflow.base.langchain_utilities.model import LCToolComponent
 from langflow.base.tools.flow_tool import FlowTool
 from langflow.field_typing import Tool
-from langflow.graph.graph.base import Graph
 from langflow.helpers.flow import get_flow_inputs
 from langflow.io import BoolInput, DropdownInput, Output, StrInput
 from langflow.schema import Data
@@ -84,10 +83,7 @@ class FlowToolComponent(LCToolComponent):
         if not flow_data:
             msg = "Flow not found."
             raise ValueError(msg)
-        graph = Graph.from_payload(
-            flow_data.data["data"],
-            user_id=str(self.user_id),
-        )
+        graph = await self.load_flow(str(flow_data.id))
         try:
             graph.set_run_id(self.graph.run_id)
         except Exception:  # noqa: BLE001
@@ -1,5 +1,8 @@
+import asyncio
+
 from langflow.custom import Component
-from langflow.io import DataInput, Output
+from langflow.graph.graph.loop_body import LoopBody
+from langflow.io import DataInput, DropdownInput, IntInput, Output
 from langflow.schema import Data
 
 
@@ -16,6 +19,45 @@ class LoopComponent(Component):
             display_name="Data",
             info="The initial list of Data objects to iterate over.",
         ),
+        DropdownInput(
+            name="mode",
+            display_name="Mode",
+            options=["Sequential", "Parallel"],
+            value="Sequential",
+            info=(
+                "Sequential sends one item at a time through the Item output. "
+                "Parallel runs a copy of the loop body for every item and sends the results through Done."
+            ),
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            value=4,
+            info="Parallel mode only. The maximum number of items running through the loop body at the same time.",
+            advanced=True,
+        ),
+        IntInput(
+            name="batch_size",
+            display_name="Batch Size",
+            value=0,
+            info=(
+                "Parallel mode only. The number of items scheduled together. "
+                "Each batch finishes before the next one starts. Use 0 to schedule all items at once."
+            ),
+            advanced=True,
+        ),
+        DropdownInput(
+            name="on_error",
+            display_name="On Error",
+            options=["Fail", "Skip", "Include Error"],
+            value="Fail",
+            info=(
+                "Parallel mode only. What to do when the loop body fails for an item: stop the loop, "
+                "leave the item out of the results, or add a Data object describing the error in its place."
+            ),
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -58,6 +100,10 @@ class LoopComponent(Component):
 
     def item_output(self) -> Data:
         """Output the next item in the list or stop if done."""
+        if self.mode == "Parallel":
+            # The loop body runs from done_output, once per item
+            self.stop("item")
+            return Data(text="")
         self.initialize_data()
         current_item = Data(text="")
 
@@ -77,8 +123,14 @@ class LoopComponent(Component):
         self.update_ctx({f"{self._id}_index": current_index + 1})
         return current_item
 
-    def done_output(self) -> Data:
-        """Trigger the done output when iteration is complete."""
+    async def done_output(self) -> list[Data]:
+        """Trigger the done output with the results of all the items when iteration is complete."""
+        if self.mode == "Parallel":
+            results = await self.parallel_map(self._validate_data(self.data))
+            self.stop("item")
+            self.start("done")
+            return results
+
         self.initialize_data()
 
         if self.evaluate_stop_loop():
@@ -87,7 +139,44 @@ class LoopComponent(Component):
 
             return self.ctx.get(f"{self._id}_aggregated", [])
         self.stop("done")
-        return Data(text="")
+        return []
+
+    async def parallel_map(self, data_list: list[Data]) -> list[Data]:
+        """Run the loop body for every item with bounded concurrency, keeping the results in input order."""
+        body = LoopBody(self.graph, self._id, output_name="item", input_name="item")
+        inputs = await body.resolve_inputs()
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+
+        async def run_item(index: int, item: Data):
+            async with semaphore:
+                try:
+                    return await body.run(item, inputs=inputs)
+                except Exception as e:
+                    if self.on_error == "Fail":
+                        msg = f"Error running the loop body for item {index}: {e}"
+                        raise ValueError(msg) from e
+                    self.log(f"Error running the loop body for item {index}: {e}")
+                    if self.on_error == "Skip":
+                        return None
+                    return Data(data={"text": str(e), "error": str(e), "index": index, "item": item.data})
+
+        batch_size = self.batch_size if self.batch_size > 0 else max(len(data_list), 1)
+        results: list = []
+        for start in range(0, len(data_list), batch_size):
+            tasks = [
+                asyncio.create_task(run_item(index, item))
+                for index, item in enumerate(data_list[start : start + batch_size], start=start)
+            ]
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+            results.extend(task.result() for task in tasks)
+        return [result for result in results if result is not None]
 
     def loop_variables(self):
         """Retrieve loop variables from context."""
@@ -12,6 +12,7 @@ class PromptComponent(Component):
     icon = "prompts"
     trace_type = "prompt"
     name = "Prompt"
+    memoize = True
 
     inputs = [
         PromptInput(name="template", display_name="Template"),
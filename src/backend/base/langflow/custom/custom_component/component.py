@@ -3,7 +3,9 @@ from __future__ import annotations
 import ast
 import asyncio
 import inspect
+import time
 from collections.abc import AsyncIterator, Iterator
+from contextvars import ContextVar
 from copy import deepcopy
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, get_type_hints
@@ -22,6 +24,7 @@ from langflow.base.tools.constants import (
     TOOLS_METADATA_INPUT_NAME,
 )
 from langflow.custom.tree_visitor import RequiredInputsVisitor
+from langflow.events.event_manager import TokenStream
 from langflow.exceptions.component import StreamingError
 from langflow.field_typing import Tool  # noqa: TC001 Needed by _add_toolkit_output
 from langflow.graph.state.model import create_state_model
@@ -33,10 +36,12 @@ from langflow.schema.data import Data
 from langflow.schema.message import ErrorMessage, Message
 from langflow.schema.properties import Source
 from langflow.schema.table import FieldParserType, TableOptions
+from langflow.services.deps import get_settings_service
 from langflow.services.tracing.schema import Log
 from langflow.template.field.base import UNDEFINED, Input, Output
 from langflow.template.frontend_node.custom_components import ComponentFrontendNode
 from langflow.utils.async_helpers import run_until_complete
+from langflow.utils.executors import ExecutorKind, run_in_executor_pool, run_in_process
 from langflow.utils.util import find_closest_match
 
 from .custom_component import CustomComponent
@@ -54,6 +59,9 @@ if TYPE_CHECKING:
 
 _ComponentToolkit = None
 
+# The component and output evaluated by the current task when outputs are evaluated concurrently
+_concurrent_output: ContextVar[tuple[int, str] | None] = ContextVar("concurrent_output", default=None)
+
 
 def _get_component_toolkit():
     global _ComponentToolkit  # noqa: PLW0603
@@ -95,6 +103,18 @@ class Component(CustomComponent):
     inputs: list[InputTypes] = []
     outputs: list[Output] = []
     code_class_base_inheritance: ClassVar[str] = "Component"
+    memoize: ClassVar[bool] = False
+    """Whether the results only depend on the code and inputs, so they can be reused across builds."""
+    memoize_ttl: ClassVar[int | None] = None
+    """Seconds a memoized result can be reused. Defaults to the `vertex_result_cache_ttl` setting."""
+    memoize_max_size: ClassVar[int | None] = None
+    """Maximum size in bytes of a memoized result. Defaults to the `vertex_result_cache_max_entry_size` setting."""
+    releasable: ClassVar[bool] = False
+    """Whether the output methods have no side effects, so results a graph snapshot or a memory budget dropped can be
+    built again by running them."""
+    executor: ClassVar[ExecutorKind] = "io"
+    """The thread pool that runs the synchronous output methods: "cpu", "io" or "llm". Async output methods can send
+    CPU-heavy pure functions to the process pool with `run_in_process`."""
 
     def __init__(self, **kwargs) -> None:
         # Initialize instance-specific attributes first
@@ -107,6 +127,7 @@ class Component(CustomComponent):
         self._ctx: dict = {}
         self._code: str | None = None
         self._logs: list[Log] = []
+        self._concurrent_logs: dict[str, list[Log]] = {}
 
         # Initialize component-specific collections
         self._inputs: dict[str, InputTypes] = {}
@@ -244,6 +265,12 @@ class Component(CustomComponent):
             for output in self._outputs_map.values():
                 output.value = UNDEFINED
 
+    def _release_results(self) -> None:
+        """Drops the results of the last build so they can be garbage collected."""
+        self._results = {}
+        self._artifacts = {}
+        self._reset_all_output_values()
+
     def _build_state_model(self):
         if self._state_model:
             return self._state_model
@@ -914,9 +941,17 @@ class Component(CustomComponent):
         self._pre_run_setup_if_needed()
         self._handle_tool_mode()
 
-        for output in self._get_outputs_to_process():
+        outputs = list(self._get_outputs_to_process())
+        concurrent_results = await self._get_concurrent_output_results(
+            [output for output in outputs if output.concurrent and not self._has_cached_value(output)]
+        )
+        for output in outputs:
             self._current_output = output.name
-            result = await self._get_output_result(output)
+            if output.name in concurrent_results:
+                result = concurrent_results[output.name]
+                self._logs = self._concurrent_logs.pop(output.name)
+            else:
+                result = await self._get_output_result(output)
             results[output.name] = result
             artifacts[output.name] = self._build_artifact(result)
             self._log_output(output)
@@ -924,6 +959,31 @@ class Component(CustomComponent):
         self._finalize_results(results, artifacts)
         return results, artifacts
 
+    async def _run_in_thread(self, method):
+        """Runs a sync output method on the component's executor pool.
+
+        When profiling, it also records how long the method waited for a free thread.
+        """
+        profiler = getattr(self._vertex.graph, "profiler", None) if self._vertex is not None else None
+        if profiler is None:
+            return await run_in_executor_pool(self.executor, method)
+        vertex_id = self._vertex.id
+        submitted_at = time.perf_counter()
+
+        def run():
+            profiler.add_span(vertex_id, "thread_queue_wait", submitted_at, time.perf_counter())
+            return method()
+
+        return await run_in_executor_pool(self.executor, run)
+
+    async def run_in_process(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Runs a CPU-heavy pure function in the process pool, for use in async output methods.
+
+        The function and its arguments must be picklable, like a module-level function called with plain data.
+        When the process pool is disabled or they cannot be pickled, the function runs on the "cpu" thread pool.
+        """
+        return await run_in_process(func, *args)
+
     def _pre_run_setup_if_needed(self):
         if hasattr(self, "_pre_run_setup"):
             self._pre_run_setup()
@@ -942,8 +1002,43 @@ class Component(CustomComponent):
     def _get_outputs_to_process(self):
         return (output for output in self._outputs_map.values() if self._should_process_output(output))
 
+    async def _get_concurrent_output_results(self, outputs: list[Output]) -> dict[str, Any]:
+        """Evaluates the outputs at the same time and returns their results by name.
+
+        Each output keeps its own logs. Fewer than two outputs are left to the sequential loop.
+        """
+        if len(outputs) < 2:  # noqa: PLR2004
+            return {}
+
+        async def evaluate(output: Output):
+            _concurrent_output.set((id(self), output.name))
+            self._concurrent_logs[output.name] = []
+            return await self._get_output_result(output)
+
+        tasks = [asyncio.create_task(evaluate(output)) for output in outputs]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            self._concurrent_logs.clear()
+            raise
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return {output.name: result for output, result in zip(outputs, results, strict=True)}
+
+    def _get_current_output(self) -> str:
+        current = _concurrent_output.get()
+        if current is not None and current[0] == id(self):
+            return current[1]
+        return self._current_output
+
+    @staticmethod
+    def _has_cached_value(output: Output) -> bool:
+        return output.cache and output.value != UNDEFINED
+
     async def _get_output_result(self, output):
-        if output.cache and output.value != UNDEFINED:
+        if self._has_cached_value(output):
             return output.value
 
         if output.method is None:
@@ -952,7 +1047,7 @@ class Component(CustomComponent):
 
         method = getattr(self, output.method)
         try:
-            result = await method() if inspect.iscoroutinefunction(method) else await asyncio.to_thread(method)
+            result = await method() if inspect.iscoroutinefunction(method) else await self._run_in_thread(method)
         except TypeError as e:
             msg = f'Error running method "{output.method}": {e}'
             raise TypeError(msg) from e
@@ -1068,15 +1163,17 @@ class Component(CustomComponent):
             message (LoggableType | list[LoggableType]): The message to log.
             name (str, optional): The name of the log. Defaults to None.
         """
+        current_output = self._get_current_output()
+        logs = self._concurrent_logs.get(current_output, self._logs)
         if name is None:
-            name = f"Log {len(self._logs) + 1}"
+            name = f"Log {len(logs) + 1}"
         log = Log(message=message, type=get_artifact_type(message), name=name)
-        self._logs.append(log)
+        logs.append(log)
         if self._tracing_service and self._vertex:
             self._tracing_service.add_log(trace_name=self.trace_name, log=log)
-        if self._event_manager is not None and self._current_output:
+        if self._event_manager is not None and current_output:
             data = log.model_dump()
-            data["output"] = self._current_output
+            data["output"] = current_output
             data["component_id"] = self._id
             self._event_manager.on_log(data=data)
 
@@ -1189,6 +1286,15 @@ class Component(CustomComponent):
         message_table = message_tables[0]
         return await Message.create(**message_table.model_dump())
 
+    def _create_token_stream(self, message_id: str) -> TokenStream:
+        settings = get_settings_service().settings
+        return TokenStream(
+            self._event_manager,
+            message_id,
+            flush_interval=settings.token_flush_interval,
+            flush_size=settings.token_flush_size,
+        )
+
     async def _stream_message(self, iterator: AsyncIterator | Iterator, message: Message) -> str:
         if not isinstance(iterator, AsyncIterator | Iterator):
             msg = "The message must be an iterator or an async iterator."
@@ -1196,47 +1302,44 @@ class Component(CustomComponent):
 
         if isinstance(iterator, AsyncIterator):
             return await self._handle_async_iterator(iterator, message.id, message)
+        token_stream = self._create_token_stream(message.id)
         try:
-            complete_message = ""
             first_chunk = True
             for chunk in iterator:
-                complete_message = await self._process_chunk(
-                    chunk.content, complete_message, message.id, message, first_chunk=first_chunk
-                )
+                await self._process_chunk(chunk.content, token_stream, message, first_chunk=first_chunk)
                 first_chunk = False
+            token_stream.flush()
         except Exception as e:
+            token_stream.cancel()
             raise StreamingError(cause=e, source=message.properties.source) from e
         else:
-            return complete_message
+            return token_stream.text
 
     async def _handle_async_iterator(self, iterator: AsyncIterator, message_id: str, message: Message) -> str:
-        complete_message = ""
+        token_stream = self._create_token_stream(message_id)
         first_chunk = True
-        async for chunk in iterator:
-            complete_message = await self._process_chunk(
-                chunk.content, complete_message, message_id, message, first_chunk=first_chunk
-            )
-            first_chunk = False
-        return complete_message
+        try:
+            async for chunk in iterator:
+                await self._process_chunk(chunk.content, token_stream, message, first_chunk=first_chunk)
+                first_chunk = False
+        except BaseException:
+            token_stream.cancel()
+            raise
+        token_stream.flush()
+        return token_stream.text
 
     async def _process_chunk(
-        self, chunk: str, complete_message: str, message_id: str, message: Message, *, first_chunk: bool = False
-    ) -> str:
-        complete_message += chunk
-        if self._event_manager:
-            if first_chunk:
-                # Send the initial message only on the first chunk
-                msg_copy = message.model_copy()
-                msg_copy.text = complete_message
-                await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
-                self._event_manager.on_token,
-                data={
-                    "chunk": chunk,
-                    "id": str(message_id),
-                },
-            )
-        return complete_message
+        self, chunk: str, token_stream: TokenStream, message: Message, *, first_chunk: bool = False
+    ) -> None:
+        if self._event_manager and first_chunk:
+            # Send the initial message only on the first chunk
+            msg_copy = message.model_copy()
+            msg_copy.text = chunk
+            await self._send_message_event(msg_copy, id_=token_stream.message_id)
+        token_stream.add(chunk)
+        if first_chunk:
+            # Don't make the client wait for the window to see the first token
+            token_stream.flush()
 
     async def send_error(
         self,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import json
 import time
@@ -14,8 +15,6 @@ from typing_extensions import Protocol
 from langflow.schema.playground_events import create_event_by_type
 
 if TYPE_CHECKING:
-    import asyncio
-
     from langflow.schema.log import LoggableType
 
 
@@ -86,6 +85,80 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
+class TokenStream:
+    """Coalesces streamed chunks into fewer token events.
+
+    Chunks are buffered and sent as a single `on_token` event once `flush_interval` seconds have
+    passed since the last event or the buffer reaches `flush_size` characters. When the stream
+    runs on an event loop, a timer also sends the buffer at the end of the window, so tokens are
+    not held back while the model pauses. The complete text is built once from the list of
+    chunks instead of by repeated string concatenation.
+    """
+
+    def __init__(
+        self,
+        event_manager: EventManager | None,
+        message_id: str,
+        *,
+        flush_interval: float = 0.03,
+        flush_size: int = 256,
+    ) -> None:
+        self.event_manager = event_manager
+        self.message_id = message_id
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._chunks: list[str] = []
+        self._pending: list[str] = []
+        self._pending_size = 0
+        self._last_flush = time.monotonic()
+        self._flush_timer: asyncio.TimerHandle | None = None
+
+    @property
+    def text(self) -> str:
+        """The text of all the chunks added so far."""
+        return "".join(self._chunks)
+
+    def add(self, chunk: str) -> None:
+        """Adds a chunk, sending the buffered chunks if the time window or size threshold was reached."""
+        self._chunks.append(chunk)
+        if self.event_manager is None:
+            return
+        self._pending.append(chunk)
+        self._pending_size += len(chunk)
+        elapsed = time.monotonic() - self._last_flush
+        if self._pending_size >= self.flush_size or elapsed >= self.flush_interval:
+            self.flush()
+        elif self._flush_timer is None:
+            self._schedule_flush(self.flush_interval - elapsed)
+
+    def _schedule_flush(self, delay: float) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Chunks added outside of an event loop are sent by the next chunk or the final flush
+            return
+        self._flush_timer = loop.call_later(delay, self.flush)
+
+    def flush(self) -> None:
+        """Sends the buffered chunks as a single token event."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._pending and self.event_manager is not None:
+            self.event_manager.on_token(data={"chunk": "".join(self._pending), "id": str(self.message_id)})
+        self._pending = []
+        self._pending_size = 0
+        self._last_flush = time.monotonic()
+
+    def cancel(self) -> None:
+        """Drops the buffered chunks and the pending flush, so a failed stream sends no more tokens."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        self._pending = []
+        self._pending_size = 0
+
+
 def create_default_event_manager(queue):
     manager = EventManager(queue)
     manager.register_event("on_token", "token")
@@ -242,6 +242,8 @@ class CycleEdge(Edge):
         if self.is_fulfilled:
             return
 
+        if source.needs_rehydration:
+            await source.rehydrate()
         if not source.built:
             # The system should be read-only, so we should not be building vertices
             # that are not already built.
@@ -6,6 +6,7 @@ import copy
 import json
 import queue
 import threading
+import time
 import uuid
 from collections import defaultdict, deque
 from datetime import datetime, timezone
@@ -15,17 +16,24 @@ from typing import TYPE_CHECKING, Any, cast
 
 from loguru import logger
 
+from langflow.custom.eval import eval_custom_component_code
 from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.edge.base import CycleEdge, Edge
 from langflow.graph.graph.constants import Finish, lazy_load_vertex_dict
+from langflow.graph.graph.memory import built_object_ledger, enforce_memory_budgets, estimate_vertex_size
+from langflow.graph.graph.profiler import GraphProfiler, profile_span, store_graph_profile
 from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
-from langflow.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
+from langflow.graph.graph.scheduling import PrioritySemaphore, build_time_history, get_critical_path_priorities
+from langflow.graph.graph.schema import ExecutionMode, GraphData, GraphDump, StartConfigDict, VertexBuildResult
 from langflow.graph.graph.state_manager import GraphStateManager
 from langflow.graph.graph.state_model import create_state_model_from_graph
 from langflow.graph.graph.utils import (
-    find_all_cycle_edges,
-    find_cycle_vertices,
+    CycleAnalysis,
+    ReachabilityIndex,
+    analyze_cycles,
+    diff_graph_data,
     find_start_component_id,
+    get_edge_key,
     get_sorted_vertices,
     process_flow,
     should_continue,
@@ -38,17 +46,18 @@ from langflow.logging.logger import LogConfig, configure
 from langflow.schema.dotdict import dotdict
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType
 from langflow.services.cache.utils import CacheMiss
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import get_chat_service, get_settings_service, get_tracing_service
 from langflow.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable
+    from collections.abc import Callable, Generator, Iterable
 
     from langflow.api.v1.schemas import InputValueRequest
     from langflow.custom.custom_component.component import Component
     from langflow.events.event_manager import EventManager
     from langflow.graph.edge.schema import EdgeData
     from langflow.graph.schema import ResultData
+    from langflow.graph.vertex.param_plan import ParamPlan
     from langflow.schema import Data
     from langflow.services.chat.schema import GetCache, SetCache
     from langflow.services.tracing.service import TracingService
@@ -105,8 +114,13 @@ class Graph:
         self.activated_vertices: list[str] = []
         self.vertices_layers: list[list[str]] = []
         self.vertices_to_run: set[str] = set()
+        # Built vertices whose results the next build keeps, set when an edit did not reach them
+        self.reusable_vertices: set[str] = set()
         self.stop_vertex: str | None = None
         self.inactive_vertices: set = set()
+        self._edges_by_vertex: dict[str, list[CycleEdge]] = {}
+        self._edges_by_source: dict[str, list[CycleEdge]] = {}
+        self._edges_by_target: dict[str, list[CycleEdge]] = {}
         self.edges: list[CycleEdge] = []
         self.vertices: list[Vertex] = []
         self.run_manager = RunnableVerticesManager()
@@ -124,12 +138,16 @@ class Graph:
         self._first_layer: list[str] = []
         self._lock = asyncio.Lock()
         self.raw_graph_data: GraphData = {"nodes": [], "edges": []}
-        self._is_cyclic: bool | None = None
-        self._cycles: list[tuple[str, str]] | None = None
-        self._cycle_vertices: set[str] | None = None
+        self._cycle_analysis: CycleAnalysis | None = None
+        self._reachability: ReachabilityIndex | None = None
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
+        self.execution_mode: ExecutionMode | None = None
+        self.max_concurrency: int | None = None
+        self._component_classes: dict[str, type] = {}
+        self._param_plans: dict[str, ParamPlan] | None = None
+        self.profiler: GraphProfiler | None = None
 
         if context and not isinstance(context, dict):
             msg = "Context must be a dictionary"
@@ -162,6 +180,36 @@ class Graph:
             value = dotdict(value)
         self._context = value
 
+    @property
+    def edges(self) -> list[CycleEdge]:
+        return self._edge_list
+
+    @edges.setter
+    def edges(self, edges: list[CycleEdge]) -> None:
+        self._edge_list = edges
+        self._build_edge_indexes()
+
+    def _build_edge_indexes(self) -> None:
+        """Rebuilds the incoming and outgoing edge indexes from the edge list."""
+        self._edges_by_vertex = {}
+        self._edges_by_source = {}
+        self._edges_by_target = {}
+        for edge in self._edge_list:
+            self._index_edge(edge)
+
+    def _index_edge(self, edge: CycleEdge) -> None:
+        """Adds an edge to the edge indexes."""
+        self._edges_by_vertex.setdefault(edge.source_id, []).append(edge)
+        if edge.target_id != edge.source_id:
+            self._edges_by_vertex.setdefault(edge.target_id, []).append(edge)
+        self._edges_by_source.setdefault(edge.source_id, []).append(edge)
+        self._edges_by_target.setdefault(edge.target_id, []).append(edge)
+
+    def _append_edge(self, edge: CycleEdge) -> None:
+        """Appends an edge to the edge list, keeping the indexes in sync."""
+        self._edge_list.append(edge)
+        self._index_edge(edge)
+
     @property
     def session_id(self):
         return self._session_id
@@ -236,7 +284,15 @@ class Graph:
         graph_dict["endpoint_name"] = str(endpoint_name)
         return graph_dict
 
-    def add_nodes_and_edges(self, nodes: list[NodeData], edges: list[EdgeData]) -> None:
+    def add_nodes_and_edges(self, nodes: list[NodeData], edges: list[EdgeData], *, process: bool = True) -> None:
+        """Adds the nodes and edges of a payload and builds the graph.
+
+        Args:
+            nodes: The nodes of the payload.
+            edges: The edges of the payload.
+            process: Whether to copy the payload and ungroup its group nodes. Only skip it
+                for payloads that were already processed and are not shared with other graphs.
+        """
         self._vertices = nodes
         self._edges = edges
         self.raw_graph_data = {"nodes": nodes, "edges": edges}
@@ -246,7 +302,7 @@ class Graph:
                 self.top_level_vertices.append(vertex_id)
             if vertex_id in self.cycle_vertices:
                 self.run_manager.add_to_cycle_vertices(vertex_id)
-        self._graph_data = process_flow(self.raw_graph_data)
+        self._graph_data = process_flow(self.raw_graph_data) if process else self.raw_graph_data
 
         self._vertices = self._graph_data["nodes"]
         self._edges = self._graph_data["edges"]
@@ -473,6 +529,7 @@ class Graph:
         self.successor_map[source_id].append(target_id)
         self.in_degree_map[target_id] += 1
         self.parent_child_map[source_id].append(target_id)
+        self._reachability = None
 
     def add_node(self, node: NodeData) -> None:
         self._vertices.append(node)
@@ -616,9 +673,7 @@ class Graph:
         Returns:
             bool: True if the graph has any cycles, False otherwise.
         """
-        if self._is_cyclic is None:
-            self._is_cyclic = bool(self.cycle_vertices)
-        return self._is_cyclic
+        return self.cycle_analysis.is_cyclic
 
     @property
     def run_id(self):
@@ -906,6 +961,7 @@ class Graph:
 
         self.in_degree_map = self.build_in_degree(edges)
         self.parent_child_map = self.build_parent_child_map(vertices)
+        self._reachability = None
 
     def reset_inactivated_vertices(self) -> None:
         """Resets the inactivated vertices in the graph."""
@@ -957,8 +1013,8 @@ class Graph:
 
     def get_edge(self, source_id: str, target_id: str) -> CycleEdge | None:
         """Returns the edge between two vertices."""
-        for edge in self.edges:
-            if edge.source_id == source_id and edge.target_id == target_id:
+        for edge in self._edges_by_source.get(source_id, []):
+            if edge.target_id == target_id:
                 return edge
         return None
 
@@ -997,6 +1053,7 @@ class Graph:
             "activated_vertices": self.activated_vertices,
             "vertices_layers": self.vertices_layers,
             "vertices_to_run": self.vertices_to_run,
+            "reusable_vertices": self.reusable_vertices,
             "stop_vertex": self.stop_vertex,
             "_run_queue": self._run_queue,
             "_first_layer": self._first_layer,
@@ -1006,6 +1063,8 @@ class Graph:
             "_is_output_vertices": self._is_output_vertices,
             "has_session_id_vertices": self.has_session_id_vertices,
             "_sorted_vertices_layers": self._sorted_vertices_layers,
+            "execution_mode": self.execution_mode,
+            "max_concurrency": self.max_concurrency,
         }
 
     def __deepcopy__(self, memo):
@@ -1047,8 +1106,21 @@ class Graph:
             state["run_manager"] = run_manager
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
+        edges = state.pop("edges")
         self.__dict__.update(state)
+        self.edges = edges
+        self._component_classes = {}
+        self._param_plans = None
+        self._cycle_analysis = None
+        self._reachability = None
+        self.profiler = None
+        # The start and end components are not pickled, and the cycle analysis below reads them
+        self.__dict__.setdefault("_start", None)
+        self.__dict__.setdefault("_end", None)
+        self.__dict__.setdefault("reusable_vertices", set())
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
+        # The manager does not pickle the cycle vertices, which decide whether loop vertices can run
+        self.run_manager.cycle_vertices = set(self.cycle_vertices)
         self.state_manager = GraphStateManager()
         self.tracing_service = get_tracing_service()
         self.set_run_id(self._run_id)
@@ -1079,6 +1151,7 @@ class Graph:
             vertices = payload["nodes"]
             edges = payload["edges"]
             graph = cls(flow_id=flow_id, flow_name=flow_name, user_id=user_id)
+            graph.execution_mode = payload.get("execution_mode")
             graph.add_nodes_and_edges(vertices, edges)
         except KeyError as exc:
             logger.exception(exc)
@@ -1126,52 +1199,130 @@ class Graph:
         return all(edge in other_vertex.edges for edge in vertex.edges)
 
     def update(self, other: Graph) -> Graph:
-        # Existing vertices in self graph
-        existing_vertex_ids = {vertex.id for vertex in self.vertices}
-        # Vertex IDs in the other graph
-        other_vertex_ids = set(other.vertex_map.keys())
-
-        # Find vertices that are in other but not in self (new vertices)
-        new_vertex_ids = other_vertex_ids - existing_vertex_ids
-
-        # Find vertices that are in self but not in other (removed vertices)
-        removed_vertex_ids = existing_vertex_ids - other_vertex_ids
-
-        # Remove vertices that are not in the other graph
-        for vertex_id in removed_vertex_ids:
-            with contextlib.suppress(ValueError):
-                self.remove_vertex(vertex_id)
-
-        # The order here matters because adding the vertex is required
-        # if any of them have edges that point to any of the new vertices
-        # By adding them first, them adding the edges we ensure that the
-        # edges have valid vertices to point to
-
-        # Add new vertices
-        for vertex_id in new_vertex_ids:
-            new_vertex = other.get_vertex(vertex_id)
-            self._add_vertex(new_vertex)
-
-        # Now update the edges
-        for vertex_id in new_vertex_ids:
-            new_vertex = other.get_vertex(vertex_id)
-            self._update_edges(new_vertex)
-            # Graph is set at the end because the edges come from the graph
-            # and the other graph is where the new edges and vertices come from
-            new_vertex.graph = self
+        """Updates this graph to the structure of another graph of the same flow.
+
+        Only the vertices and edges that differ are replaced, and only the vertices downstream of
+        a change lose their built results. See `update_from_payload`.
+        """
+        self._apply_diff(other._vertices, other._edges, other.get_vertex, other.top_level_vertices)
+        return self
+
+    def update_from_payload(self, payload: dict) -> set[str]:
+        """Updates the graph to a new version of its payload.
+
+        The nodes and edges of the payload are compared with the current ones. Vertices that were
+        added or whose data changed are created again, removed vertices and edges are dropped and
+        the other vertices and edges are kept as they are. Built results are only reset for the
+        vertices downstream of a change, except for frozen vertices. The layers are sorted again
+        the next time they are needed.
+
+        Args:
+            payload: The new payload of the flow.
+
+        Returns:
+            set[str]: The IDs of the vertices that have to be built again.
+        """
+        if "data" in payload:
+            payload = payload["data"]
+        graph_data = process_flow(payload)
+        nodes_by_id = {node["id"]: node for node in graph_data["nodes"]}
+        top_level_vertices = [node["id"] for node in payload["nodes"] if node.get("id")]
+        return self._apply_diff(
+            graph_data["nodes"],
+            graph_data["edges"],
+            lambda vertex_id: self._create_vertex(nodes_by_id[vertex_id]),
+            top_level_vertices,
+        )
+
+    def _apply_diff(
+        self,
+        nodes: list[NodeData],
+        edges: list[EdgeData],
+        get_new_vertex: Callable[[str], Vertex],
+        top_level_vertices: list[str],
+    ) -> set[str]:
+        """Replaces the vertices and edges that differ from `nodes` and `edges`.
+
+        Returns:
+            set[str]: The IDs of the vertices whose built results were reset or that are new.
+        """
+        diff = diff_graph_data(self._vertices, self._edges, nodes, edges)
+        self._vertices = nodes
+        self._edges = edges
+        self.raw_graph_data = {"nodes": nodes, "edges": edges}
+        if diff.is_empty:
+            return set()
+        self._detach_param_plans()
+
+        removed_vertices = set(diff.removed_vertices)
+        for vertex_id in removed_vertices:
+            if (vertex := self.vertex_map.pop(vertex_id, None)) is not None:
+                self.vertices.remove(vertex)
+            self.run_manager.remove_vertex_from_runnables(vertex_id)
+            self.run_manager.remove_from_predecessors(vertex_id)
 
-        # Update existing vertices that have changed
-        for vertex_id in existing_vertex_ids.intersection(other_vertex_ids):
-            self_vertex = self.get_vertex(vertex_id)
-            other_vertex = other.get_vertex(vertex_id)
-            # If the vertices are not identical, update the vertex
-            if not self.vertex_data_is_identical(self_vertex, other_vertex):
-                self.update_vertex_from_another(self_vertex, other_vertex)
+        node_types = {node["id"]: node.get("type") for node in nodes}
+        new_vertices: set[str] = set()
+        for vertex_id in [*diff.changed_vertices, *diff.added_vertices]:
+            if node_types[vertex_id] == NodeTypeEnum.NoteNode:
+                continue
+            new_vertex = get_new_vertex(vertex_id)
+            new_vertex.graph = self
+            old_vertex = self.vertex_map.get(vertex_id)
+            if old_vertex is None:
+                self.vertices.append(new_vertex)
+            else:
+                self.vertices[self.vertices.index(old_vertex)] = new_vertex
+                if new_vertex.frozen and old_vertex.built:
+                    # Frozen vertices keep their results even when their data changes
+                    for key in ("built", "built_object", "built_result", "result", "results", "artifacts"):
+                        setattr(new_vertex, key, getattr(old_vertex, key))
+            self.vertex_map[vertex_id] = new_vertex
+            new_vertices.add(vertex_id)
+
+        self._cycle_analysis = None
+        self._reachability = None
+        cycle_vertices = self.cycle_vertices
+        removed_edges = set(diff.removed_edges)
+        edge_list = []
+        for edge in self.edges:
+            if edge.source_id in removed_vertices or edge.target_id in removed_vertices:
+                continue
+            if get_edge_key(edge._data) in removed_edges:
+                continue
+            if (
+                edge.source_id not in new_vertices
+                and edge.target_id not in new_vertices
+                and edge.is_cycle == (edge.source_id in cycle_vertices or edge.target_id in cycle_vertices)
+            ):
+                edge_list.append(edge)
+        kept_edges = {get_edge_key(edge._data) for edge in edge_list}
+        edge_list.extend(self.build_edge(edge) for edge in edges if get_edge_key(edge) not in kept_edges)
+        self.edges = edge_list
 
+        self.top_level_vertices = top_level_vertices
         self.build_graph_maps()
+        self.run_manager.cycle_vertices = set(cycle_vertices)
+        self._is_input_vertices = []
+        self._is_output_vertices = []
+        self.has_session_id_vertices = []
+        self._is_state_vertices = []
         self.define_vertices_lists()
+        self._sorted_vertices_layers = []
+
+        invalidated = self.reachability.downstream(list(diff.touched_vertices))
+        for vertex_id in invalidated:
+            vertex = self.get_vertex(vertex_id)
+            vertex.set_top_level(self.top_level_vertices)
+            if vertex_id in new_vertices:
+                vertex.build_params()
+                vertex.instantiate_component(self.user_id)
+            elif not vertex.frozen:
+                vertex.invalidate()
+        self._set_cache_to_vertices_in_cycle()
+        self.assert_streaming_sequence()
         self.increment_update_count()
-        return self
+        return invalidated
 
     def update_vertex_from_another(self, vertex: Vertex, other_vertex: Vertex) -> None:
         """Updates a vertex from another vertex.
@@ -1184,6 +1335,7 @@ class Graph:
         vertex.parse_data()
         # Now we update the edges of the vertex
         self.update_edges_from_vertex(other_vertex)
+        self._detach_param_plans()
         vertex.params = {}
         vertex.build_params()
         vertex.graph = self
@@ -1212,6 +1364,7 @@ class Graph:
 
     def add_vertex(self, vertex: Vertex) -> None:
         """Adds a new vertex to the graph."""
+        self._detach_param_plans()
         self._add_vertex(vertex)
         self._update_edges(vertex)
 
@@ -1219,8 +1372,12 @@ class Graph:
         """Updates the edges of a vertex."""
         # Vertex has edges, so we need to update the edges
         for edge in vertex.edges:
-            if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
-                self.edges.append(edge)
+            if (
+                edge.source_id in self.vertex_map
+                and edge.target_id in self.vertex_map
+                and edge not in self._edges_by_source.get(edge.source_id, [])
+            ):
+                self._append_edge(edge)
 
     def _build_graph(self) -> None:
         """Builds the graph from the vertices and edges."""
@@ -1245,12 +1402,37 @@ class Graph:
 
     def _set_cache_to_vertices_in_cycle(self) -> None:
         """Sets the cache to the vertices in cycle."""
-        edges = self._get_edges_as_list_of_tuples()
-        cycle_vertices = set(find_cycle_vertices(edges))
         for vertex in self.vertices:
-            if vertex.id in cycle_vertices:
+            if vertex.id in self.cycle_vertices:
                 vertex.apply_on_outputs(lambda output_object: setattr(output_object, "cache", False))
 
+    def get_component_class(self, code: str) -> type:
+        """Returns the component class defined by the code, evaluating each code only once."""
+        if (component_class := self._component_classes.get(code)) is None:
+            component_class = eval_custom_component_code(code)
+            self._component_classes[code] = component_class
+        return component_class
+
+    def _detach_param_plans(self) -> None:
+        """Stops using the shared param plans once the vertices or edges of the graph change.
+
+        The plans may be shared with other graphs of the same flow version, which keep the old structure.
+        """
+        self._param_plans = None
+
+    def get_param_plan(self, vertex: Vertex) -> ParamPlan:
+        """Returns the param plan of a vertex.
+
+        Graphs created from a compiled template share the plans of that template, so each vertex
+        is only resolved once per flow version. Other graphs resolve the plan on every call.
+        """
+        if self._param_plans is None:
+            return vertex.build_param_plan()
+        if (plan := self._param_plans.get(vertex.id)) is None:
+            plan = vertex.build_param_plan()
+            self._param_plans[vertex.id] = plan
+        return plan
+
     def _instantiate_components_in_vertices(self) -> None:
         """Instantiates the components in the vertices."""
         for vertex in self.vertices:
@@ -1261,6 +1443,7 @@ class Graph:
         vertex = self.get_vertex(vertex_id)
         if vertex is None:
             return
+        self._detach_param_plans()
         self.vertices.remove(vertex)
         self.vertex_map.pop(vertex_id)
         self.edges = [edge for edge in self.edges if vertex_id not in {edge.source_id, edge.target_id}]
@@ -1394,6 +1577,9 @@ class Graph:
     ) -> VertexBuildResult:
         """Builds a vertex in the graph.
 
+        Vertices in `reusable_vertices` keep the results of their previous build when it ran with the
+        same user, inputs and files.
+
         Args:
             vertex_id (str): The ID of the vertex to build.
             get_cache (GetCache): A coroutine to get the cache.
@@ -1413,10 +1599,22 @@ class Graph:
         """
         vertex = self.get_vertex(vertex_id)
         self.run_manager.add_to_vertices_being_run(vertex_id)
+        if self.profiler is not None:
+            self.profiler.start_build(vertex)
+        failed = False
         try:
             params = ""
             should_build = False
-            if not vertex.frozen:
+            build_context = {
+                "user_id": user_id,
+                "inputs": inputs_dict,
+                "files": files,
+                "fallback_to_env_vars": fallback_to_env_vars,
+            }
+            if self._can_reuse_build(vertex, build_context):
+                # An edit of the flow did not change the vertex or the vertices upstream of it
+                logger.debug(f"Reusing the results of {vertex_id} from the previous build")
+            elif not vertex.frozen:
                 should_build = True
             else:
                 # Check the cache for the vertex
@@ -1448,6 +1646,7 @@ class Graph:
                         should_build = True
 
             if should_build:
+                build_started_at = time.perf_counter()
                 await vertex.build(
                     user_id=user_id,
                     inputs=inputs_dict,
@@ -1455,6 +1654,9 @@ class Graph:
                     files=files,
                     event_manager=event_manager,
                 )
+                build_time_history.record(
+                    self.flow_id, vertex.id, vertex.vertex_type, time.perf_counter() - build_started_at
+                )
                 if set_cache is not None:
                     vertex_dict = {
                         "built": vertex.built,
@@ -1465,12 +1667,17 @@ class Graph:
                         "full_data": vertex.full_data,
                     }
 
-                    await set_cache(key=vertex.id, data=vertex_dict)
+                    with profile_span(vertex, "result_logging"):
+                        await set_cache(key=vertex.id, data=vertex_dict)
 
         except Exception as exc:
+            failed = True
             if not isinstance(exc, ComponentBuildError):
                 logger.exception("Error building Component")
             raise
+        finally:
+            if self.profiler is not None:
+                self.profiler.end_build(vertex, error=failed)
 
         if vertex.result is not None:
             params = f"{vertex.built_object_repr()}{params}"
@@ -1481,10 +1688,30 @@ class Graph:
             msg = f"Error building Component: no result found for vertex {vertex_id}"
             raise ValueError(msg)
 
+        self.account_built_objects(vertex)
         return VertexBuildResult(
             result_dict=result_dict, params=params, valid=valid, artifacts=artifacts, vertex=vertex
         )
 
+    def _can_reuse_build(self, vertex: Vertex, build_context: dict[str, Any]) -> bool:
+        """Returns whether a build of the vertex can keep the results of its previous build.
+
+        Only vertices in `reusable_vertices` that were built with the same user, inputs, files and
+        settings keep them, once. Inputs, outputs and state vertices send their messages again, so
+        they are always built.
+        """
+        if vertex.id not in self.reusable_vertices:
+            return False
+        self.reusable_vertices.discard(vertex.id)
+        if vertex.is_input or vertex.is_output or vertex.is_interface_component or vertex.is_state:
+            return False
+        return (
+            vertex.built
+            and not vertex.needs_rehydration
+            and vertex.result is not None
+            and vertex.build_context == build_context
+        )
+
     def get_vertex_edges(
         self,
         vertex_id: str,
@@ -1494,42 +1721,138 @@ class Graph:
     ) -> list[CycleEdge]:
         """Returns a list of edges for a given vertex."""
         # The idea here is to return the edges that have the vertex_id as source or target
-        # or both
-        return [
-            edge
-            for edge in self.edges
-            if (edge.source_id == vertex_id and is_source is not False)
-            or (edge.target_id == vertex_id and is_target is not False)
-        ]
+        # or both, in the order they appear in the graph
+        if is_source is False and is_target is False:
+            return []
+        if is_source is False:
+            return list(self._edges_by_target.get(vertex_id, []))
+        if is_target is False:
+            return list(self._edges_by_source.get(vertex_id, []))
+        return list(self._edges_by_vertex.get(vertex_id, []))
 
     def get_vertices_with_target(self, vertex_id: str) -> list[Vertex]:
         """Returns the vertices connected to a vertex."""
         vertices: list[Vertex] = []
-        for edge in self.edges:
-            if edge.target_id == vertex_id:
-                vertex = self.get_vertex(edge.source_id)
-                if vertex is None:
-                    continue
-                vertices.append(vertex)
+        for edge in self._edges_by_target.get(vertex_id, []):
+            vertex = self.get_vertex(edge.source_id)
+            if vertex is None:
+                continue
+            vertices.append(vertex)
         return vertices
 
+    def _get_execution_settings(
+        self, execution_mode: ExecutionMode | None, max_concurrency: int | None
+    ) -> tuple[ExecutionMode, int | None]:
+        """Resolves the execution mode and concurrency limit for a run.
+
+        Explicit arguments take precedence over the values set on the graph,
+        which take precedence over the global settings.
+        """
+        if execution_mode is None:
+            execution_mode = self.execution_mode
+        if max_concurrency is None:
+            max_concurrency = self.max_concurrency
+        if execution_mode is None or max_concurrency is None:
+            try:
+                settings = get_settings_service().settings
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).debug("Error getting settings, using layered execution")
+            else:
+                execution_mode = execution_mode or settings.graph_execution_mode
+                if max_concurrency is None:
+                    max_concurrency = settings.graph_max_concurrency
+        if execution_mode not in {"layered", "dataflow"}:
+            if execution_mode is not None:
+                logger.warning(f"Unknown execution mode {execution_mode}. Using layered execution.")
+            execution_mode = "layered"
+        if max_concurrency is not None and max_concurrency < 1:
+            msg = f"max_concurrency must be a positive integer. Got {max_concurrency}"
+            raise ValueError(msg)
+        return execution_mode, max_concurrency
+
     async def process(
         self,
         *,
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+        execution_mode: ExecutionMode | None = None,
+        max_concurrency: int | None = None,
+        profile: bool | None = None,
+        use_cache: bool = True,
     ) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+        """Processes the graph.
+
+        In "layered" mode the vertices in each layer run in parallel and the next layer
+        starts once the whole layer is done. In "dataflow" mode each vertex starts as soon
+        as its own predecessors are done, with at most `max_concurrency` vertices building
+        at the same time.
+
+        If `profile` is True (defaults to the `graph_profiling_enabled` setting), the timings
+        of every vertex build are recorded in `self.profiler` and kept for the profiles endpoint.
+
+        If `use_cache` is False, the results of the vertices are neither read from nor written to the
+        chat service cache, which is keyed by vertex ID and shared with other runs of the flow.
+        """
+        execution_mode, max_concurrency = self._get_execution_settings(execution_mode, max_concurrency)
         first_layer = self.sort_vertices(start_component_id=start_component_id)
-        vertex_task_run_count: dict[str, int] = {}
-        to_process = deque(first_layer)
-        layer_index = 0
-        chat_service = get_chat_service()
         self.set_run_id()
         self.set_run_name()
         await self.initialize_run()
+        if profile is None:
+            profile = get_settings_service().settings.graph_profiling_enabled
+        self.profiler = (
+            GraphProfiler(
+                run_id=self._run_id,
+                flow_id=self.flow_id,
+                flow_name=self.flow_name,
+                user_id=str(self.user_id) if self.user_id else None,
+                predecessors=self.predecessor_map,
+            )
+            if profile
+            else None
+        )
         lock = asyncio.Lock()
+        try:
+            if execution_mode == "dataflow":
+                await self._process_dataflow(
+                    first_layer,
+                    lock=lock,
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    event_manager=event_manager,
+                    max_concurrency=max_concurrency,
+                    use_cache=use_cache,
+                )
+            else:
+                await self._process_layered(
+                    first_layer,
+                    lock=lock,
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    event_manager=event_manager,
+                    use_cache=use_cache,
+                )
+        finally:
+            if self.profiler is not None:
+                self.profiler.finish()
+                store_graph_profile(self.profiler)
+
+        logger.debug("Graph processing complete")
+        return self
+
+    async def _process_layered(
+        self,
+        first_layer: list[str],
+        *,
+        lock: asyncio.Lock,
+        fallback_to_env_vars: bool,
+        event_manager: EventManager | None = None,
+        use_cache: bool = True,
+    ) -> None:
+        """Processes the graph with vertices in each layer run in parallel."""
+        vertex_task_run_count: dict[str, int] = {}
+        to_process = deque(first_layer)
+        layer_index = 0
+        get_cache, set_cache = self._get_result_cache_functions(use_cache=use_cache)
         while to_process:
             current_batch = list(to_process)  # Copy current deque items to a list
             to_process.clear()  # Clear the deque for new items
@@ -1542,8 +1865,8 @@ class Graph:
                         user_id=self.user_id,
                         inputs_dict={},
                         fallback_to_env_vars=fallback_to_env_vars,
-                        get_cache=chat_service.get_cache,
-                        set_cache=chat_service.set_cache,
+                        get_cache=get_cache,
+                        set_cache=set_cache,
                         event_manager=event_manager,
                     ),
                     name=f"{vertex.display_name} Run {vertex_task_run_count.get(vertex_id, 0)}",
@@ -1562,13 +1885,153 @@ class Graph:
             to_process.extend(next_runnable_vertices)
             layer_index += 1
 
-        logger.debug("Graph processing complete")
-        return self
+    @staticmethod
+    def _get_result_cache_functions(*, use_cache: bool) -> tuple[GetCache | None, SetCache | None]:
+        if not use_cache:
+            return None, None
+        chat_service = get_chat_service()
+        return chat_service.get_cache, chat_service.set_cache
+
+    def account_built_objects(self, vertex: Vertex) -> None:
+        """Records the memory held by the objects a vertex built and enforces the memory budgets.
+
+        Over a budget, the objects that no vertex still waiting to build needs are released. See
+        `langflow.graph.graph.memory`.
+        """
+        graph_budget, worker_budget = self._get_memory_budgets()
+        if graph_budget is None and worker_budget is None:
+            return
+        built_object_ledger.record(self, vertex.id, estimate_vertex_size(vertex))
+        if released := enforce_memory_budgets(self, graph_budget=graph_budget, worker_budget=worker_budget):
+            logger.debug(f"Released the built objects of {released} to stay within the memory budget")
+
+    @staticmethod
+    def _get_memory_budgets() -> tuple[int | None, int | None]:
+        try:
+            settings = get_settings_service().settings
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("Error getting settings, not limiting memory")
+            return None, None
+        graph_budget, worker_budget = settings.graph_memory_budget, settings.graph_memory_budget_per_worker
+        return (
+            graph_budget * 1024 * 1024 if graph_budget is not None else None,
+            worker_budget * 1024 * 1024 if worker_budget is not None else None,
+        )
+
+    @staticmethod
+    def _get_scheduling_policy() -> str:
+        try:
+            return get_settings_service().settings.graph_scheduling_policy
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("Error getting settings, using fifo scheduling")
+            return "fifo"
+
+    def get_critical_path_priorities(self) -> dict[str, float]:
+        """Returns the expected build time of the longest path starting at each vertex.
+
+        Build times come from the recent builds of each vertex, or of other vertices of the same
+        component type. Vertices never built before count as the average of the known ones, or all
+        count the same if none is known, which ranks the vertices by the length of their paths.
+        """
+        estimates = {
+            vertex.id: build_time_history.estimate(self.flow_id, vertex.id, vertex.vertex_type)
+            for vertex in self.vertices
+        }
+        known = [duration for duration in estimates.values() if duration is not None]
+        default = sum(known) / len(known) if known else 1.0
+        durations = {
+            vertex_id: duration if duration is not None else default for vertex_id, duration in estimates.items()
+        }
+        return get_critical_path_priorities(self.successor_map, durations, self.cycle_analysis)
+
+    async def _process_dataflow(
+        self,
+        first_layer: list[str],
+        *,
+        lock: asyncio.Lock,
+        fallback_to_env_vars: bool,
+        event_manager: EventManager | None = None,
+        max_concurrency: int | None = None,
+        use_cache: bool = True,
+    ) -> None:
+        """Processes the graph starting each vertex as soon as its predecessors are done.
+
+        There is no barrier between layers: whenever a vertex finishes, the vertices it
+        unblocks are scheduled right away, so a slow vertex only delays its own successors.
+        When `max_concurrency` is set and the scheduling policy is "critical_path", the
+        vertices with the longest expected paths after them get free slots first.
+        """
+        vertex_task_run_count: dict[str, int] = {}
+        get_cache, set_cache = self._get_result_cache_functions(use_cache=use_cache)
+        semaphore = PrioritySemaphore(max_concurrency) if max_concurrency else None
+        priorities = (
+            self.get_critical_path_priorities()
+            if semaphore is not None and self._get_scheduling_policy() == "critical_path"
+            else {}
+        )
+        pending: set[asyncio.Task] = set()
+
+        async def _build(vertex_id: str) -> VertexBuildResult:
+            async with semaphore.slot(priorities.get(vertex_id, 0.0)) if semaphore else contextlib.nullcontext():
+                return await self.build_vertex(
+                    vertex_id=vertex_id,
+                    user_id=self.user_id,
+                    inputs_dict={},
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    get_cache=get_cache,
+                    set_cache=set_cache,
+                    event_manager=event_manager,
+                )
+
+        def _schedule(vertices_ids: list[str]) -> None:
+            if priorities:
+                vertices_ids = sorted(vertices_ids, key=lambda vertex_id: -priorities.get(vertex_id, 0.0))
+            for vertex_id in vertices_ids:
+                vertex = self.get_vertex(vertex_id)
+                # Mark the vertex as being run before the task starts so it is
+                # not picked again while it waits for a free slot
+                self.run_manager.add_to_vertices_being_run(vertex_id)
+                task = asyncio.create_task(
+                    _build(vertex_id),
+                    name=f"{vertex.display_name} Run {vertex_task_run_count.get(vertex_id, 0)}",
+                )
+                pending.add(task)
+                vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
+
+        _schedule(first_layer)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.discard(task)
+                    try:
+                        result = task.result()
+                    except Exception as exc:
+                        logger.error(f"Task {task.get_name()} failed with exception: {exc}")
+                        raise
+                    if not isinstance(result, VertexBuildResult):
+                        msg = f"Invalid result from task {task.get_name()}: {result}"
+                        raise TypeError(msg)
+                    logger.debug(
+                        f"Vertex {result.vertex.id}, result: {result.vertex.built_result}, "
+                        f"object: {result.vertex.built_object}"
+                    )
+                    next_runnable_vertices = await self.get_next_runnable_vertices(
+                        lock, vertex=result.vertex, cache=False
+                    )
+                    _schedule(next_runnable_vertices)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         next_runnable_vertices = set()
         for v_id in sorted(vertex_successors_ids):
-            if not self.is_vertex_runnable(v_id):
+            # A successor with pending predecessors cannot run yet, which the counters answer
+            # without looking up the vertex
+            if self.run_manager.is_blocked(v_id) or not self.is_vertex_runnable(v_id):
                 next_runnable_vertices.update(self.find_runnable_predecessors_for_successor(v_id))
             else:
                 next_runnable_vertices.add(v_id)
@@ -1578,6 +2041,8 @@ class Graph:
     async def get_next_runnable_vertices(self, lock: asyncio.Lock, vertex: Vertex, *, cache: bool = True) -> list[str]:
         v_id = vertex.id
         v_successors_ids = vertex.successors_ids
+        # The lock only covers the run state bookkeeping, which is proportional to the
+        # number of successors, so vertices finishing together do not queue up behind the cache write
         async with lock:
             self.run_manager.remove_vertex_from_runnables(v_id)
             next_runnable_vertices = self.find_next_runnable_vertices(v_successors_ids)
@@ -1587,9 +2052,9 @@ class Graph:
                     next_runnable_vertices.remove(v_id)
                 else:
                     self.run_manager.add_to_vertices_being_run(next_v_id)
-            if cache and self.flow_id is not None:
-                set_cache_coro = partial(get_chat_service().set_cache, key=self.flow_id)
-                await set_cache_coro(data=self, lock=lock)
+        if cache and self.flow_id is not None:
+            set_cache_coro = partial(get_chat_service().set_cache, key=self.flow_id)
+            await set_cache_coro(data=self, lock=lock)
         return next_runnable_vertices
 
     async def _execute_tasks(self, tasks: list[asyncio.Task], lock: asyncio.Lock) -> list[str]:
@@ -1634,29 +2099,7 @@ class Graph:
         Raises:
             ValueError: If the graph contains a cycle.
         """
-        # States: 0 = unvisited, 1 = visiting, 2 = visited
-        state = dict.fromkeys(self.vertices, 0)
-        sorted_vertices = []
-
-        def dfs(vertex) -> None:
-            if state[vertex] == 1:
-                # We have a cycle
-                msg = "Graph contains a cycle, cannot perform topological sort"
-                raise ValueError(msg)
-            if state[vertex] == 0:
-                state[vertex] = 1
-                for edge in vertex.edges:
-                    if edge.source_id == vertex.id:
-                        dfs(self.get_vertex(edge.target_id))
-                state[vertex] = 2
-                sorted_vertices.append(vertex)
-
-        # Visit each vertex
-        for vertex in self.vertices:
-            if state[vertex] == 0:
-                dfs(vertex)
-
-        return list(reversed(sorted_vertices))
+        return [self.get_vertex(vertex_id) for vertex_id in self.cycle_analysis.topological_order()]
 
     def generator_build(self) -> Generator[Vertex, None, None]:
         """Builds each vertex in the graph and yields it."""
@@ -1669,24 +2112,45 @@ class Graph:
         return [self.get_vertex(source_id) for source_id in self.predecessor_map.get(vertex.id, [])]
 
     def get_all_successors(self, vertex: Vertex, *, recursive=True, flat=True, visited=None):
+        """Returns the successors of a vertex, depth first.
+
+        With `flat`, each successor comes after its own successors. Otherwise the result is nested:
+        the direct successors followed by, for each of them, its own nested result and itself.
+        Vertices already in `visited` are not expanded again, so cycles terminate.
+        The default flat, recursive query is answered from `reachability`, in topological order.
+        """
         if visited is None:
+            if recursive and flat:
+                return [self.get_vertex(vertex_id) for vertex_id in self.reachability.successors(vertex.id)]
             visited = set()
 
         # Prevent revisiting vertices to avoid infinite loops in cyclic graphs
         if vertex in visited:
             return []
-
         visited.add(vertex)
 
-        successors = vertex.successors
-        if not successors:
-            return []
+        # Each frame holds a vertex, its direct successors, an iterator over them and the result so far
+        frames = [(vertex, vertex.successors, iter(vertex.successors), [])]
+        while True:
+            current, successors, remaining, successors_result = frames[-1]
+            successor = next(remaining, None)
+            if successor is not None and recursive and successor not in visited:
+                visited.add(successor)
+                frames.append((successor, successor.successors, iter(successor.successors), []))
+                continue
 
-        successors_result = []
+            if successor is None:
+                frames.pop()
+                if not flat and successors_result:
+                    successors_result = [successors, *successors_result]
+                if not frames:
+                    return successors_result
+                successor, next_successors = current, successors_result
+                successors_result = frames[-1][3]
+            else:
+                next_successors = []
 
-        for successor in successors:
             if recursive:
-                next_successors = self.get_all_successors(successor, recursive=recursive, flat=flat, visited=visited)
                 if flat:
                     successors_result.extend(next_successors)
                 else:
@@ -1696,11 +2160,6 @@ class Graph:
             else:
                 successors_result.append([successor])
 
-        if not flat and successors_result:
-            return [successors, *successors_result]
-
-        return successors_result
-
     def get_successors(self, vertex: Vertex) -> list[Vertex]:
         """Returns the successors of a vertex."""
         return [self.get_vertex(target_id) for target_id in self.successor_map.get(vertex.id, set())]
@@ -1708,7 +2167,7 @@ class Graph:
     def get_vertex_neighbors(self, vertex: Vertex) -> dict[Vertex, int]:
         """Returns the neighbors of a vertex."""
         neighbors: dict[Vertex, int] = {}
-        for edge in self.edges:
+        for edge in self._edges_by_vertex.get(vertex.id, []):
             if edge.source_id == vertex.id:
                 neighbor = self.get_vertex(edge.target_id)
                 if neighbor is None:
@@ -1726,22 +2185,36 @@ class Graph:
         return neighbors
 
     @property
-    def cycles(self):
-        if self._cycles is None:
-            if self._start is None:
-                self._cycles = []
-            else:
-                entry_vertex = self._start._id
-                edges = [(e["data"]["sourceHandle"]["id"], e["data"]["targetHandle"]["id"]) for e in self._edges]
-                self._cycles = find_all_cycle_edges(entry_vertex, edges)
-        return self._cycles
+    def cycle_analysis(self) -> CycleAnalysis:
+        """The strongly connected components and cycle edges of the graph.
+
+        They are computed in a single pass the first time they are needed and serve
+        `is_cyclic`, `cycles`, `cycle_vertices` and `topological_sort`.
+        """
+        if self._cycle_analysis is None:
+            roots = [vertex["id"] for vertex in self._vertices]
+            if self._start is not None:
+                roots.insert(0, self._start._id)
+            self._cycle_analysis = analyze_cycles(self._get_edges_as_list_of_tuples(), roots=roots)
+        return self._cycle_analysis
+
+    @property
+    def reachability(self) -> ReachabilityIndex:
+        """The transitive successors and predecessors of every vertex.
+
+        It is computed the first time it is needed and again after the adjacency maps are rebuilt.
+        """
+        if self._reachability is None:
+            self._reachability = ReachabilityIndex(self.get_vertex_ids(), self.successor_map)
+        return self._reachability
 
     @property
-    def cycle_vertices(self):
-        if self._cycle_vertices is None:
-            edges = self._get_edges_as_list_of_tuples()
-            self._cycle_vertices = set(find_cycle_vertices(edges))
-        return self._cycle_vertices
+    def cycles(self) -> list[tuple[str, str]]:
+        return self.cycle_analysis.cycle_edges
+
+    @property
+    def cycle_vertices(self) -> set[str]:
+        return self.cycle_analysis.cycle_vertices
 
     def _build_edges(self) -> list[CycleEdge]:
         """Builds the edges of the graph."""
@@ -1921,6 +2394,7 @@ class Graph:
             get_vertex_predecessors=self.get_vertex_predecessors_ids,
             get_vertex_successors=self.get_vertex_successors_ids,
             is_cyclic=self.is_cyclic,
+            reachability=self.reachability,
         )
 
         self.increment_run_count()
@@ -1989,10 +2463,11 @@ class Graph:
     def find_runnable_predecessors_for_successor(self, vertex_id: str) -> list[str]:
         runnable_vertices = []
         visited = set()
-
-        def find_runnable_predecessors(predecessor_id: str) -> None:
+        stack = list(reversed(self.run_manager.run_predecessors.get(vertex_id, [])))
+        while stack:
+            predecessor_id = stack.pop()
             if predecessor_id in visited:
-                return
+                continue
             visited.add(predecessor_id)
             predecessor_vertex = self.get_vertex(predecessor_id)
             is_active = predecessor_vertex.is_active()
@@ -2000,11 +2475,7 @@ class Graph:
             if self.run_manager.is_vertex_runnable(predecessor_id, is_active=is_active, is_loop=is_loop):
                 runnable_vertices.append(predecessor_id)
             else:
-                for pred_pred_id in self.run_manager.run_predecessors.get(predecessor_id, []):
-                    find_runnable_predecessors(pred_pred_id)
-
-        for predecessor_id in self.run_manager.run_predecessors.get(vertex_id, []):
-            find_runnable_predecessors(predecessor_id)
+                stack.extend(reversed(self.run_manager.run_predecessors.get(predecessor_id, [])))
         return runnable_vertices
 
     def remove_from_predecessors(self, vertex_id: str) -> None:
@@ -2059,7 +2530,7 @@ class Graph:
         result: dict = {}
         for vertex in self.vertices:
             vertex_id = vertex.id
-            sucessors = [i.id for i in self.get_all_successors(vertex)]
+            sucessors = self.reachability.successors(vertex_id)
             predecessors = [i.id for i in self.get_predecessors(vertex)]
             result |= {vertex_id: {"successors": sucessors, "predecessors": predecessors}}
         return result
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from langflow.graph.graph.template import GraphTemplate
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from langflow.graph.edge.base import CycleEdge
+    from langflow.graph.graph.base import Graph
+
+
+class LoopBody:
+    """The vertices that run between a loop output and the loop input that collects their results.
+
+    The body is compiled into a GraphTemplate once, so every item runs on a fresh graph that
+    shares no vertex state with the other items and can run concurrently with them. Values
+    that flow into the body from vertices outside of it are read from the parent graph and
+    injected into every instance.
+    """
+
+    def __init__(self, graph: Graph, loop_vertex_id: str, *, output_name: str, input_name: str) -> None:
+        self.graph = graph
+        self.loop_vertex_id = loop_vertex_id
+        self.entry_edges = [
+            edge
+            for edge in graph.get_vertex_edges(loop_vertex_id, is_target=False)
+            if edge.source_handle.name == output_name
+        ]
+        exit_edges = [
+            edge for edge in graph.get_vertex_edges(loop_vertex_id, is_source=False) if edge.target_param == input_name
+        ]
+        if not self.entry_edges or not exit_edges:
+            msg = f"The loop body must start at the '{output_name}' output and end at the '{input_name}' input."
+            raise ValueError(msg)
+        if len(exit_edges) > 1:
+            msg = f"Only one component can be connected to the '{input_name}' input of the loop."
+            raise ValueError(msg)
+        self.exit_edge: CycleEdge = exit_edges[0]
+        self.vertex_ids = self._find_body_vertex_ids()
+        self.external_edges = [
+            edge
+            for vertex_id in self.vertex_ids
+            for edge in graph.get_vertex_edges(vertex_id, is_source=False)
+            if edge.source_id not in self.vertex_ids and edge.source_id != loop_vertex_id
+        ]
+        nodes = [graph.get_vertex(vertex_id).to_data() for vertex_id in self.vertex_ids]
+        edges = [
+            edge.to_data()
+            for vertex_id in self.vertex_ids
+            for edge in graph.get_vertex_edges(vertex_id, is_target=False)
+            if edge.target_id in self.vertex_ids
+        ]
+        self.template = GraphTemplate(
+            {"nodes": nodes, "edges": edges}, flow_id=graph.flow_id, flow_name=graph.flow_name
+        )
+
+    def _find_body_vertex_ids(self) -> set[str]:
+        """Returns the vertices reachable from the loop output that also lead back to the loop input."""
+
+        def walk(start: list[str], adjacency: dict[str, list[str]]) -> set[str]:
+            visited: set[str] = set()
+            stack = [vertex_id for vertex_id in start if vertex_id != self.loop_vertex_id]
+            while stack:
+                vertex_id = stack.pop()
+                if vertex_id in visited:
+                    continue
+                visited.add(vertex_id)
+                stack.extend(
+                    next_id
+                    for next_id in adjacency.get(vertex_id, [])
+                    if next_id != self.loop_vertex_id and next_id not in visited
+                )
+            return visited
+
+        reachable = walk([edge.target_id for edge in self.entry_edges], self.graph.successor_map)
+        leads_back = walk([self.exit_edge.source_id], self.graph.predecessor_map)
+        return reachable & leads_back
+
+    async def resolve_inputs(self) -> dict[str, dict[str, Any]]:
+        """Reads the values that vertices outside of the body pass to it from the parent graph.
+
+        Returns:
+            dict: The params to inject, by body vertex ID.
+
+        Raises:
+            ValueError: If one of those vertices has not been built yet.
+        """
+        values: dict[str, dict[str, list[Any]]] = defaultdict(lambda: defaultdict(list))
+        for edge in self.external_edges:
+            source = self.graph.get_vertex(edge.source_id)
+            if not source.built:
+                msg = f"Component {source.display_name} feeds the loop body but has not been built yet."
+                raise ValueError(msg)
+            target = self.graph.get_vertex(edge.target_id)
+            values[edge.target_id][edge.target_param].append(
+                await source.get_result(target, target_handle_name=edge.target_param)
+            )
+        return {
+            vertex_id: {key: items[0] if len(items) == 1 else items for key, items in params.items()}
+            for vertex_id, params in values.items()
+        }
+
+    async def run(self, item: Any, *, inputs: dict[str, dict[str, Any]] | None = None) -> Any:
+        """Runs a fresh instance of the body with the item as its input.
+
+        Args:
+            item: The value the loop output passes to the body.
+            inputs: The values from outside of the body, as returned by `resolve_inputs`.
+
+        Returns:
+            The value the body sends back to the loop, or None if that branch did not run.
+        """
+        graph = self.template.instantiate(user_id=self.graph.user_id)
+        graph.session_id = self.graph.session_id
+        graph.context = dict(self.graph.context)
+        # Items are traced as part of the build of the loop, not as runs of their own
+        graph.tracing_service = None
+        params: dict[str, dict[str, Any]] = defaultdict(dict)
+        for vertex_id, vertex_params in (inputs or {}).items():
+            params[vertex_id].update(vertex_params)
+        for edge in self.entry_edges:
+            params[edge.target_id][edge.target_param] = item
+        for vertex_id, vertex_params in params.items():
+            graph.get_vertex(vertex_id).update_raw_params(vertex_params, overwrite=True)
+
+        # The vertices of every item have the IDs of the body vertices of the parent graph, so their
+        # results must stay out of the chat service cache, which is keyed by vertex ID
+        await graph.process(
+            fallback_to_env_vars=get_settings_service().settings.fallback_to_env_var,
+            profile=False,
+            use_cache=False,
+        )
+
+        exit_vertex = graph.get_vertex(self.exit_edge.source_id)
+        if not exit_vertex.built or not exit_vertex.results:
+            return None
+        return exit_vertex.results.get(self.exit_edge.source_handle.name)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from langflow.utils.memory import estimate_size
+
+if TYPE_CHECKING:
+    from langflow.graph.graph.base import Graph
+    from langflow.graph.vertex.base import Vertex
+
+
+def estimate_vertex_size(vertex: Vertex) -> int:
+    """Returns an estimate of the memory held by the objects a vertex built."""
+    return estimate_size([vertex.built_object, vertex.built_result, vertex.results, vertex.artifacts, vertex.result])
+
+
+class BuiltObjectLedger:
+    """The estimated memory held by the built objects of the vertices of each graph in the process.
+
+    Graphs are referenced weakly and leave the ledger when they are garbage collected. They are
+    kept from the least to the most recently updated.
+    """
+
+    def __init__(self) -> None:
+        self._graphs: OrderedDict[int, tuple[weakref.ref[Graph], dict[str, int]]] = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+        # Keys of collected graphs. Finalizers may run while the lock is held, so they only queue the key
+        self._collected: list[int] = []
+
+    @property
+    def total(self) -> int:
+        with self._lock:
+            self._purge()
+            return self._total
+
+    def record(self, graph: Graph, vertex_id: str, size: int) -> None:
+        """Sets the memory held by the built objects of a vertex."""
+        with self._lock:
+            self._purge()
+            if (entry := self._entry(graph)) is None:
+                # The ID may belong to a collected graph whose finalizer did not run yet
+                self._drop(id(graph))
+                entry = self._graphs[id(graph)] = (weakref.ref(graph), {})
+                weakref.finalize(graph, self._collected.append, id(graph))
+            sizes = entry[1]
+            self._total += size - sizes.get(vertex_id, 0)
+            sizes[vertex_id] = size
+            self._graphs.move_to_end(id(graph))
+
+    def release(self, graph: Graph, vertex_id: str) -> None:
+        """Removes a vertex whose built objects were dropped."""
+        with self._lock:
+            if (entry := self._entry(graph)) is not None:
+                self._total -= entry[1].pop(vertex_id, 0)
+
+    def graph_total(self, graph: Graph) -> int:
+        with self._lock:
+            entry = self._entry(graph)
+            return sum(entry[1].values()) if entry is not None else 0
+
+    def vertex_sizes(self, graph: Graph) -> dict[str, int]:
+        with self._lock:
+            entry = self._entry(graph)
+            return dict(entry[1]) if entry is not None else {}
+
+    def graphs(self) -> list[Graph]:
+        """Returns the graphs in the ledger, from the least to the most recently updated."""
+        with self._lock:
+            self._purge()
+            return [graph for graph_ref, _ in self._graphs.values() if (graph := graph_ref()) is not None]
+
+    def _entry(self, graph: Graph) -> tuple[weakref.ref[Graph], dict[str, int]] | None:
+        entry = self._graphs.get(id(graph))
+        return entry if entry is not None and entry[0]() is graph else None
+
+    def _drop(self, key: int) -> None:
+        if (entry := self._graphs.pop(key, None)) is not None:
+            self._total -= sum(entry[1].values())
+
+    def _purge(self) -> None:
+        while self._collected:
+            key = self._collected.pop()
+            if (entry := self._graphs.get(key)) is not None and entry[0]() is None:
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._graphs.clear()
+            self._collected.clear()
+            self._total = 0
+
+
+built_object_ledger = BuiltObjectLedger()
+
+
+def can_release_built_objects(graph: Graph, vertex: Vertex) -> bool:
+    """Returns whether the built objects of a vertex are no longer needed by the current run.
+
+    They are needed while a successor that is part of the run has not been built. Only components
+    marked `releasable` give up their objects, as the objects are recreated by running their
+    outputs again. The objects of frozen vertices, vertices in cycles and the inputs, outputs and
+    state vertices shown in the UI are always kept.
+    """
+    if not vertex.built or vertex.needs_rehydration or vertex.frozen or not vertex.is_releasable:
+        return False
+    if vertex.is_input or vertex.is_output or vertex.is_interface_component or vertex.is_state:
+        return False
+    if vertex.id in graph.cycle_vertices:
+        return False
+    for successor_id in graph.successor_map.get(vertex.id, []):
+        successor = graph.vertex_map.get(successor_id)
+        if successor is not None and not successor.built and successor_id in graph.vertices_to_run:
+            return False
+    return True
+
+
+def _release_largest(graph: Graph, excess: int, ledger: BuiltObjectLedger) -> list[str]:
+    released: list[str] = []
+    sizes = ledger.vertex_sizes(graph)
+    for vertex_id in sorted(sizes, key=sizes.__getitem__, reverse=True):
+        if excess <= 0:
+            break
+        vertex = graph.vertex_map.get(vertex_id)
+        if vertex is None:
+            ledger.release(graph, vertex_id)
+            continue
+        if not can_release_built_objects(graph, vertex):
+            continue
+        vertex.release_built_objects()
+        ledger.release(graph, vertex_id)
+        released.append(vertex_id)
+        excess -= sizes[vertex_id]
+    return released
+
+
+def enforce_memory_budgets(
+    graph: Graph,
+    *,
+    graph_budget: int | None,
+    worker_budget: int | None,
+    ledger: BuiltObjectLedger = built_object_ledger,
+) -> list[str]:
+    """Releases built objects until the graph and the process are within their budgets.
+
+    The largest objects that no successor still needs are released first. Over the process
+    budget, the least recently updated graphs give up their objects first.
+
+    Args:
+        graph: The graph that was just updated.
+        graph_budget: The bytes the built objects of one graph can take, or None for no limit.
+        worker_budget: The bytes the built objects of all graphs in the process can take, or None for no limit.
+        ledger: The ledger with the sizes of the built objects.
+
+    Returns:
+        list[str]: The IDs of the vertices of `graph` whose objects were released.
+    """
+    released: list[str] = []
+    if graph_budget is not None and (excess := ledger.graph_total(graph) - graph_budget) > 0:
+        released.extend(_release_largest(graph, excess, ledger))
+    if worker_budget is not None:
+        for other_graph in ledger.graphs():
+            if (excess := ledger.total - worker_budget) <= 0:
+                break
+            released_ids = _release_largest(other_graph, excess, ledger)
+            if other_graph is graph:
+                released.extend(released_ids)
+    return released
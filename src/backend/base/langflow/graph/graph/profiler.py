@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
+
+    from langflow.graph.vertex.base import Vertex
+
+PHASES = ("build_params", "execution", "thread_queue_wait", "result_logging")
+
+
+@dataclass
+class VertexBuildProfile:
+    """The timings of one build of a vertex, in seconds since the start of the run."""
+
+    vertex_id: str
+    display_name: str
+    predecessors: list[str]
+    started_at: float
+    finished_at: float | None = None
+    error: bool = False
+    spans: list[tuple[str, float, float]] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        return (self.finished_at if self.finished_at is not None else self.started_at) - self.started_at
+
+    def phase_durations(self) -> dict[str, float]:
+        durations = dict.fromkeys(PHASES, 0.0)
+        for phase, start, end in self.spans:
+            durations[phase] = durations.get(phase, 0.0) + end - start
+        return durations
+
+
+class GraphProfiler:
+    """Records where the time of a graph run goes, vertex by vertex.
+
+    For every build it keeps when the vertex started and finished and the spans of its phases:
+    resolving params, running the component, waiting for a worker thread and storing or logging
+    the results. The time spent waiting on predecessors and on the scheduler is derived from the
+    builds of the predecessors when the report is created.
+    """
+
+    def __init__(
+        self,
+        *,
+        run_id: str,
+        flow_id: str | None = None,
+        flow_name: str | None = None,
+        user_id: str | None = None,
+        predecessors: dict[str, list[str]] | None = None,
+    ) -> None:
+        self.run_id = run_id
+        self.flow_id = flow_id
+        self.flow_name = flow_name
+        self.user_id = user_id
+        self.started_at = datetime.now(timezone.utc)
+        self.duration: float | None = None
+        self.builds: list[VertexBuildProfile] = []
+        self._start = time.perf_counter()
+        self._current: dict[str, VertexBuildProfile] = {}
+        # Copied because the run empties the predecessor map of the graph as vertices are built
+        self._predecessors = {vertex_id: list(ids) for vertex_id, ids in (predecessors or {}).items()}
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        """Returns the seconds elapsed since the start of the run."""
+        return time.perf_counter() - self._start
+
+    def start_build(self, vertex: Vertex) -> None:
+        build = VertexBuildProfile(
+            vertex_id=vertex.id,
+            display_name=vertex.display_name,
+            predecessors=self._predecessors.get(vertex.id, []),
+            started_at=self.now(),
+        )
+        with self._lock:
+            self.builds.append(build)
+            self._current[vertex.id] = build
+
+    def end_build(self, vertex: Vertex, *, error: bool = False) -> None:
+        with self._lock:
+            build = self._current.pop(vertex.id, None)
+        if build is not None:
+            build.finished_at = self.now()
+            build.error = error
+
+    def add_span(self, vertex_id: str, phase: str, start: float, end: float) -> None:
+        """Adds a phase to the build of the vertex that is running. Times are `time.perf_counter()` values."""
+        with self._lock:
+            build = self._current.get(vertex_id)
+            if build is not None:
+                build.spans.append((phase, start - self._start, end - self._start))
+
+    @contextmanager
+    def span(self, vertex_id: str, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(vertex_id, phase, start, time.perf_counter())
+
+    def finish(self) -> None:
+        self.duration = self.now()
+
+    def report(self) -> dict[str, Any]:
+        """Returns the profile as a JSON-compatible dict."""
+        finished: dict[str, list[float]] = defaultdict(list)
+        for build in self.builds:
+            if build.finished_at is not None:
+                finished[build.vertex_id].append(build.finished_at)
+
+        vertices = []
+        # Waiting on predecessors is the time from the start of the run until the vertex was ready, which
+        # overlaps with the builds of the predecessors, so it has no meaningful total
+        totals = dict.fromkeys(("scheduling_delay", *PHASES), 0.0)
+        for build in sorted(self.builds, key=lambda build: build.started_at):
+            # A vertex is ready once the last predecessor (or its own previous build, in cycles)
+            # that finished before it started is done
+            ready_at = max(
+                (
+                    finished_at
+                    for vertex_id in [*build.predecessors, build.vertex_id]
+                    for finished_at in finished[vertex_id]
+                    if finished_at <= build.started_at
+                ),
+                default=0.0,
+            )
+            timings = {
+                "waiting_on_predecessors": ready_at,
+                "scheduling_delay": build.started_at - ready_at,
+                **build.phase_durations(),
+            }
+            for key in totals:
+                totals[key] += timings[key]
+            vertices.append(
+                {
+                    "vertex_id": build.vertex_id,
+                    "display_name": build.display_name,
+                    "started_at": build.started_at,
+                    "finished_at": build.finished_at,
+                    "duration": build.duration,
+                    "error": build.error,
+                    **timings,
+                }
+            )
+        return {
+            "run_id": self.run_id,
+            "flow_id": self.flow_id,
+            "flow_name": self.flow_name,
+            "started_at": self.started_at.isoformat(),
+            "duration": self.duration if self.duration is not None else self.now(),
+            "vertices": vertices,
+            "totals": totals,
+        }
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Returns the profile in the Chrome trace event format, for chrome://tracing or Perfetto.
+
+        Builds that overlap are put on different lanes, and each phase is nested under its build.
+        """
+        events: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": self.flow_name or self.run_id}},
+        ]
+        lanes_end: list[float] = []
+        for build in sorted(self.builds, key=lambda build: build.started_at):
+            finished_at = build.finished_at if build.finished_at is not None else build.started_at
+            lane = next((index for index, end in enumerate(lanes_end) if end <= build.started_at), len(lanes_end))
+            if lane == len(lanes_end):
+                lanes_end.append(finished_at)
+            else:
+                lanes_end[lane] = finished_at
+            events.append(
+                {
+                    "name": build.display_name,
+                    "cat": "vertex",
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": lane,
+                    "ts": build.started_at * 1_000_000,
+                    "dur": (finished_at - build.started_at) * 1_000_000,
+                    "args": {"vertex_id": build.vertex_id, "error": build.error, **build.phase_durations()},
+                }
+            )
+            events.extend(
+                {
+                    "name": phase,
+                    "cat": "phase",
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": lane,
+                    "ts": start * 1_000_000,
+                    "dur": (end - start) * 1_000_000,
+                    "args": {"vertex_id": build.vertex_id},
+                }
+                for phase, start, end in build.spans
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"run_id": self.run_id}}
+
+
+def profile_span(vertex: Vertex, phase: str) -> AbstractContextManager:
+    """Records a phase of the build of a vertex if its graph is being profiled."""
+    profiler = getattr(vertex.graph, "profiler", None)
+    if profiler is None:
+        return nullcontext()
+    return profiler.span(vertex.id, phase)
+
+
+_profiles: OrderedDict[str, GraphProfiler] = OrderedDict()
+_profiles_lock = threading.Lock()
+
+
+def store_graph_profile(profiler: GraphProfiler) -> None:
+    """Keeps the profile of a run, dropping the oldest ones beyond `graph_profiles_max`."""
+    max_profiles = get_settings_service().settings.graph_profiles_max
+    with _profiles_lock:
+        _profiles[profiler.run_id] = profiler
+        _profiles.move_to_end(profiler.run_id)
+        while len(_profiles) > max_profiles:
+            _profiles.popitem(last=False)
+
+
+def get_graph_profile(run_id: str) -> GraphProfiler | None:
+    with _profiles_lock:
+        return _profiles.get(run_id)
+
+
+def list_graph_profiles(flow_id: str | None = None, user_id: str | None = None) -> list[GraphProfiler]:
+    """Returns the stored profiles, most recent first, optionally only those of a flow or of a user."""
+    with _profiles_lock:
+        profiles = list(reversed(_profiles.values()))
+    if flow_id is not None:
+        profiles = [profiler for profiler in profiles if profiler.flow_id == flow_id]
+    if user_id is not None:
+        profiles = [profiler for profiler in profiles if profiler.user_id == user_id]
+    return profiles
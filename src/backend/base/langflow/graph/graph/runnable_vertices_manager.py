@@ -8,6 +8,7 @@ class RunnableVerticesManager:
         self.vertices_to_run: set[str] = set()  # Set of vertices that are ready to run
         self.vertices_being_run: set[str] = set()  # Set of vertices that are currently running
         self.cycle_vertices: set[str] = set()  # Set of vertices that are in a cycle
+        self.pending_counts: dict[str, int] = {}  # Number of pending predecessors of each vertex
 
     def to_dict(self) -> dict:
         return {
@@ -24,6 +25,7 @@ class RunnableVerticesManager:
         instance.run_predecessors = data["run_predecessors"]
         instance.vertices_to_run = data["vertices_to_run"]
         instance.vertices_being_run = data["vertices_being_run"]
+        instance.build_pending_counts()
         return instance
 
     def __getstate__(self) -> object:
@@ -39,9 +41,17 @@ class RunnableVerticesManager:
         self.run_predecessors = state["run_predecessors"]
         self.vertices_to_run = state["vertices_to_run"]
         self.vertices_being_run = state["vertices_being_run"]
+        self.cycle_vertices = set()
+        self.build_pending_counts()
+
+    def build_pending_counts(self) -> None:
+        """Counts the pending predecessors of every vertex in `run_predecessors`."""
+        self.pending_counts = {
+            vertex_id: len(predecessors) for vertex_id, predecessors in self.run_predecessors.items()
+        }
 
     def all_predecessors_are_fulfilled(self) -> bool:
-        return all(not value for value in self.run_predecessors.values())
+        return not any(self.pending_counts.values())
 
     def update_run_state(self, run_predecessors: dict, vertices_to_run: set) -> None:
         self.run_predecessors.update(run_predecessors)
@@ -73,24 +83,28 @@ class RunnableVerticesManager:
         Returns:
             bool: True if all predecessor conditions are met, False otherwise
         """
-        # Get pending predecessors, return True if none exist
-        pending = self.run_predecessors.get(vertex_id, [])
-        if not pending:
+        # Return True if there are no pending predecessors
+        if not self.pending_counts.get(vertex_id, 0):
             return True
 
         # For cycle vertices, check if any pending predecessors are also in cycle
         # Using set intersection is faster than iteration
         if vertex_id in self.cycle_vertices:
-            return is_loop or not bool(set(pending) & self.cycle_vertices)
+            return is_loop or not bool(set(self.run_predecessors.get(vertex_id, [])) & self.cycle_vertices)
 
         return False
 
     def remove_from_predecessors(self, vertex_id: str) -> None:
         """Removes a vertex from the predecessor list of its successors."""
-        predecessors = self.run_map.get(vertex_id, [])
-        for predecessor in predecessors:
-            if vertex_id in self.run_predecessors[predecessor]:
-                self.run_predecessors[predecessor].remove(vertex_id)
+        successors = self.run_map.get(vertex_id, [])
+        for successor in successors:
+            if vertex_id in self.run_predecessors[successor]:
+                self.run_predecessors[successor].remove(vertex_id)
+                self.pending_counts[successor] = self.pending_counts.get(successor, 1) - 1
+
+    def is_blocked(self, vertex_id: str) -> bool:
+        """Whether a vertex still waits on pending predecessors and is not exempted by being in a cycle."""
+        return bool(self.pending_counts.get(vertex_id, 0)) and vertex_id not in self.cycle_vertices
 
     def build_run_map(self, predecessor_map, vertices_to_run) -> None:
         """Builds a map of vertices and their runnable successors."""
@@ -100,6 +114,7 @@ class RunnableVerticesManager:
                 self.run_map[predecessor].append(vertex_id)
         self.run_predecessors = predecessor_map.copy()
         self.vertices_to_run = vertices_to_run
+        self.build_pending_counts()
 
     def update_vertex_run_state(self, vertex_id: str, *, is_runnable: bool) -> None:
         """Updates the runnable state of a vertex."""
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from langflow.graph.graph.utils import CycleAnalysis
+
+DEFAULT_SMOOTHING = 0.3
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class BuildTimeHistory:
+    """Exponentially weighted averages of how long vertices take to build.
+
+    Build times are kept for each vertex of each flow and for each component type, so a vertex
+    that never ran in a flow is estimated from the other vertices of the same type.
+
+    Args:
+        smoothing: The weight of the latest build time in the average, between 0 and 1.
+        max_entries: The number of flow vertices to keep. The least recently updated are dropped.
+    """
+
+    def __init__(self, smoothing: float = DEFAULT_SMOOTHING, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.smoothing = smoothing
+        self.max_entries = max_entries
+        self._by_vertex: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._by_type: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _update(self, previous: float | None, duration: float) -> float:
+        if previous is None:
+            return duration
+        return self.smoothing * duration + (1 - self.smoothing) * previous
+
+    def record(self, flow_id: str | None, vertex_id: str, vertex_type: str, duration: float) -> None:
+        """Adds the build time of a vertex, in seconds."""
+        with self._lock:
+            self._by_type[vertex_type] = self._update(self._by_type.get(vertex_type), duration)
+            if flow_id is None:
+                return
+            key = (flow_id, vertex_id)
+            self._by_vertex[key] = self._update(self._by_vertex.get(key), duration)
+            self._by_vertex.move_to_end(key)
+            while len(self._by_vertex) > self.max_entries:
+                self._by_vertex.popitem(last=False)
+
+    def estimate(self, flow_id: str | None, vertex_id: str, vertex_type: str) -> float | None:
+        """Returns the expected build time of a vertex, or None if neither it nor its type was built before."""
+        with self._lock:
+            if flow_id is not None and (duration := self._by_vertex.get((flow_id, vertex_id))) is not None:
+                return duration
+            return self._by_type.get(vertex_type)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_vertex.clear()
+            self._by_type.clear()
+
+
+build_time_history = BuildTimeHistory()
+
+
+def get_critical_path_priorities(
+    successor_map: dict[str, list[str]],
+    durations: dict[str, float],
+    cycle_analysis: CycleAnalysis,
+) -> dict[str, float]:
+    """Returns the length of the longest path of build times that starts at each vertex.
+
+    The vertices of a cycle are one unit: they share the sum of their build times plus the longest
+    path after the cycle.
+
+    Args:
+        successor_map: The successors of each vertex.
+        durations: The expected build time of each vertex.
+        cycle_analysis: The strongly connected components of the graph, in reverse topological order.
+
+    Returns:
+        dict: The priority of each vertex. Vertices on longer paths have higher priorities.
+    """
+    priorities: dict[str, float] = {}
+    # Successors are in earlier components, so their priorities are known when a component is reached
+    for component in cycle_analysis.components:
+        members = set(component)
+        downstream = max(
+            (
+                priorities.get(successor, 0.0)
+                for vertex_id in component
+                for successor in successor_map.get(vertex_id, [])
+                if successor not in members
+            ),
+            default=0.0,
+        )
+        priority = sum(durations.get(vertex_id, 0.0) for vertex_id in component) + downstream
+        for vertex_id in component:
+            priorities[vertex_id] = priority
+    return priorities
+
+
+class PrioritySemaphore:
+    """A semaphore that gives free slots to the waiter with the highest priority.
+
+    Waiters with the same priority get slots in the order they asked for them.
+    """
+
+    def __init__(self, value: int) -> None:
+        self._value = value
+        self._waiters: list[tuple[float, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    async def acquire(self, priority: float = 0.0) -> None:
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over right before the cancellation, so pass it on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+    @asynccontextmanager
+    async def slot(self, priority: float = 0.0) -> AsyncIterator[None]:
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
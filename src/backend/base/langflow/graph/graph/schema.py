@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, NamedTuple, Protocol
+from typing import TYPE_CHECKING, Literal, NamedTuple, Protocol
 
 from typing_extensions import NotRequired, TypedDict
 
@@ -13,6 +13,9 @@ if TYPE_CHECKING:
     from langflow.schema.log import LoggableType
 
 
+ExecutionMode = Literal["layered", "dataflow"]
+
+
 class ViewPort(TypedDict):
     x: float
     y: float
@@ -23,6 +26,7 @@ class GraphData(TypedDict):
     nodes: list[NodeData]
     edges: list[EdgeData]
     viewport: NotRequired[ViewPort]
+    execution_mode: NotRequired[ExecutionMode]
 
 
 class GraphDump(TypedDict, total=False):
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import pickle
+import zlib
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from pathlib import PurePath
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import pandas as pd
+from pydantic import BaseModel
+
+from langflow.graph.graph.base import Graph
+from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
+from langflow.graph.utils import UnbuiltObject, UnbuiltResult
+
+if TYPE_CHECKING:
+    from langflow.graph.vertex.base import Vertex
+
+SNAPSHOT_VERSION = 1
+_MAGIC = b"LFGS"
+_HEADER_SIZE = len(_MAGIC) + 2
+_COMPRESSED = 1
+
+# The graph attributes that change while a graph runs. The rest is rebuilt from the nodes and edges.
+_GRAPH_STATE_KEYS = (
+    "description",
+    "top_level_vertices",
+    "inactivated_vertices",
+    "activated_vertices",
+    "_run_id",
+    "_session_id",
+    "in_degree_map",
+    "parent_child_map",
+    "predecessor_map",
+    "successor_map",
+    "vertices_layers",
+    "vertices_to_run",
+    "reusable_vertices",
+    "stop_vertex",
+    "_run_queue",
+    "_first_layer",
+    "_is_input_vertices",
+    "_is_output_vertices",
+    "has_session_id_vertices",
+    "_sorted_vertices_layers",
+    "execution_mode",
+    "max_concurrency",
+)
+_VERTEX_STATE_KEYS = (
+    "built",
+    "state",
+    "use_result",
+    "will_stream",
+    "layer",
+    "parent_is_top_level",
+    "build_times",
+    "build_context",
+)
+# The results of a build, kept only when they hold plain data
+_VERTEX_RESULT_KEYS = (
+    "built_object",
+    "built_result",
+    "result",
+    "results",
+    "artifacts",
+    "artifacts_raw",
+    "artifacts_type",
+    "outputs_logs",
+    "logs",
+)
+# The results successors read. The others are only shown in the UI and are not built again
+_SUCCESSOR_RESULT_KEYS = ("built_object", "built_result", "results")
+_PLAIN_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    bool,
+    type(None),
+    UUID,
+    datetime,
+    date,
+    time,
+    timedelta,
+    Enum,
+    PurePath,
+    pd.DataFrame,
+)
+
+
+class GraphSnapshotError(ValueError):
+    """Raised when a graph can not be stored as a snapshot or data is not a snapshot this version can load."""
+
+
+def is_plain_data(value: Any) -> bool:
+    """Returns whether a value only holds data that can be stored and loaded without live objects.
+
+    Plain data is made of primitives, containers, DataFrames and the pydantic models of Langflow,
+    like Data and Message. Clients, models and other objects built by components are not.
+    """
+    stack = [value]
+    seen: set[int] = set()
+    while stack:
+        item = stack.pop()
+        if isinstance(item, _PLAIN_TYPES):
+            continue
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if isinstance(item, list | tuple | set | frozenset):
+            stack.extend(item)
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, BaseModel) and type(item).__module__.startswith("langflow."):
+            stack.extend(item.__dict__.values())
+        else:
+            return False
+    return True
+
+
+def _dump_vertex_state(vertex: Vertex) -> dict[str, Any]:
+    state = {key: getattr(vertex, key) for key in _VERTEX_STATE_KEYS}
+    needs_rehydration = vertex.needs_rehydration
+    for key in _VERTEX_RESULT_KEYS:
+        value = getattr(vertex, key)
+        if isinstance(value, UnbuiltObject | UnbuiltResult):
+            continue
+        if key in _SUCCESSOR_RESULT_KEYS and vertex.base_type == "component" and isinstance(value, dict):
+            # Component results are kept per output, so only the outputs that are not plain are built again
+            state[key] = {name: result for name, result in value.items() if is_plain_data(result)}
+            needs_rehydration = needs_rehydration or len(state[key]) < len(value)
+        elif is_plain_data(value):
+            state[key] = value
+        elif key in _SUCCESSOR_RESULT_KEYS:
+            needs_rehydration = True
+    state["needs_rehydration"] = vertex.built and needs_rehydration
+    if state["needs_rehydration"] and not (vertex.is_releasable and is_plain_data(vertex.build_context)):
+        msg = f"Vertex {vertex.id} has results that are not plain data and can not be built again without side effects"
+        raise GraphSnapshotError(msg)
+    return state
+
+
+def dump_graph_snapshot(graph: Graph, *, compress: bool = True) -> bytes:
+    """Serializes the structure, run state and plain results of a graph.
+
+    Unlike pickling the graph, the snapshot does not keep the component instances or the objects
+    built by the vertices. Outputs whose results are not plain data are built again, with the
+    context of their original build, when a successor asks for them after the snapshot is loaded.
+    Only components marked `releasable` can have those outputs.
+
+    Args:
+        graph: The graph to serialize.
+        compress: Whether to compress the snapshot with zlib.
+
+    Returns:
+        bytes: The versioned snapshot.
+
+    Raises:
+        GraphSnapshotError: If a vertex has results that are not plain data and its component is not
+            releasable, so the graph has to be stored whole.
+    """
+    state = {
+        "flow_id": graph.flow_id,
+        "flow_name": graph.flow_name,
+        "user_id": graph.user_id,
+        "nodes": graph._vertices,
+        "edges": graph._edges,
+        "graph": {key: getattr(graph, key, None) for key in _GRAPH_STATE_KEYS},
+        "run_manager": graph.run_manager.to_dict(),
+        "vertices": {vertex.id: _dump_vertex_state(vertex) for vertex in graph.vertices},
+    }
+    payload = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, level=1)
+        flags |= _COMPRESSED
+    return _MAGIC + bytes((SNAPSHOT_VERSION, flags)) + payload
+
+
+def is_graph_snapshot(data: Any) -> bool:
+    return isinstance(data, bytes) and data.startswith(_MAGIC)
+
+
+def load_graph_snapshot(data: bytes) -> Graph:
+    """Creates a graph from a snapshot made by `dump_graph_snapshot`.
+
+    Raises:
+        GraphSnapshotError: If the data is not a snapshot or was made by another snapshot version.
+    """
+    if not is_graph_snapshot(data) or len(data) < _HEADER_SIZE:
+        msg = "The data is not a graph snapshot"
+        raise GraphSnapshotError(msg)
+    version, flags = data[len(_MAGIC)], data[len(_MAGIC) + 1]
+    if version != SNAPSHOT_VERSION:
+        msg = f"Graph snapshot version {version} is not supported. Expected version {SNAPSHOT_VERSION}"
+        raise GraphSnapshotError(msg)
+    payload = data[_HEADER_SIZE:]
+    if flags & _COMPRESSED:
+        payload = zlib.decompress(payload)
+    state = pickle.loads(payload)  # noqa: S301
+
+    graph = Graph(flow_id=state["flow_id"], flow_name=state["flow_name"], user_id=state["user_id"])
+    graph.add_nodes_and_edges(state["nodes"], state["edges"], process=False)
+    for key, value in state["graph"].items():
+        setattr(graph, key, value)
+    run_manager = RunnableVerticesManager.from_dict(state["run_manager"])
+    run_manager.cycle_vertices = graph.run_manager.cycle_vertices
+    graph.run_manager = run_manager
+    # The successor map was replaced, so the index built from the fresh one is dropped
+    graph._reachability = None
+    for vertex_id, vertex_state in state["vertices"].items():
+        if (vertex := graph.vertex_map.get(vertex_id)) is not None:
+            for key, value in vertex_state.items():
+                setattr(vertex, key, value)
+    graph.set_run_id(graph._run_id)
+    graph.set_run_name()
+    return graph
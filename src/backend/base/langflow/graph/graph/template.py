@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from langflow.graph.graph.base import Graph
+from langflow.graph.graph.utils import analyze_cycles
+from langflow.processing.process import process_tweaks
+from langflow.services.cache.service import ThreadingInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from langflow.graph.edge.schema import EdgeData
+    from langflow.graph.graph.schema import ExecutionMode
+    from langflow.graph.vertex.param_plan import ParamPlan
+    from langflow.graph.vertex.schema import NodeData
+    from langflow.schema.graph import Tweaks
+
+
+class GraphTemplate:
+    """A compiled flow payload that can be turned into fresh Graph instances.
+
+    Building a Graph from a payload copies it, ungroups group nodes, detects cycles,
+    evaluates the code of every component and resolves the params of every vertex. The
+    template does the parts that only depend on the flow version once, so each instance
+    only has to create its vertices and edges.
+    """
+
+    def __init__(self, payload: dict, *, flow_id: str | None = None, flow_name: str | None = None) -> None:
+        if "data" in payload:
+            payload = payload["data"]
+        if "nodes" not in payload or "edges" not in payload:
+            msg = f"Invalid payload. Expected keys 'nodes' and 'edges'. Found {list(payload.keys())}"
+            raise ValueError(msg)
+        self.flow_id = flow_id
+        self.flow_name = flow_name
+        self.execution_mode: ExecutionMode | None = payload.get("execution_mode")
+        self.nodes: list[NodeData] = copy.deepcopy(payload["nodes"])
+        self.edges: list[EdgeData] = copy.deepcopy(payload["edges"])
+        # Tweaks can target group nodes, which only exist before ungrouping,
+        # so grouped flows are rebuilt from the payload every time.
+        self.has_group_nodes = any(node.get("data", {}).get("node", {}).get("flow") for node in self.nodes)
+        edges = [(edge["data"]["sourceHandle"]["id"], edge["data"]["targetHandle"]["id"]) for edge in self.edges]
+        self.cycle_analysis = analyze_cycles(edges, roots=[node["id"] for node in self.nodes])
+        self.component_classes: dict[str, type] = {}
+        # Filled by the first instance without tweaks, as tweaks change the template of the vertices
+        self.param_plans: dict[str, ParamPlan] = {}
+
+    def instantiate(
+        self,
+        *,
+        user_id: str | None = None,
+        tweaks: Tweaks | dict[str, Any] | None = None,
+        stream: bool = False,
+    ) -> Graph:
+        """Creates a new Graph with fresh vertex state.
+
+        Args:
+            user_id: The user ID.
+            tweaks: Tweaks applied on top of the template. Defaults to None.
+            stream: Whether streaming should be enabled in the components. Only used with tweaks.
+
+        Returns:
+            Graph: A new graph that does not share any vertex with other instances.
+        """
+        graph_data = {"nodes": copy.deepcopy(self.nodes), "edges": copy.deepcopy(self.edges)}
+        if self.execution_mode is not None:
+            graph_data["execution_mode"] = self.execution_mode
+        if tweaks is not None:
+            graph_data = process_tweaks(graph_data, tweaks, stream=stream)
+        if self.has_group_nodes:
+            return Graph.from_payload(graph_data, flow_id=self.flow_id, flow_name=self.flow_name, user_id=user_id)
+
+        graph = Graph(flow_id=self.flow_id, flow_name=self.flow_name, user_id=user_id)
+        graph.execution_mode = self.execution_mode
+        graph._cycle_analysis = self.cycle_analysis
+        graph._component_classes = self.component_classes
+        if tweaks is None:
+            graph._param_plans = self.param_plans
+        graph.add_nodes_and_edges(graph_data["nodes"], graph_data["edges"], process=False)
+        return graph
+
+
+_graph_templates: ThreadingInMemoryCache | None = None
+
+
+def _get_graph_templates_cache() -> ThreadingInMemoryCache | None:
+    global _graph_templates  # noqa: PLW0603
+    max_size = get_settings_service().settings.graph_template_cache_size
+    if not max_size:
+        return None
+    if _graph_templates is None or _graph_templates.max_size != max_size:
+        _graph_templates = ThreadingInMemoryCache(max_size=max_size, expiration_time=None)
+    return _graph_templates
+
+
+def get_graph_template(
+    payload: dict,
+    *,
+    flow_id: str,
+    updated_at: datetime | None,
+    flow_name: str | None = None,
+) -> GraphTemplate:
+    """Returns the compiled template of a flow version, compiling it if it is not cached.
+
+    Templates are kept per worker and keyed by the flow ID and its `updated_at`,
+    so saving the flow makes the next call compile the new version.
+    """
+    cache = _get_graph_templates_cache()
+    if cache is None or updated_at is None:
+        return GraphTemplate(payload, flow_id=flow_id, flow_name=flow_name)
+    key = f"{flow_id}:{updated_at.isoformat()}"
+    template = cache.get(key)
+    if template is CACHE_MISS:
+        logger.debug(f"Compiling graph template for flow {flow_id}")
+        template = GraphTemplate(payload, flow_id=flow_id, flow_name=flow_name)
+        cache.set(key, template)
+    return template
+
+
+def clear_graph_templates() -> None:
+    """Removes all the compiled templates of this worker."""
+    if _graph_templates is not None:
+        _graph_templates.clear()
@@ -1,10 +1,10 @@
 import copy
+import json
 from collections import defaultdict, deque
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 from typing import Any
 
-import networkx as nx
-
 PRIORITY_LIST_OF_INPUTS = ["webhook", "chat"]
 MAX_CYCLE_APPEARANCES = 2
 
@@ -328,77 +328,291 @@ def sort_up_to_vertex(
     return list(visited)
 
 
-def has_cycle(vertex_ids: list[str], edges: list[tuple[str, str]]) -> bool:
-    """Determines whether a directed graph represented by a list of vertices and edges contains a cycle.
+@dataclass
+class CycleAnalysis:
+    """The strongly connected components of a graph and the edges that close its cycles.
+
+    Attributes:
+        components: The strongly connected components, in reverse topological order.
+        cycle_vertices: The vertices that belong to a cycle, including self-loops.
+        cycle_edges: The edges that point back to a vertex on the current DFS path, in the order they are found.
+    """
+
+    components: list[list[Any]]
+    cycle_vertices: set[Any]
+    cycle_edges: list[tuple[Any, Any]]
+
+    @property
+    def is_cyclic(self) -> bool:
+        return bool(self.cycle_vertices)
+
+    def topological_order(self) -> list[Any]:
+        """Returns the vertices in topological order.
+
+        Raises:
+            ValueError: If the graph contains a cycle.
+        """
+        if self.is_cyclic:
+            msg = "Graph contains a cycle, cannot perform topological sort"
+            raise ValueError(msg)
+        return [component[0] for component in reversed(self.components)]
+
+
+def analyze_cycles(edges: list[tuple[Any, Any]], roots: list[Any] | None = None) -> CycleAnalysis:
+    """Finds the strongly connected components and the cycle edges of a directed graph in one pass.
+
+    This is Tarjan's algorithm run with an explicit stack, so deep graphs do not hit the recursion limit.
 
     Args:
-        vertex_ids (list[str]): A list of vertex IDs.
-        edges (list[tuple[str, str]]): A list of tuples representing directed edges between vertices.
+        edges: The directed edges between vertices.
+        roots: The vertices to start the search from, in order. Only vertices reachable from them are
+            analyzed. Defaults to every vertex in the edges.
 
     Returns:
-        bool: True if the graph contains a cycle, False otherwise.
+        CycleAnalysis: The components, cycle vertices and cycle edges.
     """
-    # Build the graph as an adjacency list
-    graph = defaultdict(list)
-    for u, v in edges:
-        graph[u].append(v)
+    adjacency: dict[Any, list[Any]] = defaultdict(list)
+    for source, target in edges:
+        adjacency[source].append(target)
+    if roots is None:
+        roots = list(dict.fromkeys(vertex for edge in edges for vertex in edge))
+
+    index: dict[Any, int] = {}
+    lowlink: dict[Any, int] = {}
+    stack: list[Any] = []
+    on_stack: set[Any] = set()
+    on_path: set[Any] = set()
+    components: list[list[Any]] = []
+    cycle_edges: list[tuple[Any, Any]] = []
+    # The vertices being visited, each with the iterator over its remaining successors
+    work: list[tuple[Any, Iterator[Any]]] = []
+
+    def visit(vertex: Any) -> None:
+        index[vertex] = lowlink[vertex] = len(index)
+        stack.append(vertex)
+        on_stack.add(vertex)
+        on_path.add(vertex)
+        work.append((vertex, iter(adjacency.get(vertex, []))))
+
+    for root in roots:
+        if root in index:
+            continue
+        visit(root)
+        while work:
+            vertex, successors = work[-1]
+            for successor in successors:
+                if successor not in index:
+                    visit(successor)
+                    break
+                if successor in on_path:
+                    cycle_edges.append((vertex, successor))
+                if successor in on_stack:
+                    lowlink[vertex] = min(lowlink[vertex], index[successor])
+            else:
+                work.pop()
+                on_path.discard(vertex)
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[vertex])
+                if lowlink[vertex] == index[vertex]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == vertex:
+                            break
+                    components.append(component)
+
+    cycle_vertices = {
+        vertex
+        for component in components
+        if len(component) > 1 or component[0] in adjacency.get(component[0], [])
+        for vertex in component
+    }
+    return CycleAnalysis(components=components, cycle_vertices=cycle_vertices, cycle_edges=cycle_edges)
 
-    # Utility function to perform DFS
-    def dfs(v, visited, rec_stack) -> bool:
-        visited.add(v)
-        rec_stack.add(v)
 
-        for neighbor in graph[v]:
-            if neighbor not in visited:
-                if dfs(neighbor, visited, rec_stack):
-                    return True
-            elif neighbor in rec_stack:
-                return True
+class ReachabilityIndex:
+    """Precomputed transitive successors and predecessors of every vertex of a directed graph.
 
-        rec_stack.remove(v)
-        return False
+    Each vertex gets a position in topological order of the strongly connected components, and
+    its successors and predecessors are stored as integer bitsets over those positions. Vertices
+    in the same cycle share their reachability, so a vertex is its own successor only when it
+    belongs to a cycle.
+    """
 
-    visited: set[str] = set()
-    rec_stack: set[str] = set()
+    def __init__(self, vertices_ids: list[str], successor_map: dict[str, list[str]]) -> None:
+        edges = [(source, target) for source, targets in successor_map.items() for target in targets]
+        components = analyze_cycles(edges, roots=list(vertices_ids)).components
+        self._ids: list[str] = [vertex_id for component in reversed(components) for vertex_id in component]
+        self._bits: dict[str, int] = {vertex_id: 1 << position for position, vertex_id in enumerate(self._ids)}
+
+        predecessor_map: dict[str, list[str]] = defaultdict(list)
+        for source, target in edges:
+            predecessor_map[target].append(source)
+
+        self._successors = self._build_masks(components, successor_map)
+        self._predecessors = self._build_masks(list(reversed(components)), predecessor_map)
+
+    def _build_masks(self, components: list[list[str]], adjacency: dict[str, list[str]]) -> dict[str, int]:
+        """Builds the reachability bitsets, visiting components so that neighbours are done first."""
+        masks: dict[str, int] = {}
+        for component in components:
+            component_mask = 0
+            for vertex_id in component:
+                component_mask |= self._bits[vertex_id]
+            mask = component_mask if len(component) > 1 else 0
+            for vertex_id in component:
+                for neighbor_id in adjacency.get(vertex_id, []):
+                    mask |= self._bits[neighbor_id] | masks.get(neighbor_id, 0)
+            for vertex_id in component:
+                masks[vertex_id] = mask
+        return masks
+
+    def _decode(self, mask: int) -> list[str]:
+        vertices_ids = []
+        while mask:
+            lowest = mask & -mask
+            vertices_ids.append(self._ids[lowest.bit_length() - 1])
+            mask ^= lowest
+        return vertices_ids
+
+    def _union(self, masks: dict[str, int], vertices_ids: list[str]) -> int:
+        mask = 0
+        for vertex_id in vertices_ids:
+            mask |= self._bits.get(vertex_id, 0) | masks.get(vertex_id, 0)
+        return mask
+
+    def successors(self, vertex_id: str) -> list[str]:
+        """Returns every vertex reachable from `vertex_id`, in topological order."""
+        return self._decode(self._successors.get(vertex_id, 0))
+
+    def predecessors(self, vertex_id: str) -> list[str]:
+        """Returns every vertex that can reach `vertex_id`, in topological order."""
+        return self._decode(self._predecessors.get(vertex_id, 0))
+
+    def downstream(self, vertices_ids: list[str]) -> set[str]:
+        """Returns the given vertices and every vertex reachable from any of them."""
+        return set(self._decode(self._union(self._successors, vertices_ids)))
+
+    def upstream(self, vertices_ids: list[str]) -> set[str]:
+        """Returns the given vertices and every vertex that can reach any of them."""
+        return set(self._decode(self._union(self._predecessors, vertices_ids)))
+
+    def is_upstream(self, source_id: str, target_id: str) -> bool:
+        """Returns whether there is a path from `source_id` to `target_id`."""
+        return bool(self._successors.get(source_id, 0) & self._bits.get(target_id, 0))
+
+
+def get_edge_key(edge: dict[str, Any]) -> tuple[str, str, str, str]:
+    """Returns what identifies an edge: its vertices and the handles it connects."""
+    data = edge.get("data", {})
+    return (
+        edge["source"],
+        edge["target"],
+        json.dumps(data.get("sourceHandle", edge.get("sourceHandle")), sort_keys=True),
+        json.dumps(data.get("targetHandle", edge.get("targetHandle")), sort_keys=True),
+    )
 
-    return any(vertex not in visited and dfs(vertex, visited, rec_stack) for vertex in vertex_ids)
 
+@dataclass
+class GraphDiff:
+    """The structural changes between two versions of the nodes and edges of a graph.
 
-def find_cycle_edge(entry_point: str, edges: list[tuple[str, str]]) -> tuple[str, str]:
-    """Find the edge that causes a cycle in a directed graph starting from a given entry point.
+    Attributes:
+        added_vertices: The IDs of the nodes that only exist in the new version.
+        removed_vertices: The IDs of the nodes that only exist in the old version.
+        changed_vertices: The IDs of the nodes whose data differs between the versions.
+        added_edges: The keys of the edges that only exist in the new version.
+        removed_edges: The keys of the edges that only exist in the old version.
+    """
+
+    added_vertices: list[str] = field(default_factory=list)
+    removed_vertices: list[str] = field(default_factory=list)
+    changed_vertices: list[str] = field(default_factory=list)
+    added_edges: list[tuple[str, str, str, str]] = field(default_factory=list)
+    removed_edges: list[tuple[str, str, str, str]] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.added_vertices
+            or self.removed_vertices
+            or self.changed_vertices
+            or self.added_edges
+            or self.removed_edges
+        )
+
+    @property
+    def is_structural(self) -> bool:
+        """Whether vertices or edges were added or removed, rather than only the data of vertices changed."""
+        return bool(self.added_vertices or self.removed_vertices or self.added_edges or self.removed_edges)
+
+    @property
+    def touched_vertices(self) -> set[str]:
+        """The vertices whose own data or incoming edges changed and that exist in the new version."""
+        touched = {*self.added_vertices, *self.changed_vertices}
+        touched.update(target for _, target, _, _ in [*self.added_edges, *self.removed_edges])
+        return touched - set(self.removed_vertices)
+
+
+def diff_graph_data(
+    old_nodes: list[dict[str, Any]],
+    old_edges: list[dict[str, Any]],
+    new_nodes: list[dict[str, Any]],
+    new_edges: list[dict[str, Any]],
+) -> GraphDiff:
+    """Compares two versions of the nodes and edges of a graph.
+
+    Nodes are matched by ID and only their `data` is compared, so moving a node in the
+    canvas is not a change. Edges are matched by their vertices and handles.
+
+    Returns:
+        GraphDiff: The vertices and edges that were added, removed or changed, in the order of the payloads.
+    """
+    old_nodes_by_id = {node["id"]: node for node in old_nodes}
+    new_nodes_by_id = {node["id"]: node for node in new_nodes}
+    old_edge_keys = {get_edge_key(edge) for edge in old_edges}
+    new_edge_keys = {get_edge_key(edge) for edge in new_edges}
+    return GraphDiff(
+        added_vertices=[node_id for node_id in new_nodes_by_id if node_id not in old_nodes_by_id],
+        removed_vertices=[node_id for node_id in old_nodes_by_id if node_id not in new_nodes_by_id],
+        changed_vertices=[
+            node_id
+            for node_id, node in new_nodes_by_id.items()
+            if node_id in old_nodes_by_id and node.get("data") != old_nodes_by_id[node_id].get("data")
+        ],
+        added_edges=[key for key in map(get_edge_key, new_edges) if key not in old_edge_keys],
+        removed_edges=[key for key in map(get_edge_key, old_edges) if key not in new_edge_keys],
+    )
+
+
+def has_cycle(vertex_ids: list[str], edges: list[tuple[str, str]]) -> bool:
+    """Determines whether a directed graph represented by a list of vertices and edges contains a cycle.
 
     Args:
-        entry_point (str): The vertex ID from which to start the search.
+        vertex_ids (list[str]): A list of vertex IDs.
         edges (list[tuple[str, str]]): A list of tuples representing directed edges between vertices.
 
     Returns:
-        tuple[str, str]: A tuple representing the edge that causes a cycle, or None if no cycle is found.
+        bool: True if the graph contains a cycle, False otherwise.
     """
-    # Build the graph as an adjacency list
-    graph = defaultdict(list)
-    for u, v in edges:
-        graph[u].append(v)
-
-    # Utility function to perform DFS
-    def dfs(v, visited, rec_stack):
-        visited.add(v)
-        rec_stack.add(v)
+    return analyze_cycles(edges, roots=vertex_ids).is_cyclic
 
-        for neighbor in graph[v]:
-            if neighbor not in visited:
-                result = dfs(neighbor, visited, rec_stack)
-                if result:
-                    return result
-            elif neighbor in rec_stack:
-                return (v, neighbor)  # This edge causes the cycle
 
-        rec_stack.remove(v)
-        return None
+def find_cycle_edge(entry_point: str, edges: list[tuple[str, str]]) -> tuple[str, str] | None:
+    """Find the edge that causes a cycle in a directed graph starting from a given entry point.
 
-    visited: set[str] = set()
-    rec_stack: set[str] = set()
+    Args:
+        entry_point (str): The vertex ID from which to start the search.
+        edges (list[tuple[str, str]]): A list of tuples representing directed edges between vertices.
 
-    return dfs(entry_point, visited, rec_stack)
+    Returns:
+        tuple[str, str]: A tuple representing the edge that causes a cycle, or None if no cycle is found.
+    """
+    cycle_edges = analyze_cycles(edges, roots=[entry_point]).cycle_edges
+    return cycle_edges[0] if cycle_edges else None
 
 
 def find_all_cycle_edges(entry_point: str, edges: list[tuple[str, str]]) -> list[tuple[str, str]]:
@@ -411,31 +625,7 @@ def find_all_cycle_edges(entry_point: str, edges: list[tuple[str, str]]) -> list
     Returns:
         list[tuple[str, str]]: A list of tuples representing edges that cause cycles.
     """
-    # Build the graph as an adjacency list
-    graph = defaultdict(list)
-    for u, v in edges:
-        graph[u].append(v)
-
-    # Utility function to perform DFS
-    def dfs(v, visited, rec_stack, cycle_edges):
-        visited.add(v)
-        rec_stack.add(v)
-
-        for neighbor in graph[v]:
-            if neighbor not in visited:
-                dfs(neighbor, visited, rec_stack, cycle_edges)
-            elif neighbor in rec_stack:
-                cycle_edges.append((v, neighbor))  # This edge causes a cycle
-
-        rec_stack.remove(v)
-
-    visited: set[str] = set()
-    rec_stack: set[str] = set()
-    cycle_edges: list[tuple[str, str]] = []
-
-    dfs(entry_point, visited, rec_stack, cycle_edges)
-
-    return cycle_edges
+    return analyze_cycles(edges, roots=[entry_point]).cycle_edges
 
 
 def should_continue(yielded_counts: dict[str, int], max_iterations: int | None) -> bool:
@@ -445,17 +635,7 @@ def should_continue(yielded_counts: dict[str, int], max_iterations: int | None)
 
 
 def find_cycle_vertices(edges):
-    graph = nx.DiGraph(edges)
-
-    # Initialize a set to collect vertices part of any cycle
-    cycle_vertices = set()
-
-    # Utilize the strong component feature in NetworkX to find cycles
-    for component in nx.strongly_connected_components(graph):
-        if len(component) > 1 or graph.has_edge(tuple(component)[0], tuple(component)[0]):  # noqa: RUF015
-            cycle_vertices.update(component)
-
-    return sorted(cycle_vertices)
+    return sorted(analyze_cycles(edges).cycle_vertices)
 
 
 def layered_topological_sort(
@@ -692,6 +872,8 @@ def _sort_single_layer_by_dependency(
         if vertex in dependency_cache:
             return dependency_cache[vertex]
         max_index = index_map[vertex]
+        # Seed the cache so vertices in a cycle do not recurse forever
+        dependency_cache[vertex] = max_index
         for successor in get_vertex_successors(vertex):
             if successor in index_map:
                 max_index = max(max_index, max_dependency_index(successor))
@@ -787,6 +969,7 @@ def get_sorted_vertices(
     get_vertex_successors: Callable[[str], list[str]] | None = None,
     *,
     is_cyclic: bool = False,
+    reachability: ReachabilityIndex | None = None,
 ) -> tuple[list[str], list[list[str]]]:
     """Get sorted vertices in a graph.
 
@@ -803,6 +986,8 @@ def get_sorted_vertices(
         get_vertex_predecessors: Function to get predecessors of a vertex
         get_vertex_successors: Function to get successors of a vertex
         is_cyclic: Whether the graph is cyclic
+        reachability: Precomputed reachability of the graph, used instead of walking it to filter
+            the vertices around the stop or start component
 
     Returns:
         Tuple of (first layer vertices, remaining layer vertices)
@@ -841,7 +1026,13 @@ def get_sorted_vertices(
 
     # If we have a stop component, we need to filter out all vertices
     # that are not predecessors of the stop component
-    if stop_component_id is not None:
+    if stop_component_id is not None and reachability is not None:
+        vertices_set = set(vertices_ids)
+        if stop_component_id in vertices_set:
+            vertices_ids = list(reachability.upstream([stop_component_id]) & vertices_set)
+        else:
+            vertices_ids = []
+    elif stop_component_id is not None:
         filtered_vertices = filter_vertices_up_to_vertex(
             vertices_ids,
             stop_component_id,
@@ -853,7 +1044,14 @@ def get_sorted_vertices(
 
     # If we have a start component, we need to filter out unconnected vertices
     # but keep vertices that are connected to the graph even if not reachable from start
-    if start_component_id is not None:
+    if start_component_id is not None and reachability is not None:
+        vertices_set = set(vertices_ids)
+        if start_component_id in vertices_set:
+            reachable_vertices = reachability.downstream([start_component_id]) & vertices_set
+            vertices_ids = list(reachability.upstream(list(reachable_vertices)) & vertices_set)
+        else:
+            vertices_ids = []
+    elif start_component_id is not None:
         # First get all vertices reachable from start
         reachable_vertices = filter_vertices_from_vertex(
             vertices_ids,
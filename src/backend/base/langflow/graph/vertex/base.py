@@ -14,8 +14,11 @@ import pandas as pd
 from loguru import logger
 
 from langflow.exceptions.component import ComponentBuildError
+from langflow.graph.graph.profiler import profile_span
 from langflow.graph.schema import INPUT_COMPONENTS, OUTPUT_COMPONENTS, InterfaceComponentTypes, ResultData
 from langflow.graph.utils import UnbuiltObject, UnbuiltResult, log_transaction
+from langflow.graph.vertex.param_plan import EdgeParam, ParamPlan
+from langflow.graph.vertex.result_cache import get_vertex_result_cache
 from langflow.interface import initialize
 from langflow.interface.listing import lazy_load_dict
 from langflow.schema.artifact import ArtifactType
@@ -79,6 +82,10 @@ class Vertex:
         self.built_object: Any = UnbuiltObject()
         self.built_result: Any = None
         self.built = False
+        # Set on vertices whose built objects were not kept by a graph snapshot or were released to free memory
+        self.needs_rehydration = False
+        # The user, inputs, files and settings of the last build, so results can be built again the same way
+        self.build_context: dict[str, Any] = {}
         self._successors_ids: list[str] | None = None
         self.artifacts: dict[str, Any] = {}
         self.artifacts_raw: dict[str, Any] = {}
@@ -188,11 +195,11 @@ class Vertex:
 
     @property
     def outgoing_edges(self) -> list[CycleEdge]:
-        return [edge for edge in self.edges if edge.source_id == self.id]
+        return self.graph.get_vertex_edges(self.id, is_target=False)
 
     @property
     def incoming_edges(self) -> list[CycleEdge]:
-        return [edge for edge in self.edges if edge.target_id == self.id]
+        return self.graph.get_vertex_edges(self.id, is_source=False)
 
     @property
     def edges_source_names(self) -> set[str | None]:
@@ -222,6 +229,8 @@ class Vertex:
         self._lock = asyncio.Lock()  # Reinitialize the lock
         self.built_object = state.get("built_object") or UnbuiltObject()
         self.built_result = state.get("built_result") or UnbuiltResult()
+        self.__dict__.setdefault("needs_rehydration", False)
+        self.__dict__.setdefault("build_context", {})
 
     def set_top_level(self, top_level_vertices: list[str]) -> None:
         self.parent_is_top_level = self.parent_node_id in top_level_vertices
@@ -286,7 +295,7 @@ class Vertex:
             raise ValueError(msg)
         return template_dict.get(key, {}).get("value")
 
-    def _set_params_from_normal_edge(self, params: dict, edge: Edge, template_dict: dict):
+    def _get_edge_param(self, edge: Edge, template_dict: dict) -> EdgeParam | None:
         param_key = edge.target_param
 
         # If the param_key is in the template_dict and the edge.target_id is the current node
@@ -294,26 +303,25 @@ class Vertex:
         # don't get overwritten
         if param_key in template_dict and edge.target_id == self.id:
             if template_dict[param_key].get("list"):
-                if param_key not in params:
-                    params[param_key] = []
-                params[param_key].append(self.graph.get_vertex(edge.source_id))
-            elif edge.target_id == self.id:
-                if isinstance(template_dict[param_key].get("value"), dict):
-                    # we don't know the key of the dict but we need to set the value
-                    # to the vertex that is the source of the edge
-                    param_dict = template_dict[param_key]["value"]
-                    if not param_dict or len(param_dict) != 1:
-                        params[param_key] = self.graph.get_vertex(edge.source_id)
-                    else:
-                        params[param_key] = {key: self.graph.get_vertex(edge.source_id) for key in param_dict}
+                return EdgeParam(name=param_key, source_id=edge.source_id, kind="list")
+            if isinstance(template_dict[param_key].get("value"), dict):
+                # we don't know the key of the dict but we need to set the value
+                # to the vertex that is the source of the edge
+                param_dict = template_dict[param_key]["value"]
+                if param_dict and len(param_dict) == 1:
+                    return EdgeParam(name=param_key, source_id=edge.source_id, kind="dict", keys=list(param_dict))
+            return EdgeParam(name=param_key, source_id=edge.source_id)
+        if param_key in self.output_names:
+            return EdgeParam(name=param_key, source_id=edge.source_id)
+        return None
 
-                else:
-                    params[param_key] = self.graph.get_vertex(edge.source_id)
-        elif param_key in self.output_names:
-            params[param_key] = self.graph.get_vertex(edge.source_id)
-        return params
+    def build_param_plan(self) -> ParamPlan:
+        """Resolves the template and the edges of the vertex into a param plan.
 
-    def build_params(self) -> None:
+        The plan holds the static values already converted to their types, the params that
+        come from edges and the fields loaded from the database, so building the params of
+        a vertex with the same template and edges only has to replay it.
+        """
         # sourcery skip: merge-list-append, remove-redundant-if
         # Some params are required, some are optional
         # but most importantly, some params are python base classes
@@ -329,26 +337,20 @@ class Vertex:
         # and use that as the value for the param
         # If the type is "str", then we need to get the value of the "value" key
         # and use that as the value for the param
-
-        if self.graph is None:
-            msg = "Graph not found"
-            raise ValueError(msg)
-
-        if self.updated_raw_params:
-            self.updated_raw_params = False
-            return
-
         template_dict = {key: value for key, value in self.data["node"]["template"].items() if isinstance(value, dict)}
         params: dict = {}
 
+        edge_params = []
         for edge in self.edges:
             if not hasattr(edge, "target_param"):
                 continue
-            params = self._set_params_from_normal_edge(params, edge, template_dict)
+            if edge_param := self._get_edge_param(edge, template_dict):
+                edge_params.append(edge_param)
+        edge_param_names = {edge_param.name for edge_param in edge_params}
 
         load_from_db_fields = []
         for field_name, field in template_dict.items():
-            if field_name in params:
+            if field_name in edge_param_names:
                 continue
             # Skip _type and any value that has show == False and is not code
             # If we don't want to show code but we want to use it
@@ -456,9 +458,21 @@ class Vertex:
                     params[field_name] = field.get("default")
                 else:
                     params.pop(field_name, None)
-        # Add _type to params
+        return ParamPlan(edge_params=edge_params, static_params=params, load_from_db_fields=load_from_db_fields)
+
+    def build_params(self) -> None:
+        if self.graph is None:
+            msg = "Graph not found"
+            raise ValueError(msg)
+
+        if self.updated_raw_params:
+            self.updated_raw_params = False
+            return
+
+        plan = self.graph.get_param_plan(self)
+        params = plan.resolve(self.graph.get_vertex)
         self.params = params
-        self.load_from_db_fields = load_from_db_fields
+        self.load_from_db_fields = list(plan.load_from_db_fields)
         self.raw_params = params.copy()
 
     def update_raw_params(self, new_params: Mapping[str, str | list[str]], *, overwrite: bool = False) -> None:
@@ -500,28 +514,30 @@ class Vertex:
     ) -> None:
         """Initiate the build process."""
         logger.debug(f"Building {self.display_name}")
-        await self._build_each_vertex_in_params_dict()
+        with profile_span(self, "build_params"):
+            await self._build_each_vertex_in_params_dict()
 
         if self.base_type is None:
             msg = f"Base type for vertex {self.display_name} not found"
             raise ValueError(msg)
 
-        if not self.custom_component:
-            custom_component, custom_params = initialize.loading.instantiate_class(
-                user_id=user_id, vertex=self, event_manager=event_manager
+        with profile_span(self, "execution"):
+            if not self.custom_component:
+                custom_component, custom_params = initialize.loading.instantiate_class(
+                    user_id=user_id, vertex=self, event_manager=event_manager
+                )
+            else:
+                custom_component = self.custom_component
+                if hasattr(self.custom_component, "set_event_manager"):
+                    self.custom_component.set_event_manager(event_manager)
+                custom_params = initialize.loading.get_params(self.params)
+
+            await self._build_results(
+                custom_component=custom_component,
+                custom_params=custom_params,
+                fallback_to_env_vars=fallback_to_env_vars,
+                base_type=self.base_type,
             )
-        else:
-            custom_component = self.custom_component
-            if hasattr(self.custom_component, "set_event_manager"):
-                self.custom_component.set_event_manager(event_manager)
-            custom_params = initialize.loading.get_params(self.params)
-
-        await self._build_results(
-            custom_component=custom_component,
-            custom_params=custom_params,
-            fallback_to_env_vars=fallback_to_env_vars,
-            base_type=self.base_type,
-        )
 
         self._validate_built_object()
 
@@ -635,9 +651,82 @@ class Vertex:
         Returns:
             The result of the vertex.
         """
+        if self.needs_rehydration:
+            await self.rehydrate(
+                [
+                    edge.source_handle.name
+                    for edge in self.edges
+                    if edge.target_id == requester.id
+                    and edge.source_handle
+                    and (target_handle_name is None or edge.target_param == target_handle_name)
+                ]
+            )
         async with self._lock:
             return await self._get_result(requester, target_handle_name)
 
+    @property
+    def is_releasable(self) -> bool:
+        """Whether the component declares that its outputs can be built again without side effects."""
+        return bool(getattr(self.custom_component, "releasable", False))
+
+    def _connected_output_names(self) -> set[str]:
+        return {edge.source_handle.name for edge in self.edges if edge.source_id == self.id and edge.source_handle}
+
+    async def rehydrate(self, output_names: list[str] | None = None) -> None:
+        """Recreates the results that a graph snapshot did not keep or that were released to free memory.
+
+        Only the methods of the requested outputs run, with the user, inputs, files and settings of the
+        build that made the results. Vertices that are not components are built again as a whole.
+
+        Args:
+            output_names: The outputs a successor asked for. Defaults to the connected outputs.
+        """
+        context = self.build_context or {"user_id": self.graph.user_id}
+        if self.base_type != "component":
+            self.needs_rehydration = False
+            self.built = False
+            await self.build(**context)
+            self.graph.account_built_objects(self)
+            return
+        async with self._lock:
+            if output_names is None:
+                output_names = list(self._connected_output_names())
+            if missing := [name for name in output_names if name not in self.results]:
+                await self._rebuild_outputs(missing, context)
+            self.needs_rehydration = not self._connected_output_names() <= self.results.keys()
+        self.graph.account_built_objects(self)
+
+    async def _rebuild_outputs(self, output_names: list[str], context: dict[str, Any]) -> None:
+        self._apply_run_inputs(context.get("inputs"), context.get("files"))
+        await self._build_each_vertex_in_params_dict()
+        self.instantiate_component(context.get("user_id"))
+        custom_params = await initialize.loading.update_params_with_load_from_db_fields(
+            self.custom_component,
+            initialize.loading.get_params(self.params),
+            self.load_from_db_fields,
+            fallback_to_env_vars=context.get("fallback_to_env_vars", False),
+        )
+        self.custom_component.set_attributes(custom_params)
+        for name in output_names:
+            result = await self.custom_component._get_output_result(self.custom_component.get_output(name))
+            self.add_result(name, result)
+        # The built object of a component holds the result of each output
+        self.built_object = dict(self.results)
+
+    def release_built_objects(self) -> None:
+        """Drops the objects built by the vertex to free memory.
+
+        The vertex stays built, and the outputs a successor asks for are built again. See `rehydrate`.
+        """
+        self.built_object = UnbuiltObject()
+        self.built_result = UnbuiltResult()
+        self.results = {}
+        self.artifacts = {}
+        self.result = None
+        if hasattr(self.custom_component, "_release_results"):
+            self.custom_component._release_results()
+        self.needs_rehydration = True
+
     async def _log_transaction_async(
         self,
         flow_id: str | UUID,
@@ -658,7 +747,9 @@ class Vertex:
         if self.log_transaction_tasks:
             # Safely await and remove completed tasks
             task = self.log_transaction_tasks.pop()
-            await task
+            # The wait blocks the vertex that requested the result
+            with profile_span(target or source, "result_logging"):
+                await task
 
             # Create and track new task
         task = asyncio.create_task(log_transaction(flow_id, source, status, target, error))
@@ -753,6 +844,15 @@ class Vertex:
         *,
         fallback_to_env_vars=False,
     ) -> None:
+        result_cache = get_vertex_result_cache()
+        memo_key = None
+        if result_cache is not None and result_cache.is_memoizable(self, custom_component):
+            memo_key = result_cache.build_key(self, custom_component, custom_params)
+            if memo_key is not None and (entry := await result_cache.get(memo_key)) is not None:
+                custom_component._output_logs = entry["logs"]
+                self.outputs_logs = entry["outputs_logs"]
+                self._update_built_object_and_artifacts((custom_component, entry["built_object"], entry["artifacts"]))
+                return
         try:
             result = await initialize.loading.get_instance_results(
                 custom_component=custom_component,
@@ -771,6 +871,18 @@ class Vertex:
             msg = f"Error building Component {self.display_name}: \n\n{exc}"
             raise ComponentBuildError(msg, tb) from exc
 
+        if memo_key is not None and isinstance(result, tuple) and len(result) == 3:  # noqa: PLR2004
+            _, built_object, artifacts = result
+            entry = {
+                "built_object": built_object,
+                "artifacts": artifacts,
+                "outputs_logs": self.outputs_logs,
+                "logs": custom_component._output_logs,
+            }
+            await result_cache.set(
+                memo_key, entry, ttl=custom_component.memoize_ttl, max_size=custom_component.memoize_max_size
+            )
+
     def _update_built_object_and_artifacts(self, result: Any | tuple[Any, dict] | tuple[Component, Any, dict]) -> None:
         """Updates the built object and its artifacts."""
         if isinstance(result, tuple):
@@ -805,12 +917,19 @@ class Vertex:
 
     def _reset(self) -> None:
         self.built = False
+        self.needs_rehydration = False
         self.built_object = UnbuiltObject()
         self.built_result = UnbuiltResult()
         self.artifacts = {}
         self.steps_ran = []
         self.build_params()
 
+    def invalidate(self) -> None:
+        """Drops the results of the vertex so the next build runs it again."""
+        self.result = None
+        self.results = {}
+        self._reset()
+
     def _is_chat_input(self) -> bool:
         return False
 
@@ -841,25 +960,15 @@ class Vertex:
                 # This means that the vertex has already been built
                 # and we are just getting the result for the requester
                 return await self.get_requester_result(requester)
-            self._reset()
-            # inject session_id if it is not None
-            if inputs is not None and "session" in inputs and inputs["session"] is not None and self.has_session_id:
-                session_id_value = self.get_value_from_template_dict("session_id")
-                if session_id_value == "":
-                    self.update_raw_params({"session_id": inputs["session"]}, overwrite=True)
-            if self._is_chat_input() and (inputs or files):
-                chat_input = {}
-                if (
-                    inputs
-                    and isinstance(inputs, dict)
-                    and "input_value" in inputs
-                    and inputs.get("input_value") is not None
-                ):
-                    chat_input.update({"input_value": inputs.get(INPUT_FIELD_NAME, "")})
-                if files:
-                    chat_input.update({"files": files})
-
-                self.update_raw_params(chat_input, overwrite=True)
+            with profile_span(self, "build_params"):
+                self._reset()
+            self.build_context = {
+                "user_id": user_id,
+                "inputs": inputs,
+                "files": files,
+                "fallback_to_env_vars": kwargs.get("fallback_to_env_vars", False),
+            }
+            self._apply_run_inputs(inputs, files)
 
             # Run steps
             for step in self.steps:
@@ -867,10 +976,31 @@ class Vertex:
                     await step(user_id=user_id, event_manager=event_manager, **kwargs)
                     self.steps_ran.append(step)
 
-            self.finalize_build()
+            with profile_span(self, "result_logging"):
+                self.finalize_build()
 
         return await self.get_requester_result(requester)
 
+    def _apply_run_inputs(self, inputs: dict[str, Any] | None, files: list[str] | None) -> None:
+        # inject session_id if it is not None
+        if inputs is not None and "session" in inputs and inputs["session"] is not None and self.has_session_id:
+            session_id_value = self.get_value_from_template_dict("session_id")
+            if session_id_value == "":
+                self.update_raw_params({"session_id": inputs["session"]}, overwrite=True)
+        if self._is_chat_input() and (inputs or files):
+            chat_input = {}
+            if (
+                inputs
+                and isinstance(inputs, dict)
+                and "input_value" in inputs
+                and inputs.get("input_value") is not None
+            ):
+                chat_input.update({"input_value": inputs.get(INPUT_FIELD_NAME, "")})
+            if files:
+                chat_input.update({"files": files})
+
+            self.update_raw_params(chat_input, overwrite=True)
+
     async def get_requester_result(self, requester: Vertex | None):
         # If the requester is None, this means that
         # the Vertex is the root of the graph
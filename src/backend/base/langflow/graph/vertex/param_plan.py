@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from langflow.graph.vertex.base import Vertex
+
+
+@dataclass
+class EdgeParam:
+    """A param whose value is the vertex at the source of an edge.
+
+    Attributes:
+        name: The name of the param.
+        source_id: The ID of the source vertex.
+        kind: "list" appends the vertex to a list, "dict" maps each of `keys` to the vertex
+            and "vertex" uses the vertex as the value.
+        keys: The keys of the dict when `kind` is "dict".
+    """
+
+    name: str
+    source_id: str
+    kind: Literal["list", "dict", "vertex"] = "vertex"
+    keys: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ParamPlan:
+    """The resolved params of a vertex, split into what depends on the graph instance and what does not.
+
+    A plan only depends on the template and the edges of a vertex, so it can be built once and replayed
+    for every graph created from the same flow version.
+
+    Attributes:
+        edge_params: The params that take a vertex of the graph, in edge order.
+        static_params: The params whose values come from the template, already converted to their types.
+        load_from_db_fields: The fields whose values are loaded from the database variables.
+    """
+
+    edge_params: list[EdgeParam] = field(default_factory=list)
+    static_params: dict[str, Any] = field(default_factory=dict)
+    load_from_db_fields: list[str] = field(default_factory=list)
+
+    def resolve(self, get_vertex: Callable[[str], Vertex]) -> dict[str, Any]:
+        """Builds the params dict of a vertex.
+
+        Args:
+            get_vertex: Returns the vertex of the graph instance with the given ID.
+
+        Returns:
+            dict: The params. Mutable values are copied, so the plan can be shared between graphs.
+        """
+        params: dict[str, Any] = {}
+        for edge_param in self.edge_params:
+            source = get_vertex(edge_param.source_id)
+            if edge_param.kind == "list":
+                params.setdefault(edge_param.name, []).append(source)
+            elif edge_param.kind == "dict":
+                params[edge_param.name] = dict.fromkeys(edge_param.keys, source)
+            else:
+                params[edge_param.name] = source
+        for name, value in self.static_params.items():
+            params[name] = copy.deepcopy(value) if isinstance(value, list | dict | pd.DataFrame) else value
+        return params
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import pickle
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import pandas as pd
+from loguru import logger
+from pydantic import BaseModel
+
+from langflow.schema.message import Message
+from langflow.services.cache.base import AsyncBaseCacheService
+from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.deps import get_cache_service, get_settings_service
+
+if TYPE_CHECKING:
+    from langflow.custom import Component
+    from langflow.graph.vertex.base import Vertex
+    from langflow.services.cache.base import CacheService
+
+KEY_PREFIX = "vertex_result"
+
+# Message fields that change on every build without changing what the message means
+_VOLATILE_MESSAGE_FIELDS = {"timestamp"}
+
+
+class UnhashableValueError(TypeError):
+    """Raised when a value cannot be turned into a stable fingerprint."""
+
+
+def fingerprint(value: Any) -> Any:
+    """Converts a value into a JSON-compatible structure that only depends on its content.
+
+    Raises:
+        UnhashableValueError: If the value (or a nested value) has no stable content representation,
+            like model clients, iterators or arbitrary objects.
+    """
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, bytes):
+        return hashlib.sha256(value).hexdigest()
+    if isinstance(value, Enum):
+        return fingerprint(value.value)
+    if isinstance(value, Decimal | UUID | datetime | date):
+        return str(value)
+    if isinstance(value, dict):
+        return {str(key): fingerprint(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [fingerprint(item) for item in value]
+    if isinstance(value, set | frozenset):
+        return sorted((fingerprint(item) for item in value), key=repr)
+    if isinstance(value, pd.DataFrame):
+        return value.to_json(orient="split", date_format="iso", default_handler=_raise_unhashable)
+    if isinstance(value, Message):
+        fields = {field: getattr(value, field) for field in type(value).model_fields}
+        fields["data"] = {key: item for key, item in value.data.items() if key not in _VOLATILE_MESSAGE_FIELDS}
+        for field in _VOLATILE_MESSAGE_FIELDS:
+            fields.pop(field, None)
+        return {"__type__": type(value).__name__, **fingerprint(fields)}
+    if isinstance(value, BaseModel):
+        fields = {field: getattr(value, field) for field in type(value).model_fields}
+        return {"__type__": type(value).__name__, **fingerprint(fields)}
+    msg = f"Cannot fingerprint value of type {type(value).__name__}"
+    raise UnhashableValueError(msg)
+
+
+def _raise_unhashable(value: Any) -> Any:
+    msg = f"Cannot fingerprint value of type {type(value).__name__}"
+    raise UnhashableValueError(msg)
+
+
+@dataclass
+class VertexResultCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    skipped: int = 0
+    expired: int = 0
+
+
+class VertexResultCache:
+    """Memoizes the results of deterministic vertices by the content they were built from.
+
+    Entries are stored in the cache service under a hash of the component code, the outputs
+    the vertex builds, its resolved params and the results of its upstream vertices. Each entry
+    carries its own expiry so components can have different TTLs on top of a single cache backend.
+    """
+
+    def __init__(
+        self,
+        cache_service: CacheService | AsyncBaseCacheService,
+        *,
+        ttl: int,
+        max_entry_size: int,
+    ) -> None:
+        self.cache_service = cache_service
+        self.ttl = ttl
+        self.max_entry_size = max_entry_size
+        self.stats = VertexResultCacheStats()
+
+    @staticmethod
+    def is_memoizable(vertex: Vertex, component: Component) -> bool:
+        """Returns whether the results of the vertex can be shared with other builds."""
+        if not getattr(component, "memoize", False):
+            return False
+        # Values loaded from the database depend on the user building the flow
+        if vertex.load_from_db_fields:
+            return False
+        return vertex.id not in vertex.graph.cycle_vertices
+
+    @staticmethod
+    def upstream_results(vertex: Vertex) -> list[tuple[str | None, Any]]:
+        """Returns the results the vertex receives through its incoming edges, by target field."""
+        results = []
+        for edge in vertex.incoming_edges:
+            source = vertex.graph.get_vertex(edge.source_id)
+            if edge.source_handle.name in source.results:
+                result = source.results[edge.source_handle.name]
+            else:
+                result = source.built_result if source.use_result else source.built_object
+            results.append((edge.target_handle.field_name, result))
+        return results
+
+    @classmethod
+    def build_key(cls, vertex: Vertex, component: Component, params: dict) -> str | None:
+        """Returns the content hash of a build, or None if its inputs cannot be fingerprinted."""
+        outputs = sorted({edge.source_handle.name for edge in vertex.outgoing_edges}) or ["*"]
+        try:
+            upstream = sorted(
+                ([field, fingerprint(result)] for field, result in cls.upstream_results(vertex)),
+                key=lambda item: json.dumps(item, sort_keys=True),
+            )
+            content = json.dumps(
+                {
+                    "code": component._code,
+                    "outputs": outputs,
+                    "params": fingerprint({key: value for key, value in params.items() if key != "code"}),
+                    "upstream": upstream,
+                },
+                sort_keys=True,
+            )
+        except (UnhashableValueError, TypeError, ValueError) as exc:
+            logger.debug(f"Not memoizing {vertex.id}: {exc}")
+            return None
+        return f"{KEY_PREFIX}:{hashlib.sha256(content.encode()).hexdigest()}"
+
+    async def get(self, key: str) -> dict | None:
+        """Returns the stored entry for the key, counting hits and misses."""
+        if isinstance(self.cache_service, AsyncBaseCacheService):
+            value = await self.cache_service.get(key)
+        else:
+            value = await asyncio.to_thread(self.cache_service.get, key)
+        if value is CACHE_MISS or not isinstance(value, dict):
+            self.stats.misses += 1
+            return None
+        if value["expires_at"] < time.time():
+            self.stats.expired += 1
+            self.stats.misses += 1
+            return None
+        try:
+            entry = pickle.loads(value["data"])  # noqa: S301
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("Error loading memoized vertex result")
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return entry
+
+    async def set(self, key: str, entry: dict, *, ttl: int | None = None, max_size: int | None = None) -> bool:
+        """Stores an entry if it can be pickled and fits in the size budget.
+
+        Returns:
+            bool: True if the entry was stored.
+        """
+        max_size = self.max_entry_size if max_size is None else max_size
+        try:
+            data = pickle.dumps(entry)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("Memoized vertex result cannot be pickled")
+            self.stats.skipped += 1
+            return False
+        if len(data) > max_size:
+            self.stats.skipped += 1
+            return False
+        value = {"data": data, "expires_at": time.time() + (self.ttl if ttl is None else ttl)}
+        if isinstance(self.cache_service, AsyncBaseCacheService):
+            await self.cache_service.set(key, value)
+        else:
+            await asyncio.to_thread(self.cache_service.set, key, value)
+        self.stats.stores += 1
+        return True
+
+
+_vertex_result_cache: VertexResultCache | None = None
+
+
+def get_vertex_result_cache() -> VertexResultCache | None:
+    """Returns the vertex result cache, or None if memoization is disabled."""
+    global _vertex_result_cache  # noqa: PLW0603
+    settings = get_settings_service().settings
+    if not settings.vertex_result_cache_enabled:
+        return None
+    if _vertex_result_cache is None:
+        _vertex_result_cache = VertexResultCache(
+            get_cache_service(),
+            ttl=settings.vertex_result_cache_ttl,
+            max_entry_size=settings.vertex_result_cache_max_entry_size,
+        )
+    return _vertex_result_cache
+
+
+def get_vertex_result_cache_stats() -> dict[str, int | float]:
+    """Returns the hit, miss and store counters of the vertex result cache and its hit ratio."""
+    stats = asdict(_vertex_result_cache.stats if _vertex_result_cache is not None else VertexResultCacheStats())
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+    return stats
@@ -9,6 +9,8 @@ from pydantic.v1 import BaseModel, Field, create_model
 from sqlmodel import select
 
 from langflow.schema.schema import INPUT_FIELD_NAME
+from langflow.services.cache.service import ThreadingInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS
 from langflow.services.database.models.flow import Flow
 from langflow.services.database.models.flow.model import FlowRead
 from langflow.services.deps import get_settings_service, session_scope
@@ -17,6 +19,7 @@ if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
     from langflow.graph.graph.base import Graph
+    from langflow.graph.graph.template import GraphTemplate
     from langflow.graph.schema import RunOutputs
     from langflow.graph.vertex.base import Vertex
     from langflow.schema import Data
@@ -47,9 +50,6 @@ async def list_flows(*, user_id: str | None = None) -> list[Data]:
 async def load_flow(
     user_id: str, flow_id: str | None = None, flow_name: str | None = None, tweaks: dict | None = None
 ) -> Graph:
-    from langflow.graph.graph.base import Graph
-    from langflow.processing.process import process_tweaks
-
     if not flow_id and not flow_name:
         msg = "Flow ID or Flow Name is required"
         raise ValueError(msg)
@@ -59,14 +59,58 @@ async def load_flow(
             msg = f"Flow {flow_name} not found"
             raise ValueError(msg)
 
+    template = await get_subflow_template(flow_id)
+    return template.instantiate(user_id=user_id, tweaks=tweaks or None)
+
+
+_subflow_cache: ThreadingInMemoryCache | None = None
+
+
+def _get_subflow_cache() -> ThreadingInMemoryCache | None:
+    global _subflow_cache  # noqa: PLW0603
+    settings = get_settings_service().settings
+    if not settings.subflow_cache_size:
+        return None
+    if _subflow_cache is None or _subflow_cache.max_size != settings.subflow_cache_size:
+        _subflow_cache = ThreadingInMemoryCache(
+            max_size=settings.subflow_cache_size, expiration_time=settings.subflow_cache_ttl
+        )
+    return _subflow_cache
+
+
+async def get_subflow_template(flow_id: str | UUID) -> GraphTemplate:
+    """Returns the compiled template of the saved version of a flow, loading it from the database if it is not cached.
+
+    Templates are keyed by the flow ID and its `updated_at`, which is looked up on every call, so saving a
+    flow on any worker makes the next run load the new version. The template of each version is compiled
+    once, so components that run the same flow many times only pay for creating the vertices of each new graph.
+    """
+    from langflow.graph.graph.template import get_graph_template
+
+    cache = _get_subflow_cache()
+    key = None
+    if cache is not None:
+        async with session_scope() as session:
+            uuid_flow_id = UUID(flow_id) if isinstance(flow_id, str) else flow_id
+            version = (await session.exec(select(Flow.id, Flow.updated_at).where(Flow.id == uuid_flow_id))).first()
+        if version is None:
+            msg = f"Flow {flow_id} not found"
+            raise ValueError(msg)
+        _, updated_at = version
+        if updated_at is not None:
+            key = f"{flow_id}:{updated_at.isoformat()}"
+            if (template := cache.get(key)) is not CACHE_MISS:
+                return template
+
     async with session_scope() as session:
-        graph_data = flow.data if (flow := await session.get(Flow, flow_id)) else None
-    if not graph_data:
+        flow = await session.get(Flow, flow_id)
+    if not flow or not flow.data:
         msg = f"Flow {flow_id} not found"
         raise ValueError(msg)
-    if tweaks:
-        graph_data = process_tweaks(graph_data=graph_data, tweaks=tweaks)
-    return Graph.from_payload(graph_data, flow_id=flow_id, user_id=user_id)
+    template = get_graph_template(flow.data, flow_id=str(flow.id), updated_at=flow.updated_at, flow_name=flow.name)
+    if key is not None and flow.updated_at == updated_at:
+        cache.set(key, template)
+    return template
 
 
 async def find_flow(flow_name: str, user_id: str) -> str | None:
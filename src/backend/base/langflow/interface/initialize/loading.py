@@ -36,7 +36,10 @@ def instantiate_class(
 
     custom_params = get_params(vertex.params)
     code = custom_params.pop("code")
-    class_object: type[CustomComponent | Component] = eval_custom_component_code(code)
+    if vertex.graph is not None:
+        class_object: type[CustomComponent | Component] = vertex.graph.get_component_class(code)
+    else:
+        class_object = eval_custom_component_code(code)
     custom_component: CustomComponent | Component = class_object(
         _user_id=user_id,
         _parameters=custom_params,
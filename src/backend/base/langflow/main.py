@@ -39,6 +39,7 @@ from langflow.services.email.service import get_email_service
 from langflow.services.utils import initialize_services, teardown_services
 from langflow.services.manager import service_manager
 from langflow.services.schema import ServiceType
+from langflow.utils.executors import shutdown_executor_pools
 
 if TYPE_CHECKING:
     from tempfile import TemporaryDirectory
@@ -231,6 +232,7 @@ def get_lifespan(*, fix_migration=False, version=None):
                 logger.error(f"Failed to stop billing cycle manager: {exc}")
                 
             await teardown_services()
+            shutdown_executor_pools()
             await logger.complete()
             temp_dir_cleanups = [asyncio.to_thread(temp_dir.cleanup) for temp_dir in temp_dirs]
             await asyncio.gather(*temp_dir_cleanups)
@@ -1,9 +1,10 @@
 import abc
 import asyncio
 import threading
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from langflow.services.base import Service
+from langflow.services.cache.metrics import CacheMetrics
 
 LockType = TypeVar("LockType", bound=threading.Lock)
 AsyncLockType = TypeVar("AsyncLockType", bound=asyncio.Lock)
@@ -13,6 +14,11 @@ class CacheService(Service, Generic[LockType]):
     """Abstract base class for a cache."""
 
     name = "cache_service"
+    metrics: CacheMetrics | None = None
+
+    def get_metrics(self) -> dict[str, dict[str, Any]]:
+        """Returns the hits, misses, writes, sizes and operation latencies of the cache for each key namespace."""
+        return self.metrics.snapshot() if self.metrics is not None else {}
 
     @abc.abstractmethod
     def get(self, key, lock: LockType | None = None):
@@ -111,6 +117,11 @@ class AsyncBaseCacheService(Service, Generic[AsyncLockType]):
     """Abstract base class for a async cache."""
 
     name = "cache_service"
+    metrics: CacheMetrics | None = None
+
+    def get_metrics(self) -> dict[str, dict[str, Any]]:
+        """Returns the hits, misses, writes, sizes and operation latencies of the cache for each key namespace."""
+        return self.metrics.snapshot() if self.metrics is not None else {}
 
     @abc.abstractmethod
     async def get(self, key, lock: AsyncLockType | None = None):
@@ -0,0 +1,61 @@
+import zlib
+from typing import Literal
+
+CompressionAlgorithm = Literal["none", "zlib", "zstd", "lz4"]
+
+DEFAULT_COMPRESSION_THRESHOLD = 64 * 1024
+# Pickled values start with the PROTO opcode (0x80), so a marker byte can't be mistaken for a value
+_MARKERS = {"zlib": b"Z", "zstd": b"S", "lz4": b"L"}
+_ALGORITHMS = {marker: algorithm for algorithm, marker in _MARKERS.items()}
+_PACKAGES = {"zstd": "zstandard", "lz4": "lz4"}
+
+
+def _import_codec(algorithm: str):
+    try:
+        if algorithm == "zstd":
+            import zstandard
+
+            return zstandard.ZstdCompressor().compress, zstandard.ZstdDecompressor().decompress
+        if algorithm == "lz4":
+            import lz4.frame
+
+            return lz4.frame.compress, lz4.frame.decompress
+    except ImportError as exc:
+        msg = f"Compressing cache values with {algorithm} requires the {_PACKAGES[algorithm]} package."
+        raise ImportError(msg) from exc
+    return (lambda data: zlib.compress(data, level=1)), zlib.decompress
+
+
+class ValueCompressor:
+    """Compresses the serialized values stored in a remote cache.
+
+    Values smaller than the threshold, and values that do not get smaller, are stored as they are.
+    Compressed values start with a marker of their algorithm, so values written with another
+    algorithm can still be read.
+
+    Args:
+        algorithm: The compression algorithm, or 'none' to store values as they are.
+        threshold: The size in bytes from which values are compressed.
+    """
+
+    def __init__(
+        self, algorithm: CompressionAlgorithm = "none", threshold: int = DEFAULT_COMPRESSION_THRESHOLD
+    ) -> None:
+        self.algorithm = algorithm
+        self.threshold = threshold
+        self._codecs: dict[str, tuple] = {}
+        if algorithm != "none":
+            self._codecs[algorithm] = _import_codec(algorithm)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.algorithm == "none" or len(data) < self.threshold:
+            return data
+        compressed = _MARKERS[self.algorithm] + self._codecs[self.algorithm][0](data)
+        return compressed if len(compressed) < len(data) else data
+
+    def decompress(self, data: bytes) -> bytes:
+        if (algorithm := _ALGORITHMS.get(data[:1])) is None:
+            return data
+        if algorithm not in self._codecs:
+            self._codecs[algorithm] = _import_codec(algorithm)
+        return self._codecs[algorithm][1](data[1:])
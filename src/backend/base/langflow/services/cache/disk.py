@@ -7,6 +7,7 @@ from diskcache import Cache
 from loguru import logger
 
 from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType
+from langflow.services.cache.metrics import CacheMetrics
 from langflow.services.cache.utils import CACHE_MISS
 
 
@@ -22,13 +23,17 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         self.lock = asyncio.Lock()
         self.max_size = max_size
         self.expiration_time = expiration_time
+        self.metrics = CacheMetrics()
 
     async def get(self, key, lock: asyncio.Lock | None = None):
+        start = time.perf_counter()
         if not lock:
             async with self.lock:
-                return await asyncio.to_thread(self._get, key)
+                value = await asyncio.to_thread(self._get, key)
         else:
-            return await asyncio.to_thread(self._get, key)
+            value = await asyncio.to_thread(self._get, key)
+        self.metrics.record("get", key, time.perf_counter() - start, hit=value is not CACHE_MISS)
+        return value
 
     def _get(self, key):
         item = self.cache.get(key, default=None)
@@ -41,24 +46,30 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         return CACHE_MISS
 
     async def set(self, key, value, lock: asyncio.Lock | None = None) -> None:
+        start = time.perf_counter()
         if not lock:
             async with self.lock:
-                await self._set(key, value)
+                size = await self._set(key, value)
         else:
-            await self._set(key, value)
+            size = await self._set(key, value)
+        self.metrics.record("set", key, time.perf_counter() - start, size=size)
 
-    async def _set(self, key, value) -> None:
+    async def _set(self, key, value) -> int:
+        """Stores a value, returning the bytes of the stored value."""
         if self.max_size and len(self.cache) >= self.max_size:
             await asyncio.to_thread(self.cache.cull)
         item = {"value": pickle.dumps(value) if not isinstance(value, str | bytes) else value, "time": time.time()}
         await asyncio.to_thread(self.cache.set, key, item)
+        return len(item["value"])
 
     async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
+        start = time.perf_counter()
         if not lock:
             async with self.lock:
                 await self._delete(key)
         else:
             await self._delete(key)
+        self.metrics.record("delete", key, time.perf_counter() - start)
 
     async def _delete(self, key) -> None:
         await asyncio.to_thread(self.cache.delete, key)
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+from typing import TYPE_CHECKING, Any, Literal
+
+from langflow.utils.memory import estimate_size
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+
+EvictionPolicy = Literal["lru", "tinylfu"]
+
+DEFAULT_NAMESPACE = "default"
+# The key prefixes of the services that use the cache: ChatService, SessionService and the vertex result cache
+KNOWN_NAMESPACES = frozenset({"graph", "session", "vertex_result"})
+# The share of a budget W-TinyLFU keeps for new entries, as in Caffeine
+WINDOW_RATIO = 0.01
+_MAX_FREQUENCY = 15
+
+
+def get_key_namespace(key: Hashable, namespaces: Iterable[str]) -> str:
+    """Returns the namespace of a cache key: the text before its first colon, if it is one of `namespaces`."""
+    if isinstance(key, str):
+        prefix, separator, _ = key.partition(":")
+        if separator and prefix in namespaces:
+            return prefix
+    return DEFAULT_NAMESPACE
+
+
+class FrequencySketch:
+    """Estimates how often keys were used recently in a fixed amount of memory.
+
+    It is a count-min sketch with counters capped at 15. Every time the number of uses counted
+    reaches ten times the width, the counters are halved, so older uses weigh less.
+    """
+
+    def __init__(self, width: int = 4096, depth: int = 4) -> None:
+        self.width = 1 << (max(width, 2) - 1).bit_length()
+        self._mask = self.width - 1
+        self._rows = [bytearray(self.width) for _ in range(depth)]
+        self._sample_size = 10 * self.width
+        self._additions = 0
+
+    def _indexes(self, key: Hashable):
+        key_hash = hash(key)
+        for row in range(len(self._rows)):
+            yield row, hash((row, key_hash)) & self._mask
+
+    def increment(self, key: Hashable) -> None:
+        for row, index in self._indexes(key):
+            if self._rows[row][index] < _MAX_FREQUENCY:
+                self._rows[row][index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._age()
+
+    def frequency(self, key: Hashable) -> int:
+        return min(self._rows[row][index] for row, index in self._indexes(key))
+
+    def _age(self) -> None:
+        for row in self._rows:
+            row[:] = bytes(count >> 1 for count in row)
+        self._additions //= 2
+
+    def clear(self) -> None:
+        for row in self._rows:
+            row[:] = bytes(self.width)
+        self._additions = 0
+
+
+class _Segment:
+    """The entries of one namespace.
+
+    With LRU, all entries are in `main`. With W-TinyLFU, new entries go to `window` first and the
+    entries pushed out of it only replace the least recently used entries of `main` if they were
+    used more often.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None,
+        max_bytes: int | None,
+        sketch: FrequencySketch | None,
+        evictions: Counter[str],
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sketch = sketch
+        # The evictions of the namespaces of the entries, shared by the segments of the store
+        self.evictions = evictions
+        self.window: OrderedDict[Hashable, dict] = OrderedDict()
+        self.main: OrderedDict[Hashable, dict] = OrderedDict()
+        self.window_bytes = 0
+        self.main_bytes = 0
+        self.window_max_entries = max(1, int(max_entries * WINDOW_RATIO)) if max_entries else None
+        self.window_max_bytes = max(1, int(max_bytes * WINDOW_RATIO)) if max_bytes else None
+
+    @property
+    def bytes(self) -> int:
+        return self.window_bytes + self.main_bytes
+
+    def __len__(self) -> int:
+        return len(self.window) + len(self.main)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.main or key in self.window
+
+    def get(self, key: Hashable) -> dict | None:
+        if self.sketch is not None:
+            self.sketch.increment(key)
+        for region in (self.main, self.window):
+            if (item := region.get(key)) is not None:
+                region.move_to_end(key)
+                return item
+        return None
+
+    def pop(self, key: Hashable) -> dict | None:
+        if (item := self.main.pop(key, None)) is not None:
+            self.main_bytes -= item["size"]
+        elif (item := self.window.pop(key, None)) is not None:
+            self.window_bytes -= item["size"]
+        return item
+
+    def put(self, key: Hashable, item: dict) -> bool:
+        if self.sketch is not None:
+            self.sketch.increment(key)
+        in_main = key in self.main
+        self.pop(key)
+        if self.max_bytes is not None and item["size"] > self.max_bytes:
+            self.evictions[item["namespace"]] += 1
+            return False
+        # Entries W-TinyLFU already admitted stay in the main region when they are updated
+        if self.sketch is None or in_main:
+            self.main[key] = item
+            self.main_bytes += item["size"]
+        else:
+            self.window[key] = item
+            self.window_bytes += item["size"]
+        self._evict(key)
+        return True
+
+    def _over(self, entries: int, size: int, max_entries: int | None, max_bytes: int | None) -> bool:
+        return (max_entries is not None and entries > max_entries) or (max_bytes is not None and size > max_bytes)
+
+    def _evict(self, newest: Hashable) -> None:
+        if self.sketch is not None:
+            # The newest entry stays in the window even if it is larger than the window
+            while len(self.window) > 1 and self._over(
+                len(self.window), self.window_bytes, self.window_max_entries, self.window_max_bytes
+            ):
+                key, item = self.window.popitem(last=False)
+                self.window_bytes -= item["size"]
+                self._admit(key, item)
+        for region in (self.main, self.window):
+            while region and self._over(len(self), self.bytes, self.max_entries, self.max_bytes):
+                if next(iter(region)) == newest:
+                    break
+                self._evict_oldest(region)
+
+    def _admit(self, key: Hashable, item: dict) -> None:
+        """Moves an entry out of the window, if it was used more often than the entries it replaces."""
+        max_entries = self.max_entries - self.window_max_entries if self.max_entries else None
+        max_bytes = self.max_bytes - self.window_max_bytes if self.max_bytes else None
+        while self.main and self._over(len(self.main) + 1, self.main_bytes + item["size"], max_entries, max_bytes):
+            victim = next(iter(self.main))
+            if self.sketch.frequency(key) <= self.sketch.frequency(victim):
+                self.evictions[item["namespace"]] += 1
+                return
+            self._evict_oldest(self.main)
+        self.main[key] = item
+        self.main_bytes += item["size"]
+
+    def _evict_oldest(self, region: OrderedDict[Hashable, dict]) -> None:
+        _, item = region.popitem(last=False)
+        if region is self.main:
+            self.main_bytes -= item["size"]
+        else:
+            self.window_bytes -= item["size"]
+        self.evictions[item["namespace"]] += 1
+
+
+class BoundedStore:
+    """The entries of an in-memory cache, bounded by count and by estimated size.
+
+    Keys whose prefix before the first colon has a budget in `namespace_budgets`, like
+    'graph:<flow_id>', are kept apart from the other keys and only evict entries of their own
+    namespace. The other keys share `max_bytes`. Each entry is a dictionary with the cached
+    `value`, its estimated `size` and its `namespace`; sizes are only estimated for namespaces with
+    a byte budget. The stats are kept for the known namespaces even if they have no budget.
+
+    Args:
+        max_size: The maximum number of entries of each namespace, or None for no limit.
+        max_bytes: The bytes the entries of keys without a namespace budget can take, or None for no limit.
+        namespace_budgets: The bytes the entries of each namespace can take.
+        policy: 'lru' evicts the least recently used entries. 'tinylfu' (W-TinyLFU) keeps new entries
+            in a small window and then only keeps them over entries that were used less often, so
+            entries used once do not push out the ones used again and again.
+        sizer: Returns the estimated bytes of a value.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        max_bytes: int | None = None,
+        namespace_budgets: dict[str, int] | None = None,
+        policy: EvictionPolicy = "lru",
+        sizer: Callable[[Any], int] = estimate_size,
+    ) -> None:
+        if policy not in {"lru", "tinylfu"}:
+            msg = f"Unknown eviction policy: {policy}"
+            raise ValueError(msg)
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.namespace_budgets = dict(namespace_budgets or {})
+        self.policy = policy
+        self.sizer = sizer
+        self.namespaces = KNOWN_NAMESPACES | set(self.namespace_budgets)
+        self._sketch = FrequencySketch() if policy == "tinylfu" else None
+        self._segments: dict[str, _Segment] = {}
+        self._evictions: Counter[str] = Counter()
+
+    def _segment(self, key: Hashable) -> _Segment:
+        namespace = get_key_namespace(key, self.namespace_budgets)
+        if (segment := self._segments.get(namespace)) is None:
+            max_bytes = self.namespace_budgets.get(namespace, self.max_bytes)
+            segment = self._segments[namespace] = _Segment(
+                self.max_size or None, max_bytes, self._sketch, self._evictions
+            )
+        return segment
+
+    def get(self, key: Hashable) -> dict | None:
+        """Returns the entry of a key and marks it as used."""
+        return self._segment(key).get(key)
+
+    def put(self, key: Hashable, item: dict) -> bool:
+        """Stores an entry, evicting others to make room.
+
+        Returns:
+            bool: False if the entry is larger than the budget of its namespace and was not stored.
+        """
+        segment = self._segment(key)
+        size = self.sizer(item["value"]) if segment.max_bytes is not None else 0
+        return segment.put(key, {**item, "size": size, "namespace": get_key_namespace(key, self.namespaces)})
+
+    def delete(self, key: Hashable) -> bool:
+        return self._segment(key).pop(key) is not None
+
+    def clear(self) -> None:
+        self._segments.clear()
+        if self._sketch is not None:
+            self._sketch.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._segment(key)
+
+    def __len__(self) -> int:
+        return sum(len(segment) for segment in self._segments.values())
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Returns the number of entries, estimated bytes and evictions of each namespace."""
+        stats: dict[str, dict[str, int]] = {}
+        # The gauges are read from another thread, so the segments and entries are copied in one step
+        for segment in list(self._segments.values()):
+            for region in (segment.window, segment.main):
+                for item in list(region.values()):
+                    namespace_stats = stats.setdefault(item["namespace"], {"entries": 0, "bytes": 0, "evictions": 0})
+                    namespace_stats["entries"] += 1
+                    namespace_stats["bytes"] += item["size"]
+        for namespace, evictions in self._evictions.items():
+            stats.setdefault(namespace, {"entries": 0, "bytes": 0, "evictions": 0})["evictions"] = evictions
+        return stats
@@ -7,6 +7,7 @@ from typing_extensions import override
 from langflow.logging.logger import logger
 from langflow.services.cache.disk import AsyncDiskCache
 from langflow.services.cache.service import AsyncInMemoryCache, CacheService, RedisCache, ThreadingInMemoryCache
+from langflow.services.cache.tiered import TieredCache
 from langflow.services.factory import ServiceFactory
 
 if TYPE_CHECKING:
@@ -24,13 +25,7 @@ class CacheServiceFactory(ServiceFactory):
 
         if settings_service.settings.cache_type == "redis":
             logger.debug("Creating Redis cache")
-            redis_cache: RedisCache = RedisCache(
-                host=settings_service.settings.redis_host,
-                port=settings_service.settings.redis_port,
-                db=settings_service.settings.redis_db,
-                url=settings_service.settings.redis_url,
-                expiration_time=settings_service.settings.redis_cache_expire,
-            )
+            redis_cache = self._create_redis_cache(settings_service)
             if redis_cache.is_connected():
                 logger.debug("Redis cache is connected")
                 return redis_cache
@@ -38,13 +33,57 @@ class CacheServiceFactory(ServiceFactory):
             msg = "Failed to connect to Redis cache"
             raise ConnectionError(msg)
 
+        if settings_service.settings.cache_type == "tiered":
+            logger.debug("Creating tiered cache")
+            redis_cache = self._create_redis_cache(settings_service)
+            if redis_cache.is_connected():
+                return TieredCache(
+                    redis_cache,
+                    max_size=settings_service.settings.tiered_cache_max_size,
+                    expiration_time=settings_service.settings.tiered_cache_expire,
+                    **self._get_memory_limits(settings_service),
+                )
+            logger.warning("Failed to connect to Redis. Each worker will use its own in-memory cache.")
+            return AsyncInMemoryCache(
+                expiration_time=settings_service.settings.cache_expire, **self._get_memory_limits(settings_service)
+            )
+
         if settings_service.settings.cache_type == "memory":
-            return ThreadingInMemoryCache(expiration_time=settings_service.settings.cache_expire)
+            return ThreadingInMemoryCache(
+                expiration_time=settings_service.settings.cache_expire, **self._get_memory_limits(settings_service)
+            )
         if settings_service.settings.cache_type == "async":
-            return AsyncInMemoryCache(expiration_time=settings_service.settings.cache_expire)
+            return AsyncInMemoryCache(
+                expiration_time=settings_service.settings.cache_expire, **self._get_memory_limits(settings_service)
+            )
         if settings_service.settings.cache_type == "disk":
             return AsyncDiskCache(
                 cache_dir=settings_service.settings.config_dir,
                 expiration_time=settings_service.settings.cache_expire,
             )
         return None
+
+    @staticmethod
+    def _get_memory_limits(settings_service: SettingsService) -> dict:
+        """Returns the byte budgets and eviction policy of the in-memory caches. The settings are in MB."""
+        settings = settings_service.settings
+        return {
+            "max_bytes": settings.cache_max_memory * 1024 * 1024 if settings.cache_max_memory is not None else None,
+            "namespace_budgets": {
+                namespace: budget * 1024 * 1024 for namespace, budget in settings.cache_namespace_memory.items()
+            },
+            "eviction_policy": settings.cache_eviction_policy,
+        }
+
+    @staticmethod
+    def _create_redis_cache(settings_service: SettingsService) -> RedisCache:
+        return RedisCache(
+            host=settings_service.settings.redis_host,
+            port=settings_service.settings.redis_port,
+            db=settings_service.settings.redis_db,
+            url=settings_service.settings.redis_url,
+            expiration_time=settings_service.settings.redis_cache_expire,
+            hash_entries=settings_service.settings.redis_cache_hash_entries,
+            compression=settings_service.settings.redis_cache_compression,
+            compression_threshold=settings_service.settings.redis_cache_compression_threshold,
+        )
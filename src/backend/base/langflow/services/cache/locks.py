@@ -0,0 +1,112 @@
+import contextlib
+from collections.abc import AsyncIterator, Callable
+from typing import Generic, TypeVar
+
+from loguru import logger
+
+from langflow.services.cache.service import RedisCache
+from langflow.services.cache.tiered import TieredCache, _get_connection_errors
+
+LockT = TypeVar("LockT")
+
+DEFAULT_STRIPES = 256
+DEFAULT_LEASE = 30.0
+LOCK_PREFIX = "langflow:lock:"
+# How often a worker checks whether a distributed lock held by another worker was released
+_POLL_INTERVAL = 0.05
+
+
+def _get_lock_errors() -> tuple[type[Exception], ...]:
+    try:
+        from redis.exceptions import LockError
+    except ImportError:
+        return ()
+    return (LockError,)
+
+
+class StripedLocks(Generic[LockT]):
+    """A fixed number of locks shared by all keys.
+
+    `locks[key]` returns the lock of the stripe the key hashes to, so the same key always gets the
+    same lock and the memory used does not grow with the number of keys. Keys of the same stripe
+    wait for each other.
+
+    Example:
+        locks = StripedLocks(asyncio.Lock, stripes=64)
+
+        async with locks["flow_id"]:
+            ...
+    """
+
+    def __init__(self, lock_factory: Callable[[], LockT], stripes: int = DEFAULT_STRIPES) -> None:
+        if stripes < 1:
+            msg = "StripedLocks needs at least one stripe."
+            raise ValueError(msg)
+        self._locks = [lock_factory() for _ in range(stripes)]
+
+    def __getitem__(self, key) -> LockT:
+        return self._locks[hash(str(key)) % len(self._locks)]
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+
+class DistributedLock:
+    """Locks keys across workers with Redis locks that expire after a lease.
+
+    A worker that dies or hangs while holding a lock blocks the others for one lease at most. A
+    worker that cannot get the lock within a lease, or cannot reach Redis, goes on without it.
+
+    Args:
+        client: The asyncio Redis client.
+        lease: The time in seconds a lock is held at most.
+        prefix: The prefix of the Redis keys of the locks.
+    """
+
+    def __init__(self, client, lease: float = DEFAULT_LEASE, prefix: str = LOCK_PREFIX) -> None:
+        self.client = client
+        self.lease = lease
+        self.prefix = prefix
+        self._connection_errors = _get_connection_errors()
+        self._lock_errors = _get_lock_errors()
+
+    @contextlib.asynccontextmanager
+    async def hold(self, key) -> AsyncIterator[bool]:
+        """Holds the lock of a key, yielding whether it was acquired."""
+        lock = self.client.lock(
+            f"{self.prefix}{key}",
+            timeout=self.lease,
+            sleep=_POLL_INTERVAL,
+            blocking_timeout=self.lease,
+            thread_local=False,
+        )
+        try:
+            acquired = bool(await lock.acquire())
+        except self._connection_errors:
+            logger.warning(f"Could not reach Redis to lock '{key}'. Going on without the lock.")
+            acquired = False
+        else:
+            if not acquired:
+                logger.warning(f"Timed out waiting for the lock of '{key}'. Going on without the lock.")
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                await self._release(key, lock)
+
+    async def _release(self, key, lock) -> None:
+        try:
+            await lock.release()
+        except self._lock_errors:
+            logger.warning(f"The lease of the lock of '{key}' expired before it was released.")
+        except self._connection_errors:
+            logger.warning(f"Could not reach Redis to release the lock of '{key}'. It expires with its lease.")
+
+
+def get_redis_client(cache_service):
+    """Returns the asyncio Redis client of a Redis or tiered cache, or None for other caches."""
+    if isinstance(cache_service, TieredCache):
+        return cache_service.redis_cache.client
+    if isinstance(cache_service, RedisCache):
+        return cache_service.client
+    return None
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Literal
+
+from langflow.services.cache.eviction import KNOWN_NAMESPACES, get_key_namespace
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+    from langflow.services.cache.base import AsyncBaseCacheService, CacheService
+    from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+CacheOperation = Literal["get", "set", "delete"]
+
+OPERATIONS: tuple[CacheOperation, ...] = ("get", "set", "delete")
+# The gauges of OpenTelemetry set from the counters of each namespace
+COUNTER_GAUGES = {
+    "hits": "cache_hits",
+    "misses": "cache_misses",
+    "writes": "cache_writes",
+    "deletes": "cache_deletes",
+    "evictions": "cache_evictions",
+    "entries": "cache_entries",
+    "bytes": "cache_bytes",
+    "bytes_written": "cache_bytes_written",
+    "hit_ratio": "cache_hit_ratio",
+}
+LATENCY_GAUGE = "cache_operation_seconds"
+
+
+def _empty_namespace() -> dict[str, Any]:
+    return {
+        "hits": 0,
+        "misses": 0,
+        "writes": 0,
+        "deletes": 0,
+        "bytes_written": 0,
+        "latency": {operation: {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0} for operation in OPERATIONS},
+    }
+
+
+class CacheMetrics:
+    """Counts the hits, misses, writes and latency of the operations of a cache for each namespace.
+
+    The namespace of a key is its prefix before the first colon if it is one of `namespaces`, and
+    'default' otherwise, so the counters do not grow with the number of keys.
+    """
+
+    def __init__(self, namespaces: Iterable[str] = KNOWN_NAMESPACES) -> None:
+        self.namespaces = frozenset(namespaces)
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[str, Any]] = {}
+
+    def record(
+        self,
+        operation: CacheOperation,
+        key: Hashable,
+        seconds: float,
+        *,
+        hit: bool | None = None,
+        size: int | None = None,
+    ) -> None:
+        """Counts an operation on a key.
+
+        Args:
+            operation: 'get', 'set' or 'delete'.
+            key: The key of the operation.
+            seconds: The time the operation took, including waiting for its lock.
+            hit: For reads, whether the key was found.
+            size: For writes, the bytes of the serialized value, if the cache serializes values.
+        """
+        namespace = get_key_namespace(key, self.namespaces)
+        with self._lock:
+            if (counters := self._counters.get(namespace)) is None:
+                counters = self._counters[namespace] = _empty_namespace()
+            if operation == "get":
+                counters["hits" if hit else "misses"] += 1
+            elif operation == "set":
+                counters["writes"] += 1
+                counters["bytes_written"] += size or 0
+            else:
+                counters["deletes"] += 1
+            latency = counters["latency"][operation]
+            latency["count"] += 1
+            latency["total_seconds"] += seconds
+            latency["max_seconds"] = max(latency["max_seconds"], seconds)
+
+    def snapshot(self, store_stats: dict[str, dict[str, int]] | None = None) -> dict[str, dict[str, Any]]:
+        """Returns the counters of each namespace.
+
+        Args:
+            store_stats: The entries, estimated bytes and evictions of each namespace, for caches that know them.
+        """
+        with self._lock:
+            snapshot = {
+                namespace: {
+                    **{name: value for name, value in counters.items() if name != "latency"},
+                    "latency": {operation: dict(latency) for operation, latency in counters["latency"].items()},
+                }
+                for namespace, counters in self._counters.items()
+            }
+        for namespace, stats in (store_stats or {}).items():
+            snapshot.setdefault(namespace, _empty_namespace()).update(stats)
+        for counters in snapshot.values():
+            reads = counters["hits"] + counters["misses"]
+            counters["hit_ratio"] = counters["hits"] / reads if reads else 0.0
+            for latency in counters["latency"].values():
+                latency["mean_seconds"] = latency["total_seconds"] / latency["count"] if latency["count"] else 0.0
+        return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+def export_cache_metrics(ot: OpenTelemetry, cache_service: CacheService | AsyncBaseCacheService) -> None:
+    """Sets the cache gauges of OpenTelemetry from the metrics of the cache service."""
+    for namespace, counters in cache_service.get_metrics().items():
+        labels = {"namespace": namespace}
+        for name, gauge in COUNTER_GAUGES.items():
+            if name in counters:
+                ot.update_gauge(gauge, counters[name], labels)
+        for operation, latency in counters["latency"].items():
+            ot.update_gauge(LATENCY_GAUGE, latency["mean_seconds"], {**labels, "operation": operation})
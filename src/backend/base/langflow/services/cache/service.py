@@ -2,25 +2,33 @@ import asyncio
 import pickle
 import threading
 import time
-from collections import OrderedDict
-from typing import Generic, Union
+from typing import Any, Generic, Union
 
 from loguru import logger
 from typing_extensions import override
 
 from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType, CacheService, LockType
+from langflow.services.cache.compression import DEFAULT_COMPRESSION_THRESHOLD, CompressionAlgorithm, ValueCompressor
+from langflow.services.cache.eviction import BoundedStore, EvictionPolicy
+from langflow.services.cache.metrics import CacheMetrics
 from langflow.services.cache.utils import CACHE_MISS
 
+# The hash field of values stored with `hash_entries` that are not dictionaries with string keys
+_VALUE_FIELD = "\x00value"
+
 
 class ThreadingInMemoryCache(CacheService, Generic[LockType]):
-    """A simple in-memory cache using an OrderedDict.
+    """A simple in-memory cache.
 
     This cache supports setting a maximum size and expiration time for cached items.
-    When the cache is full, it uses a Least Recently Used (LRU) eviction policy.
+    The size can be bounded by the number of items and by their estimated size in bytes, for all
+    items and for the items of each namespace (the prefix of their keys before the first colon).
+    When the cache is full, it uses a Least Recently Used (LRU) or W-TinyLFU eviction policy.
     Thread-safe using a threading Lock.
 
     Attributes:
         max_size (int, optional): Maximum number of items to store in the cache.
+        max_bytes (int, optional): Maximum estimated bytes of the items of keys without a namespace budget.
         expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
 
     Example:
@@ -36,16 +44,28 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         b = cache["b"]
     """
 
-    def __init__(self, max_size=None, expiration_time=60 * 60) -> None:
+    def __init__(
+        self,
+        max_size=None,
+        expiration_time=60 * 60,
+        max_bytes: int | None = None,
+        namespace_budgets: dict[str, int] | None = None,
+        eviction_policy: EvictionPolicy = "lru",
+    ) -> None:
         """Initialize a new InMemoryCache instance.
 
         Args:
             max_size (int, optional): Maximum number of items to store in the cache.
             expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+            max_bytes (int, optional): Maximum estimated bytes of the items of keys without a namespace budget.
+            namespace_budgets (dict, optional): Maximum estimated bytes of the items of each namespace.
+            eviction_policy (str, optional): 'lru' or 'tinylfu'.
         """
-        self._cache: OrderedDict = OrderedDict()
+        self._cache = BoundedStore(max_size, max_bytes, namespace_budgets, eviction_policy)
         self._lock = threading.RLock()
+        self.metrics = CacheMetrics(self._cache.namespaces)
         self.max_size = max_size
+        self.max_bytes = max_bytes
         self.expiration_time = expiration_time
 
     def get(self, key, lock: Union[threading.Lock, None] = None):  # noqa: UP007
@@ -58,40 +78,36 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         Returns:
             The value associated with the key, or CACHE_MISS if the key is not found or the item has expired.
         """
+        start = time.perf_counter()
         with lock or self._lock:
-            return self._get_without_lock(key)
+            value = self._get_without_lock(key)
+        self.metrics.record("get", key, time.perf_counter() - start, hit=value is not CACHE_MISS)
+        return value
 
     def _get_without_lock(self, key):
         """Retrieve an item from the cache without acquiring the lock."""
         if item := self._cache.get(key):
             if self.expiration_time is None or time.time() - item["time"] < self.expiration_time:
-                # Move the key to the end to make it recently used
-                self._cache.move_to_end(key)
                 # Check if the value is pickled
                 return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
-            self.delete(key)
+            self._cache.delete(key)
         return CACHE_MISS
 
     def set(self, key, value, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Add an item to the cache.
 
-        If the cache is full, the least recently used item is evicted.
+        If the cache is full, items are evicted following the eviction policy. Items larger than
+        the budget of their namespace are not stored.
 
         Args:
             key: The key of the item.
             value: The value to cache.
             lock: A lock to use for the operation.
         """
+        start = time.perf_counter()
         with lock or self._lock:
-            if key in self._cache:
-                # Remove existing key before re-inserting to update order
-                self.delete(key)
-            elif self.max_size and len(self._cache) >= self.max_size:
-                # Remove least recently used item
-                self._cache.popitem(last=False)
-            # pickle locally to mimic Redis
-
-            self._cache[key] = {"value": value, "time": time.time()}
+            self._cache.put(key, {"value": value, "time": time.time()})
+        self.metrics.record("set", key, time.perf_counter() - start)
 
     def upsert(self, key, value, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Inserts or updates a value in the cache.
@@ -131,8 +147,10 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
             return value
 
     def delete(self, key, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
+        start = time.perf_counter()
         with lock or self._lock:
-            self._cache.pop(key, None)
+            self._cache.delete(key)
+        self.metrics.record("delete", key, time.perf_counter() - start)
 
     def clear(self, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Clear all items from the cache."""
@@ -163,9 +181,20 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         """Return the number of items in the cache."""
         return len(self._cache)
 
+    def eviction_stats(self) -> dict[str, dict[str, int]]:
+        """Returns the number of items, estimated bytes and evictions of each namespace."""
+        with self._lock:
+            return self._cache.stats()
+
+    def get_metrics(self) -> dict[str, dict[str, Any]]:
+        return self.metrics.snapshot(self.eviction_stats())
+
     def __repr__(self) -> str:
         """Return a string representation of the InMemoryCache instance."""
-        return f"InMemoryCache(max_size={self.max_size}, expiration_time={self.expiration_time})"
+        return (
+            f"InMemoryCache(max_size={self.max_size}, max_bytes={self.max_bytes}, "
+            f"eviction_policy={self._cache.policy}, expiration_time={self.expiration_time})"
+        )
 
 
 class RedisCache(AsyncBaseCacheService, Generic[LockType]):
@@ -173,8 +202,13 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):
 
     This cache supports setting an expiration time for cached items.
 
+    Values are pickled and stored as strings. With `hash_entries`, dictionaries with string keys are
+    stored as Redis hashes with one pickled field per key instead, so `upsert` updates their fields
+    atomically on the server and only sends the fields that change. Large values can be compressed.
+
     Attributes:
         expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+        hash_entries (bool): Whether dictionaries are stored as Redis hashes.
 
     Example:
         cache = RedisCache(expiration_time=5)
@@ -189,7 +223,19 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):
         b = cache["b"]
     """
 
-    def __init__(self, host="localhost", port=6379, db=0, url=None, expiration_time=60 * 60) -> None:
+    def __init__(
+        self,
+        host="localhost",
+        port=6379,
+        db=0,
+        url=None,
+        expiration_time=60 * 60,
+        client=None,
+        *,
+        hash_entries: bool = False,
+        compression: CompressionAlgorithm = "none",
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+    ) -> None:
         """Initialize a new RedisCache instance.
 
         Args:
@@ -199,7 +245,22 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):
             url (str, optional): Redis URL.
             expiration_time (int, optional): Time in seconds after which a
                 cached item expires. Default is 1 hour.
+            client (optional): An asyncio Redis client to use instead of connecting to `url` or `host`.
+            hash_entries (bool, optional): Whether to store dictionaries as Redis hashes.
+            compression (str, optional): The algorithm used to compress large values: 'none', 'zlib', 'zstd' or 'lz4'.
+            compression_threshold (int, optional): The size in bytes from which values are compressed.
         """
+        self.expiration_time = expiration_time
+        self.hash_entries = hash_entries
+        self.metrics = CacheMetrics()
+        self._compressor = ValueCompressor(compression, compression_threshold)
+        self._stats = dict.fromkeys(
+            ("values_written", "bytes_written", "values_compressed", "bytes_saved", "values_read", "bytes_read"), 0
+        )
+        self._connection_kwargs: dict | None = None
+        if client is not None:
+            self._client = client
+            return
         try:
             from redis.asyncio import StrictRedis
         except ImportError as exc:
@@ -212,48 +273,120 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):
             "RedisCache is an experimental feature and may not work as expected."
             " Please report any issues to our GitHub repository."
         )
+        self._connection_kwargs = {"url": url} if url else {"host": host, "port": port, "db": db}
         if url:
             self._client = StrictRedis.from_url(url)
         else:
             self._client = StrictRedis(host=host, port=port, db=db)
-        self.expiration_time = expiration_time
+
+    @property
+    def client(self):
+        """The asyncio Redis client."""
+        return self._client
 
     # check connection
     def is_connected(self) -> bool:
-        """Check if the Redis client is connected."""
+        """Check if the Redis server can be reached.
+
+        A separate synchronous client is used, so the check works whether or not an event loop is
+        running and does not bind the connections of the asyncio client to a temporary loop.
+        """
+        if self._connection_kwargs is None:
+            # Clients passed in are connected by their owner
+            return True
         import redis
 
+        kwargs = dict(self._connection_kwargs)
+        url = kwargs.pop("url", None)
         try:
-            asyncio.run(self._client.ping())
+            client = redis.Redis.from_url(url) if url else redis.Redis(**kwargs)
+            with client:
+                client.ping()
         except redis.exceptions.ConnectionError:
             logger.exception("RedisCache could not connect to the Redis server")
             return False
         return True
 
+    def stats(self) -> dict[str, int]:
+        """Returns how many values and serialized bytes were written and read, and what compression saved."""
+        return dict(self._stats)
+
+    def _dumps(self, value) -> bytes:
+        try:
+            pickled = pickle.dumps(value)
+        except (TypeError, AttributeError, pickle.PicklingError) as exc:
+            msg = "RedisCache only accepts values that can be pickled. "
+            raise TypeError(msg) from exc
+        data = self._compressor.compress(pickled)
+        self._stats["values_written"] += 1
+        self._stats["bytes_written"] += len(data)
+        if len(data) < len(pickled):
+            self._stats["values_compressed"] += 1
+            self._stats["bytes_saved"] += len(pickled) - len(data)
+        return data
+
+    def _loads(self, data: bytes):
+        self._stats["values_read"] += 1
+        self._stats["bytes_read"] += len(data)
+        return pickle.loads(self._compressor.decompress(data))
+
+    def _to_fields(self, value) -> dict[str, bytes]:
+        """Returns the hash fields of a value. Values other than dictionaries with string keys are one field."""
+        if isinstance(value, dict) and value and all(isinstance(field, str) for field in value):
+            return {field: self._dumps(field_value) for field, field_value in value.items()}
+        return {_VALUE_FIELD: self._dumps(value)}
+
     @override
     async def get(self, key, lock=None):
         if key is None:
             return CACHE_MISS
-        value = await self._client.get(str(key))
-        return pickle.loads(value) if value else CACHE_MISS
+        start = time.perf_counter()
+        value = await self._get(str(key))
+        self.metrics.record("get", key, time.perf_counter() - start, hit=value is not CACHE_MISS)
+        return value
+
+    async def _get(self, key: str):
+        if self.hash_entries:
+            fields = await self._client.hgetall(key)
+            if not fields:
+                return CACHE_MISS
+            fields = {field.decode() if isinstance(field, bytes) else field: data for field, data in fields.items()}
+            if _VALUE_FIELD in fields:
+                return self._loads(fields[_VALUE_FIELD])
+            return {field: self._loads(data) for field, data in fields.items()}
+        value = await self._client.get(key)
+        return self._loads(value) if value else CACHE_MISS
 
     @override
     async def set(self, key, value, lock=None) -> None:
-        try:
-            if pickled := pickle.dumps(value):
-                result = await self._client.setex(str(key), self.expiration_time, pickled)
-                if not result:
-                    msg = "RedisCache could not set the value."
-                    raise ValueError(msg)
-        except TypeError as exc:
-            msg = "RedisCache only accepts values that can be pickled. "
-            raise TypeError(msg) from exc
+        start = time.perf_counter()
+        size = await self._set(str(key), value)
+        self.metrics.record("set", key, time.perf_counter() - start, size=size)
+
+    async def _set(self, key: str, value) -> int:
+        """Stores a value, returning the bytes written."""
+        if self.hash_entries:
+            fields = self._to_fields(value)
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                pipe.hset(key, mapping=fields)
+                pipe.expire(key, self.expiration_time)
+                await pipe.execute()
+            return sum(len(data) for data in fields.values())
+        data = self._dumps(value)
+        if data:
+            result = await self._client.setex(key, self.expiration_time, data)
+            if not result:
+                msg = "RedisCache could not set the value."
+                raise ValueError(msg)
+        return len(data)
 
     @override
     async def upsert(self, key, value, lock=None) -> None:
         """Inserts or updates a value in the cache.
 
-        If the existing value and the new value are both dictionaries, they are merged.
+        If the existing value and the new value are both dictionaries, they are merged. With
+        `hash_entries`, the merge happens atomically on the Redis server.
 
         Args:
             key: The key of the item.
@@ -262,16 +395,34 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):
         """
         if key is None:
             return
-        existing_value = await self.get(key)
+        start = time.perf_counter()
+        size = await self._upsert(str(key), value)
+        self.metrics.record("set", key, time.perf_counter() - start, size=size)
+
+    async def _upsert(self, key: str, value) -> int:
+        if self.hash_entries:
+            fields = self._to_fields(value)
+            if _VALUE_FIELD in fields:
+                return await self._set(key, value)
+            async with self._client.pipeline(transaction=True) as pipe:
+                # An existing value that is not a dictionary is replaced
+                pipe.hdel(key, _VALUE_FIELD)
+                pipe.hset(key, mapping=fields)
+                pipe.expire(key, self.expiration_time)
+                await pipe.execute()
+            return sum(len(data) for data in fields.values())
+        existing_value = await self._get(key)
         if existing_value is not None and isinstance(existing_value, dict) and isinstance(value, dict):
             existing_value.update(value)
             value = existing_value
 
-        await self.set(key, value)
+        return await self._set(key, value)
 
     @override
     async def delete(self, key, lock=None) -> None:
-        await self._client.delete(key)
+        start = time.perf_counter()
+        await self._client.delete(str(key))
+        self.metrics.record("delete", key, time.perf_counter() - start)
 
     @override
     async def clear(self, lock=None) -> None:
@@ -290,47 +441,58 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):
 
 
 class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
-    def __init__(self, max_size=None, expiration_time=3600) -> None:
-        self.cache: OrderedDict = OrderedDict()
+    def __init__(
+        self,
+        max_size=None,
+        expiration_time=3600,
+        max_bytes: int | None = None,
+        namespace_budgets: dict[str, int] | None = None,
+        eviction_policy: EvictionPolicy = "lru",
+    ) -> None:
+        self.cache = BoundedStore(max_size, max_bytes, namespace_budgets, eviction_policy)
+        self.metrics = CacheMetrics(self.cache.namespaces)
 
         self.lock = asyncio.Lock()
         self.max_size = max_size
+        self.max_bytes = max_bytes
         self.expiration_time = expiration_time
 
     async def get(self, key, lock: asyncio.Lock | None = None):
+        start = time.perf_counter()
         async with lock or self.lock:
-            return await self._get(key)
+            value = await self._get(key)
+        self.metrics.record("get", key, time.perf_counter() - start, hit=value is not CACHE_MISS)
+        return value
 
     async def _get(self, key):
-        item = self.cache.get(key, None)
+        item = self.cache.get(key)
         if item:
             if time.time() - item["time"] < self.expiration_time:
-                self.cache.move_to_end(key)
                 return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
             logger.info(f"Cache item for key '{key}' has expired and will be deleted.")
             await self._delete(key)  # Log before deleting the expired item
         return CACHE_MISS
 
     async def set(self, key, value, lock: asyncio.Lock | None = None) -> None:
+        start = time.perf_counter()
         async with lock or self.lock:
             await self._set(
                 key,
                 value,
             )
+        self.metrics.record("set", key, time.perf_counter() - start)
 
     async def _set(self, key, value) -> None:
-        if self.max_size and len(self.cache) >= self.max_size:
-            self.cache.popitem(last=False)
-        self.cache[key] = {"value": value, "time": time.time()}
-        self.cache.move_to_end(key)
+        self.cache.put(key, {"value": value, "time": time.time()})
 
     async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
+        start = time.perf_counter()
         async with lock or self.lock:
             await self._delete(key)
+        self.metrics.record("delete", key, time.perf_counter() - start)
 
     async def _delete(self, key) -> None:
-        if key in self.cache:
-            del self.cache[key]
+        self.cache.delete(key)
 
     async def clear(self, lock: asyncio.Lock | None = None) -> None:
         async with lock or self.lock:
@@ -343,11 +505,21 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         await self._upsert(key, value, lock)
 
     async def _upsert(self, key, value, lock: asyncio.Lock | None = None) -> None:
-        existing_value = await self.get(key, lock)
-        if existing_value is not None and isinstance(existing_value, dict) and isinstance(value, dict):
-            existing_value.update(value)
-            value = existing_value
-        await self.set(key, value, lock)
+        start = time.perf_counter()
+        async with lock or self.lock:
+            existing_value = await self._get(key)
+            if existing_value is not None and isinstance(existing_value, dict) and isinstance(value, dict):
+                existing_value.update(value)
+                value = existing_value
+            await self._set(key, value)
+        self.metrics.record("set", key, time.perf_counter() - start)
 
     async def contains(self, key) -> bool:
         return key in self.cache
+
+    def eviction_stats(self) -> dict[str, dict[str, int]]:
+        """Returns the number of items, estimated bytes and evictions of each namespace."""
+        return self.cache.stats()
+
+    def get_metrics(self) -> dict[str, dict[str, Any]]:
+        return self.metrics.snapshot(self.eviction_stats())
@@ -0,0 +1,261 @@
+import asyncio
+import contextlib
+import json
+import time
+import uuid
+from typing import Any, Generic
+
+from loguru import logger
+
+from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType
+from langflow.services.cache.eviction import EvictionPolicy
+from langflow.services.cache.metrics import CacheMetrics
+from langflow.services.cache.service import AsyncInMemoryCache, RedisCache
+from langflow.services.cache.utils import CACHE_MISS
+
+INVALIDATION_CHANNEL = "langflow:cache:invalidate"
+RESUBSCRIBE_DELAY = 1.0
+
+
+def _get_connection_errors() -> tuple[type[Exception], ...]:
+    try:
+        from redis.exceptions import ConnectionError as RedisConnectionError
+        from redis.exceptions import TimeoutError as RedisTimeoutError
+    except ImportError:
+        return (ConnectionError, TimeoutError)
+    return (ConnectionError, TimeoutError, RedisConnectionError, RedisTimeoutError)
+
+
+class TieredCache(AsyncBaseCacheService, Generic[AsyncLockType]):
+    """A bounded in-process cache in front of a Redis cache.
+
+    Reads are served from the local cache when it has the item and from Redis otherwise. Writes go
+    to both, and each worker tells the others to drop the keys it changed through Redis pub/sub.
+    While the invalidations cannot be received, every read goes to Redis. While Redis cannot be
+    reached, the cache works with the local copies only.
+
+    Attributes:
+        redis_cache (RedisCache): The cache shared by the workers.
+        local_cache (AsyncInMemoryCache): The copies of the items kept by this worker.
+        channel (str): The pub/sub channel of the invalidations.
+
+    Example:
+        cache = TieredCache(RedisCache(url="redis://localhost:6379"), max_size=100, expiration_time=300)
+
+        await cache.set("a", 1)
+        a = await cache.get("a")
+    """
+
+    def __init__(
+        self,
+        redis_cache: RedisCache,
+        max_size: int | None = 100,
+        expiration_time: int = 300,
+        channel: str = INVALIDATION_CHANNEL,
+        max_bytes: int | None = None,
+        namespace_budgets: dict[str, int] | None = None,
+        eviction_policy: EvictionPolicy = "lru",
+    ) -> None:
+        """Initialize a new TieredCache instance.
+
+        Args:
+            redis_cache (RedisCache): The cache shared by the workers.
+            max_size (int, optional): Maximum number of items each worker keeps locally.
+            expiration_time (int, optional): Time in seconds a local copy is used before it is read
+                from Redis again. It bounds how long a worker serves a value whose invalidation was lost.
+            channel (str, optional): The pub/sub channel of the invalidations.
+            max_bytes (int, optional): Maximum estimated bytes of the local copies of keys without a namespace budget.
+            namespace_budgets (dict, optional): Maximum estimated bytes of the local copies of each namespace.
+            eviction_policy (str, optional): How the local copies to drop are chosen: 'lru' or 'tinylfu'.
+        """
+        self.redis_cache = redis_cache
+        self.local_cache: AsyncInMemoryCache = AsyncInMemoryCache(
+            max_size=max_size,
+            expiration_time=expiration_time,
+            max_bytes=max_bytes,
+            namespace_budgets=namespace_budgets,
+            eviction_policy=eviction_policy,
+        )
+        self.channel = channel
+        self.metrics = CacheMetrics(self.local_cache.cache.namespaces)
+        self.lock = asyncio.Lock()
+        self._origin = uuid.uuid4().hex
+        self._listener: asyncio.Task | None = None
+        self._subscribed = False
+        self._connection_errors = _get_connection_errors()
+
+    def is_connected(self) -> bool:
+        """Check if the Redis client is connected."""
+        return self.redis_cache.is_connected()
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        """Drops the local copies of the keys other workers change, subscribing again if the connection is lost."""
+        while True:
+            pubsub = self.redis_cache.client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                # Changes made while this worker was not subscribed were missed
+                await self.local_cache.clear()
+                self._subscribed = True
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        await self._invalidate(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).warning("Lost the cache invalidation channel. Reading from Redis.")
+            finally:
+                self._subscribed = False
+                with contextlib.suppress(Exception):
+                    await pubsub.reset()
+            await asyncio.sleep(RESUBSCRIBE_DELAY)
+
+    async def _invalidate(self, data: bytes | str) -> None:
+        message = json.loads(data)
+        if message.get("origin") == self._origin:
+            return
+        if message.get("key") is None:
+            await self.local_cache._clear()
+        else:
+            await self.local_cache._delete(message["key"])
+
+    async def _publish(self, key: str | None) -> None:
+        await self.redis_cache.client.publish(self.channel, json.dumps({"origin": self._origin, "key": key}))
+
+    async def get(self, key, lock: asyncio.Lock | None = None):
+        if key is None:
+            return CACHE_MISS
+        self._ensure_listener()
+        start = time.perf_counter()
+        async with lock or self.lock:
+            value = await self._get(str(key))
+        self.metrics.record("get", key, time.perf_counter() - start, hit=value is not CACHE_MISS)
+        return value
+
+    async def _get(self, key: str):
+        if self._subscribed and (value := await self.local_cache._get(key)) is not CACHE_MISS:
+            return value
+        try:
+            value = await self.redis_cache.get(key)
+        except self._connection_errors:
+            logger.warning(f"Could not read '{key}' from Redis. Using the local cache.")
+            return await self.local_cache._get(key)
+        if value is CACHE_MISS:
+            await self.local_cache._delete(key)
+        else:
+            await self.local_cache._set(key, value)
+        return value
+
+    async def set(self, key, value, lock: asyncio.Lock | None = None) -> None:
+        self._ensure_listener()
+        start = time.perf_counter()
+        async with lock or self.lock:
+            await self._set(str(key), value)
+        self.metrics.record("set", key, time.perf_counter() - start)
+
+    async def _set(self, key: str, value) -> None:
+        await self.local_cache._set(key, value)
+        try:
+            await self.redis_cache.set(key, value)
+            await self._publish(key)
+        except self._connection_errors:
+            logger.warning(f"Could not write '{key}' to Redis. It is only kept in the local cache.")
+
+    async def upsert(self, key, value, lock: asyncio.Lock | None = None) -> None:
+        """Inserts or updates a value in the cache.
+
+        If the existing value and the new value are both dictionaries, they are merged.
+
+        Args:
+            key: The key of the item.
+            value: The value to insert or update.
+            lock: A lock to use for the operation.
+        """
+        if key is None:
+            return
+        self._ensure_listener()
+        start = time.perf_counter()
+        async with lock or self.lock:
+            await self._upsert(str(key), value)
+        self.metrics.record("set", key, time.perf_counter() - start)
+
+    async def _upsert(self, key: str, value) -> None:
+        if not self.redis_cache.hash_entries:
+            existing_value = await self._get(key)
+            if isinstance(existing_value, dict) and isinstance(value, dict):
+                existing_value.update(value)
+                value = existing_value
+            await self._set(key, value)
+            return
+        # Redis merges hash entries itself, so the merged value is only known here if there is a local copy
+        try:
+            await self.redis_cache.upsert(key, value)
+            await self._publish(key)
+            stored = True
+        except self._connection_errors:
+            logger.warning(f"Could not write '{key}' to Redis. It is only kept in the local cache.")
+            stored = False
+        existing_value = await self.local_cache._get(key) if self._subscribed or not stored else CACHE_MISS
+        if isinstance(existing_value, dict) and isinstance(value, dict):
+            existing_value.update(value)
+            value = existing_value
+        elif isinstance(value, dict) and stored:
+            await self.local_cache._delete(key)
+            return
+        await self.local_cache._set(key, value)
+
+    async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
+        self._ensure_listener()
+        start = time.perf_counter()
+        async with lock or self.lock:
+            await self.local_cache._delete(str(key))
+            try:
+                await self.redis_cache.delete(str(key))
+                await self._publish(str(key))
+            except self._connection_errors:
+                logger.warning(f"Could not delete '{key}' from Redis. It is only removed from the local cache.")
+        self.metrics.record("delete", key, time.perf_counter() - start)
+
+    async def clear(self, lock: asyncio.Lock | None = None) -> None:
+        """Clear all items from the cache."""
+        self._ensure_listener()
+        async with lock or self.lock:
+            await self.local_cache._clear()
+            try:
+                await self.redis_cache.clear()
+                await self._publish(None)
+            except self._connection_errors:
+                logger.warning("Could not clear Redis. Only the local cache was cleared.")
+
+    async def contains(self, key) -> bool:
+        """Check if the key is in the cache."""
+        if key is None:
+            return False
+        if self._subscribed and await self.local_cache.contains(str(key)):
+            return True
+        try:
+            return await self.redis_cache.contains(key)
+        except self._connection_errors:
+            return await self.local_cache.contains(str(key))
+
+    def get_metrics(self) -> dict[str, dict[str, Any]]:
+        """Returns the metrics of the cache, with the sizes and evictions of the local copies."""
+        return self.metrics.snapshot(self.local_cache.eviction_stats())
+
+    async def teardown(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
+    def __repr__(self) -> str:
+        """Return a string representation of the TieredCache instance."""
+        return (
+            f"TieredCache(max_size={self.local_cache.max_size}, expiration_time={self.local_cache.expiration_time}, "
+            f"redis_cache={self.redis_cache!r})"
+        )
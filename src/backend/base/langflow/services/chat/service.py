@@ -1,11 +1,19 @@
 import asyncio
-from collections import defaultdict
+import contextlib
 from threading import RLock
 from typing import Any
 
+from loguru import logger
+
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService, CacheService
-from langflow.services.deps import get_cache_service
+from langflow.services.cache.locks import DistributedLock, StripedLocks, get_redis_client
+from langflow.services.cache.service import AsyncInMemoryCache, ThreadingInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.deps import get_cache_service, get_settings_service
+
+# The prefix of the cache keys of the service, so the cache can give them their own memory budget
+KEY_NAMESPACE = "graph"
 
 
 class ChatService(Service):
@@ -14,9 +22,55 @@ class ChatService(Service):
     name = "chat_service"
 
     def __init__(self) -> None:
-        self.async_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
-        self._sync_cache_locks: dict[str, RLock] = defaultdict(RLock)
+        settings = get_settings_service().settings
+        self.async_cache_locks: StripedLocks[asyncio.Lock] = StripedLocks(asyncio.Lock, settings.cache_lock_stripes)
+        self._sync_cache_locks: StripedLocks[RLock] = StripedLocks(RLock, settings.cache_lock_stripes)
         self.cache_service: CacheService | AsyncBaseCacheService = get_cache_service()
+        self.distributed_lock: DistributedLock | None = None
+        if settings.distributed_cache_locks:
+            if (client := get_redis_client(self.cache_service)) is not None:
+                self.distributed_lock = DistributedLock(client, lease=settings.distributed_cache_lock_lease)
+            else:
+                logger.warning("Distributed cache locks need the 'redis' or 'tiered' cache type. Locking per worker.")
+        # In-memory caches keep the graph object itself, so only caches that serialize values use snapshots
+        self.snapshot_graphs = settings.graph_cache_snapshots and not isinstance(
+            self.cache_service, AsyncInMemoryCache | ThreadingInMemoryCache
+        )
+        self.compress_snapshots = settings.graph_cache_snapshot_compression
+
+    def _dump_graph(self, data: Any) -> Any:
+        from langflow.graph.graph.base import Graph
+        from langflow.graph.graph.snapshot import GraphSnapshotError, dump_graph_snapshot
+
+        if not self.snapshot_graphs or not isinstance(data, Graph):
+            return data
+        try:
+            return dump_graph_snapshot(data, compress=self.compress_snapshots)
+        except GraphSnapshotError as exc:
+            # Results that can not be built again without side effects are kept by storing the whole graph
+            logger.debug(f"Storing the graph of flow {data.flow_id} whole: {exc}")
+            return data
+
+    def _load_graph(self, key: str, value: Any) -> Any:
+        from langflow.graph.graph.snapshot import GraphSnapshotError, is_graph_snapshot, load_graph_snapshot
+
+        if not isinstance(value, dict) or not is_graph_snapshot(value.get("result")):
+            return value
+        try:
+            graph = load_graph_snapshot(value["result"])
+        except GraphSnapshotError as exc:
+            logger.warning(f"Could not load the graph cached for {key}: {exc}")
+            return CACHE_MISS
+        return {**value, "result": graph}
+
+    @staticmethod
+    def _cache_key(key: str) -> str:
+        return f"{KEY_NAMESPACE}:{key}"
+
+    def _hold_distributed_lock(self, key: str) -> contextlib.AbstractAsyncContextManager:
+        if self.distributed_lock is None:
+            return contextlib.nullcontext()
+        return self.distributed_lock.hold(self._cache_key(key))
 
     async def set_cache(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool:
         """Set the cache for a client.
@@ -30,16 +84,18 @@ class ChatService(Service):
             bool: True if the cache was set successfully, False otherwise.
         """
         result_dict = {
-            "result": data,
+            "result": self._dump_graph(data),
             "type": type(data),
         }
+        cache_key = self._cache_key(key)
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            await self.cache_service.upsert(str(key), result_dict, lock=lock or self.async_cache_locks[key])
-            return await self.cache_service.contains(key)
+            async with self._hold_distributed_lock(key):
+                await self.cache_service.upsert(cache_key, result_dict, lock=lock or self.async_cache_locks[key])
+            return await self.cache_service.contains(cache_key)
         await asyncio.to_thread(
-            self.cache_service.upsert, str(key), result_dict, lock=lock or self._sync_cache_locks[key]
+            self.cache_service.upsert, cache_key, result_dict, lock=lock or self._sync_cache_locks[key]
         )
-        return key in self.cache_service
+        return cache_key in self.cache_service
 
     async def get_cache(self, key: str, lock: asyncio.Lock | None = None) -> Any:
         """Get the cache for a client.
@@ -51,9 +107,12 @@ class ChatService(Service):
         Returns:
             Any: The cached data.
         """
+        cache_key = self._cache_key(key)
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
-        return await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
+            value = await self.cache_service.get(cache_key, lock=lock or self.async_cache_locks[key])
+        else:
+            value = await asyncio.to_thread(self.cache_service.get, cache_key, lock=lock or self._sync_cache_locks[key])
+        return self._load_graph(key, value)
 
     async def clear_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
         """Clear the cache for a client.
@@ -62,6 +121,8 @@ class ChatService(Service):
             key (str): The cache key.
             lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
         """
+        cache_key = self._cache_key(key)
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
-        return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
+            async with self._hold_distributed_lock(key):
+                return await self.cache_service.delete(cache_key, lock=lock or self.async_cache_locks[key])
+        return await asyncio.to_thread(self.cache_service.delete, cache_key, lock=lock or self._sync_cache_locks[key])
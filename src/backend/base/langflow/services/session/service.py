@@ -9,6 +9,9 @@ from langflow.services.session.utils import compute_dict_hash, session_id_genera
 if TYPE_CHECKING:
     from langflow.services.cache.base import CacheService
 
+# The prefix of the cache keys of the service, so the cache can give them their own memory budget
+KEY_NAMESPACE = "session"
+
 
 class SessionService(Service):
     name = "session_service"
@@ -16,12 +19,16 @@ class SessionService(Service):
     def __init__(self, cache_service) -> None:
         self.cache_service: CacheService | AsyncBaseCacheService = cache_service
 
+    @staticmethod
+    def _cache_key(key) -> str:
+        return f"{KEY_NAMESPACE}:{key}"
+
     async def load_session(self, key, flow_id: str, data_graph: dict | None = None):
         # Check if the data is cached
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            value = await self.cache_service.get(key)
+            value = await self.cache_service.get(self._cache_key(key))
         else:
-            value = await asyncio.to_thread(self.cache_service.get, key)
+            value = await asyncio.to_thread(self.cache_service.get, self._cache_key(key))
         if not isinstance(value, CacheMiss):
             return value
 
@@ -34,7 +41,7 @@ class SessionService(Service):
 
         graph = Graph.from_payload(data_graph, flow_id=flow_id)
         artifacts: dict = {}
-        await self.cache_service.set(key, (graph, artifacts))
+        await self.cache_service.set(self._cache_key(key), (graph, artifacts))
 
         return graph, artifacts
 
@@ -52,12 +59,12 @@ class SessionService(Service):
 
     async def update_session(self, session_id, value) -> None:
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            await self.cache_service.set(session_id, value)
+            await self.cache_service.set(self._cache_key(session_id), value)
         else:
-            await asyncio.to_thread(self.cache_service.set, session_id, value)
+            await asyncio.to_thread(self.cache_service.set, self._cache_key(session_id), value)
 
     async def clear_session(self, session_id) -> None:
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            await self.cache_service.delete(session_id)
+            await self.cache_service.delete(self._cache_key(session_id))
         else:
-            await asyncio.to_thread(self.cache_service.delete, session_id)
+            await asyncio.to_thread(self.cache_service.delete, self._cache_key(session_id))
@@ -117,10 +117,24 @@ class Settings(BaseSettings):
     """
 
     # cache configuration
-    cache_type: Literal["async", "redis", "memory", "disk"] = "async"
-    """The cache type can be 'async' or 'redis'."""
+    cache_type: Literal["async", "redis", "memory", "disk", "tiered"] = "async"
+    """The cache type can be 'async', 'memory', 'disk', 'redis' or 'tiered'. 'tiered' keeps a bounded copy of the
+    most recently used items in each worker in front of Redis, and the workers tell each other through Redis pub/sub
+    which items changed. If Redis cannot be reached at startup, it falls back to 'async'."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    cache_max_memory: int | None = None
+    """The memory in MB the items of the in-memory caches ('async', 'memory' and the local copies of 'tiered') can
+    take, leaving out the namespaces with their own budget. The sizes are estimates. If None, there is no limit."""
+    cache_namespace_memory: dict[str, int] = {}
+    """The memory in MB the items of each namespace of the in-memory caches can take, as JSON, for example
+    {"graph": 512, "session": 128}. The namespace of an item is the prefix of its key before the first colon: 'graph'
+    for the graphs of the flows being built, 'session' for the graphs of API sessions and 'vertex_result' for memoized
+    vertex results."""
+    cache_eviction_policy: Literal["lru", "tinylfu"] = "lru"
+    """How the in-memory caches choose the items to evict when they are full. 'lru' evicts the least recently used
+    items. 'tinylfu' (W-TinyLFU) only keeps new items over the items that were used less often, so items used once do
+    not push out the items used again and again."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
 
@@ -141,6 +155,30 @@ class Settings(BaseSettings):
     redis_db: int = 0
     redis_url: str | None = None
     redis_cache_expire: int = 3600
+    redis_cache_hash_entries: bool = False
+    """If set to True, the Redis cache stores dictionaries as Redis hashes with one field per key, so updating some
+    keys of an entry, like the graph cached between the steps of a build, is atomic across workers and only sends the
+    keys that changed."""
+    redis_cache_compression: Literal["none", "zlib", "zstd", "lz4"] = "none"
+    """The algorithm the Redis cache uses to compress large values. 'zstd' and 'lz4' require the zstandard and lz4
+    packages."""
+    redis_cache_compression_threshold: int = 64 * 1024
+    """The size in bytes from which the Redis cache compresses values."""
+    tiered_cache_max_size: int | None = 100
+    """The maximum number of items each worker keeps in memory with the 'tiered' cache type. If None, there is no
+    limit."""
+    tiered_cache_expire: int = 300
+    """The time in seconds a worker uses its copy of an item with the 'tiered' cache type before reading it from Redis
+    again. It bounds how long a worker can serve an outdated item if a change notification is lost."""
+    cache_lock_stripes: int = 256
+    """The number of locks the keys of the chat cache share within a worker. Keys sharing a lock wait for each other,
+    so more locks mean less waiting, and the memory used does not grow with the number of flows."""
+    distributed_cache_locks: bool = False
+    """If set to True and the cache type is 'redis' or 'tiered', the workers hold a Redis lock while they write the
+    cache entry of a flow, so workers building the same flow do not overwrite each other's updates."""
+    distributed_cache_lock_lease: float = 30.0
+    """The time in seconds a worker holds a distributed cache lock at most. If a worker dies or hangs while holding
+    it, the others get it after this time. A worker that waits longer than this writes without the lock."""
 
     # Sentry
     sentry_dsn: str | None = None
@@ -216,6 +254,69 @@ class Settings(BaseSettings):
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
 
+    # Graph execution
+    graph_execution_mode: Literal["layered", "dataflow"] = "layered"
+    """How `Graph.process` schedules vertices. 'layered' runs the graph layer by layer and waits for the whole
+    layer to finish before starting the next one. 'dataflow' starts each vertex as soon as its own predecessors
+    have finished. Can be overridden per flow with the `execution_mode` key of the flow data."""
+    graph_max_concurrency: int | None = None
+    """The maximum number of vertices built at the same time in 'dataflow' mode. If None, there is no limit."""
+    graph_scheduling_policy: Literal["fifo", "critical_path"] = "critical_path"
+    """Which ready vertex gets a free slot first in 'dataflow' mode when `graph_max_concurrency` is set. 'fifo' starts
+    vertices in the order they became ready. 'critical_path' starts first the vertices with the longest chain of
+    expected build times after them, estimated from the recent build times of each vertex and component type."""
+    graph_cache_snapshots: bool = True
+    """If set to True, graphs kept in a Redis or disk cache between the steps of a build are stored as compact
+    snapshots with their structure, run state and plain results instead of being pickled whole. Outputs that are not
+    plain data, like models and clients, are built again when a later step needs them, only for components marked
+    `releasable`. Graphs with such outputs from other components are still pickled whole."""
+    graph_cache_snapshot_compression: bool = True
+    """If set to True, graph snapshots are compressed with zlib."""
+    graph_memory_budget: int | None = None
+    """The memory in MB the objects built by the vertices of one graph can take. Over it, the largest objects that no
+    vertex still waiting to build needs are released and built again only if they are asked for. Only components
+    marked `releasable`, whose outputs have no side effects, release their objects. The sizes are estimates. If None,
+    there is no limit."""
+    graph_memory_budget_per_worker: int | None = None
+    """The memory in MB the objects built by the vertices of all the graphs of a worker can take. Over it, the graphs
+    updated least recently release their objects first. If None, there is no limit."""
+    graph_template_cache_size: int = 100
+    """The maximum number of compiled flow graphs each worker keeps in memory to speed up the /run and webhook
+    endpoints. Set to 0 to build the graph from the flow data on every request."""
+    subflow_cache_size: int = 100
+    """The maximum number of flows each worker keeps in memory for components that run other flows, like Run Flow,
+    Sub Flow and flows used as tools. Set to 0 to load the flow from the database on every run."""
+    subflow_cache_ttl: int = 300
+    """The time in seconds a flow stays in the subflow cache. Entries are keyed by the flow ID and the time the flow
+    was last saved, so every worker runs the saved version right away; older versions expire after this time."""
+    graph_profiling_enabled: bool = False
+    """If set to True, `Graph.process` records how long each vertex waits on its predecessors and on the scheduler,
+    resolves its params, runs and stores its results. The profiles are available at /monitor/profiles."""
+    graph_profiles_max: int = 50
+    """The maximum number of run profiles each worker keeps in memory. Older profiles are dropped."""
+    vertex_result_cache_enabled: bool = False
+    """If set to True, components that declare `memoize = True` reuse the results of a previous build with the
+    same code and inputs instead of running again. Results are stored in the cache service and shared across
+    runs and users."""
+    vertex_result_cache_ttl: int = 3600
+    """The default time in seconds a memoized vertex result can be reused. Components can override it with
+    `memoize_ttl`."""
+    vertex_result_cache_max_entry_size: int = 1024 * 1024
+    """The default maximum size in bytes of a memoized vertex result. Larger results are not stored. Components
+    can override it with `memoize_max_size`."""
+    executor_cpu_pool_size: int | None = None
+    """The number of threads each worker uses for the synchronous code of components that declare
+    `executor = "cpu"`. Defaults to the number of CPUs."""
+    executor_io_pool_size: int = 32
+    """The number of threads each worker uses for the synchronous code of components that do blocking I/O,
+    which is the default for components."""
+    executor_llm_pool_size: int = 16
+    """The number of threads each worker uses for synchronous model calls, including components that declare
+    `executor = "llm"`."""
+    executor_process_pool_size: int = 0
+    """The number of processes each worker uses for CPU-heavy pure functions passed to `Component.run_in_process`.
+    Set to 0 to run them on the "cpu" thread pool instead."""
+
     # MCP Server
     mcp_server_enabled: bool = True
     """If set to False, Langflow will not enable the MCP server."""
@@ -238,6 +339,11 @@ class Settings(BaseSettings):
 
     event_delivery: Literal["polling", "streaming"] = "streaming"
     """How to deliver build events to the frontend. Can be 'polling' or 'streaming'."""
+    token_flush_interval: float = 0.03
+    """The time in seconds streamed tokens are buffered before being sent as a single token event.
+    Set to 0 to send an event for every token."""
+    token_flush_size: int = 256
+    """The number of buffered characters that triggers sending a token event before the flush interval ends."""
 
     @field_validator("dev")
     @classmethod
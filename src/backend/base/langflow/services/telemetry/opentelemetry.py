@@ -1,9 +1,11 @@
 import threading
-from collections.abc import Mapping
+import time
+from collections.abc import Callable, Mapping
 from enum import Enum
 from typing import Any
 from weakref import WeakValueDictionary
 
+from loguru import logger
 from opentelemetry import metrics
 from opentelemetry.exporter.prometheus import PrometheusMetricReader
 from opentelemetry.metrics import CallbackOptions, Observation
@@ -13,6 +15,8 @@ from opentelemetry.sdk.resources import Resource
 
 # a default OpenTelemetry meter name
 langflow_meter_name = "langflow"
+# The minimum time in seconds between two refreshes of the gauges set from another source
+GAUGE_REFRESH_INTERVAL = 1.0
 
 """
 If the measurement values are non-additive, use an Asynchronous Gauge.
@@ -42,14 +46,17 @@ class ObservableGaugeWrapper:
     instead it uses a callback function to get the value, we need to create a wrapper class.
     """
 
-    def __init__(self, name: str, description: str, unit: str):
+    def __init__(self, name: str, description: str, unit: str, before_read: Callable[[], None] | None = None):
         self._values: dict[tuple[tuple[str, str], ...], float] = {}
+        self._before_read = before_read
         self._meter = metrics.get_meter(langflow_meter_name)
         self._gauge = self._meter.create_observable_gauge(
             name=name, description=description, unit=unit, callbacks=[self._callback]
         )
 
     def _callback(self, _options: CallbackOptions):
+        if self._before_read is not None:
+            self._before_read()
         return [Observation(value, attributes=dict(labels)) for labels, value in self._values.items()]
 
         # return [Observation(self._value)]
@@ -111,6 +118,9 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
     _meter_provider: MeterProvider | None = None
     _initialized: bool = False  # Add initialization flag
     prometheus_enabled: bool = True
+    _gauge_refreshers: dict[str, Callable[[], None]] = {}
+    _gauge_refresh_lock = threading.Lock()
+    _gauges_refreshed_at: float = 0.0
 
     def _add_metric(
         self, name: str, description: str, unit: str, metric_type: MetricType, labels: dict[str, bool]
@@ -140,6 +150,31 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             metric_type=MetricType.COUNTER,
             labels={"flow_id": mandatory_label},
         )
+        for name, description, unit in (
+            ("cache_hits", "The reads of the cache that found their key", ""),
+            ("cache_misses", "The reads of the cache that did not find their key", ""),
+            ("cache_hit_ratio", "The share of the reads of the cache that found their key", ""),
+            ("cache_writes", "The writes to the cache", ""),
+            ("cache_deletes", "The deletions from the cache", ""),
+            ("cache_evictions", "The items evicted from the in-memory cache to stay within its budget", ""),
+            ("cache_entries", "The items in the in-memory cache", ""),
+            ("cache_bytes", "The estimated size of the items in the in-memory cache", "bytes"),
+            ("cache_bytes_written", "The serialized size of the items written to the cache", "bytes"),
+        ):
+            self._add_metric(
+                name=name,
+                description=description,
+                unit=unit,
+                metric_type=MetricType.OBSERVABLE_GAUGE,
+                labels={"namespace": mandatory_label},
+            )
+        self._add_metric(
+            name="cache_operation_seconds",
+            description="The mean time the operations of the cache took",
+            unit="seconds",
+            metric_type=MetricType.OBSERVABLE_GAUGE,
+            labels={"namespace": mandatory_label, "operation": mandatory_label},
+        )
 
     def __init__(self, *, prometheus_enabled: bool = True):
         # Only initialize once
@@ -193,6 +228,7 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
                 name=metric.name,
                 description=metric.description,
                 unit=metric.unit,
+                before_read=self._refresh_gauges,
             )
         if metric.type == MetricType.UP_DOWN_COUNTER:
             return self.meter.create_up_down_counter(
@@ -209,6 +245,26 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
         msg = f"Unknown metric type: {metric.type}"
         raise ValueError(msg)
 
+    def add_gauge_refresher(self, name: str, refresh: Callable[[], None]) -> None:
+        """Runs `refresh` before the gauges are read, so it can set them from the source of their values.
+
+        The refreshers run at most once every GAUGE_REFRESH_INTERVAL seconds. A refresher added
+        again with the same name replaces the previous one.
+        """
+        self._gauge_refreshers[name] = refresh
+
+    def _refresh_gauges(self) -> None:
+        with self._gauge_refresh_lock:
+            now = time.monotonic()
+            if now - OpenTelemetry._gauges_refreshed_at < GAUGE_REFRESH_INTERVAL:
+                return
+            OpenTelemetry._gauges_refreshed_at = now
+            for name, refresh in list(self._gauge_refreshers.items()):
+                try:
+                    refresh()
+                except Exception:  # noqa: BLE001
+                    logger.opt(exception=True).debug(f"Error refreshing the {name} gauges")
+
     def validate_labels(self, metric_name: str, labels: Mapping[str, str]) -> None:
         reg = self._metrics_registry.get(metric_name)
         if reg is None:
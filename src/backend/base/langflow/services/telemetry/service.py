@@ -10,6 +10,7 @@ import httpx
 from loguru import logger
 
 from langflow.services.base import Service
+from langflow.services.cache.metrics import export_cache_metrics
 from langflow.services.telemetry.opentelemetry import OpenTelemetry
 from langflow.services.telemetry.schema import (
     ComponentPayload,
@@ -39,6 +40,7 @@ class TelemetryService(Service):
         self._stopping = False
 
         self.ot = OpenTelemetry(prometheus_enabled=settings_service.settings.prometheus_enabled)
+        self.ot.add_gauge_refresher("cache", self._export_cache_metrics)
         self.architecture: str | None = None
         self.worker_task: asyncio.Task | None = None
         # Check for do-not-track settings
@@ -46,6 +48,11 @@ class TelemetryService(Service):
             os.getenv("DO_NOT_TRACK", "False").lower() == "true" or settings_service.settings.do_not_track
         )
 
+    def _export_cache_metrics(self) -> None:
+        from langflow.services.deps import get_cache_service
+
+        export_cache_metrics(self.ot, get_cache_service())
+
     async def telemetry_worker(self) -> None:
         while self.running:
             func, payload, path = await self.telemetry_queue.get()
@@ -203,6 +203,9 @@ class Output(BaseModel):
     tool_mode: bool = Field(default=True)
     """Specifies if the output should be used as a tool"""
 
+    concurrent: bool = Field(default=False)
+    """Specifies if the output can be evaluated at the same time as the other concurrent outputs of the component."""
+
     def to_dict(self):
         return self.model_dump(by_alias=True, exclude_none=True)
 
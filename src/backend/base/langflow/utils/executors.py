@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import os
+import pickle
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+from loguru import logger
+
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar("T")
+
+ExecutorKind = Literal["cpu", "io", "llm"]
+"""The thread pools components can declare: "cpu" for computation, "io" for blocking I/O and "llm" for model calls."""
+
+_DEFAULT_IO_POOL_SIZE = 32
+_DEFAULT_LLM_POOL_SIZE = 16
+
+
+class _Call:
+    __slots__ = ("abandoned", "started")
+
+    def __init__(self) -> None:
+        self.started = False
+        self.abandoned = False
+
+
+class ExecutorPool:
+    """A named executor that keeps count of the work waiting for and running on it.
+
+    Thread pools run the function in a copy of the current context, like `asyncio.to_thread`.
+    """
+
+    def __init__(self, name: str, max_workers: int, *, processes: bool = False) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self.processes = processes
+        self._executor: Executor = (
+            ProcessPoolExecutor(max_workers=max_workers)
+            if processes
+            else ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"langflow-{name}")
+        )
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+
+    def _start(self, call: _Call | None = None) -> None:
+        with self._lock:
+            if call is None or not call.abandoned:
+                self.queued -= 1
+            if call is not None:
+                call.started = True
+            self.running += 1
+
+    def _finish(self, *, failed: bool) -> None:
+        with self._lock:
+            self.running -= 1
+            if failed:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+    def _run_tracked(self, call: _Call, func: Callable[..., T], *args: Any) -> T:
+        self._start(call)
+        try:
+            result = func(*args)
+        except BaseException:
+            self._finish(failed=True)
+            raise
+        self._finish(failed=False)
+        return result
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Runs `func(*args)` on the pool and waits for the result."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self.queued += 1
+        if self.processes:
+            # The worker processes cannot report back when they pick the call up,
+            # so the call counts as running from the moment it is submitted
+            self._start()
+            try:
+                result = await loop.run_in_executor(self._executor, functools.partial(func, *args))
+            except BaseException:
+                self._finish(failed=True)
+                raise
+            self._finish(failed=False)
+            return result
+        context = contextvars.copy_context()
+        call = _Call()
+        try:
+            return await loop.run_in_executor(
+                self._executor, functools.partial(context.run, self._run_tracked, call, func, *args)
+            )
+        finally:
+            with self._lock:
+                if not call.started:
+                    # Cancelled before a worker picked the call up
+                    call.abandoned = True
+                    self.queued -= 1
+
+    def stats(self) -> dict[str, Any]:
+        """Returns the size of the pool and how much work is queued, running and done."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "type": "process" if self.processes else "thread",
+                "max_workers": self.max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "failed": self.failed,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pools: dict[str, ExecutorPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool_size(name: str) -> int:
+    settings = get_settings_service().settings
+    if name == "cpu":
+        return settings.executor_cpu_pool_size or os.cpu_count() or 1
+    if name == "io":
+        return settings.executor_io_pool_size or _DEFAULT_IO_POOL_SIZE
+    if name == "llm":
+        return settings.executor_llm_pool_size or _DEFAULT_LLM_POOL_SIZE
+    return settings.executor_process_pool_size
+
+
+def get_executor_pool(name: ExecutorKind | Literal["process"]) -> ExecutorPool:
+    """Returns the pool with the given name, creating it with the size from the settings on first use."""
+    if (pool := _pools.get(name)) is not None:
+        return pool
+    with _pools_lock:
+        if (pool := _pools.get(name)) is None:
+            pool = ExecutorPool(name, _get_pool_size(name), processes=name == "process")
+            _pools[name] = pool
+    return pool
+
+
+async def run_in_executor_pool(name: ExecutorKind, func: Callable[..., T], *args: Any) -> T:
+    """Runs a blocking function on one of the named thread pools."""
+    return await get_executor_pool(name).run(func, *args)
+
+
+async def run_in_process(func: Callable[..., T], *args: Any) -> T:
+    """Runs a CPU-heavy pure function in the process pool.
+
+    The function and its arguments must be picklable. If the process pool is disabled
+    (`executor_process_pool_size` is 0) or they cannot be pickled, the function runs on the "cpu" thread pool.
+    """
+    if get_settings_service().settings.executor_process_pool_size > 0:
+        try:
+            pickle.dumps((func, args))
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.debug(f"Running {getattr(func, '__name__', func)} in a thread because it cannot be pickled: {e}")
+        else:
+            return await get_executor_pool("process").run(func, *args)
+    return await run_in_executor_pool("cpu", func, *args)
+
+
+def get_executor_pools_stats() -> list[dict[str, Any]]:
+    """Returns the stats of the pools created so far in this worker."""
+    return [pool.stats() for pool in list(_pools.values())]
+
+
+def shutdown_executor_pools() -> None:
+    """Shuts down the pools of this worker. They are created again on next use."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown()
+        _pools.clear()
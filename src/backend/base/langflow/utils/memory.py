@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import sys
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any
+
+import pandas as pd
+from pydantic import BaseModel
+
+DEFAULT_MAX_OBJECTS = 50_000
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None))
+_SKIPPED_TYPES = (type, ModuleType, FunctionType, MethodType, BuiltinFunctionType)
+
+
+def estimate_size(value: Any, *, max_objects: int = DEFAULT_MAX_OBJECTS) -> int:
+    """Returns an estimate of the memory in bytes held by a value and the objects it references.
+
+    Containers, pydantic models and the attributes of other objects are followed, and DataFrames
+    count their buffers. Objects referenced more than once count once. The walk stops after
+    `max_objects` objects, so the size of very large structures is underestimated.
+    """
+    size = 0
+    seen: set[int] = set()
+    stack = [value]
+    while stack and len(seen) < max_objects:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _SKIPPED_TYPES):
+            continue
+        seen.add(id(item))
+        if isinstance(item, pd.DataFrame):
+            size += int(item.memory_usage(deep=True).sum())
+            continue
+        if isinstance(item, pd.Series):
+            size += int(item.memory_usage(deep=True))
+            continue
+        try:
+            size += sys.getsizeof(item)
+        except TypeError:
+            continue
+        if isinstance(item, _ATOMIC_TYPES):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, list | tuple | set | frozenset):
+            stack.extend(item)
+        elif isinstance(item, BaseModel):
+            stack.extend(item.__dict__.values())
+        elif hasattr(item, "__dict__"):
+            stack.extend(vars(item).values())
+    return size
@@ -0,0 +1,237 @@
+"""Benchmarks of the graph engine on synthetic flows.
+
+Every flow is made of `Step` components that either do nothing or sleep, so the numbers only
+reflect the engine itself and the suite runs fully offline. The results are written as JSON to
+the path in `LANGFLOW_BENCHMARK_OUTPUT` (or to the pytest temporary directory) so that they can
+be compared from one release to the next.
+"""
+
+import asyncio
+import json
+import os
+import platform
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TypeVar
+
+import pytest
+from langflow.components.logic.loop import LoopComponent
+from langflow.custom import Component
+from langflow.graph import Graph
+from langflow.io import DataInput, IntInput, Output
+from langflow.schema import Data
+from langflow.utils.version import get_version_info
+
+# Running a vertex costs far more than preparing it, and tracing allocations slows runs down
+# several times over, so the larger graphs are only prepared
+PREPARE_SIZES = (10, 100, 500)
+PROCESS_SIZES = (10, 100)
+MEMORY_SIZES = (10, 50)
+LOOP_ITEMS = 3
+
+T = TypeVar("T")
+
+
+class Step(Component):
+    display_name = "Step"
+    description = "Waits for a while and returns a Data object."
+
+    inputs = [
+        DataInput(name="data", display_name="Data", is_list=True),
+        IntInput(name="delay_ms", display_name="Delay (ms)", value=0),
+    ]
+    outputs = [
+        Output(display_name="Data", name="data_output", method="run"),
+    ]
+
+    async def run(self) -> Data:
+        if self.delay_ms:
+            await asyncio.sleep(self.delay_ms / 1000)
+        return Data(text=self._id)
+
+
+def build_payload(add_vertices: Callable[[Graph], None]) -> dict:
+    graph = Graph()
+    add_vertices(graph)
+    graph.initialize()
+    return graph.dump()["data"]
+
+
+def chain(size: int, delay_ms: int = 0) -> dict:
+    """step-0 -> step-1 -> ... -> step-{size - 1}."""
+
+    def add_vertices(graph: Graph) -> None:
+        for index in range(size):
+            graph.add_component(Step(_id=f"step-{index}", delay_ms=delay_ms))
+            if index:
+                graph.add_component_edge(f"step-{index - 1}", ("data_output", "data"), f"step-{index}")
+
+    return build_payload(add_vertices)
+
+
+def fan_out(size: int, delay_ms: int = 0) -> dict:
+    """One root feeding `size - 1` leaves."""
+
+    def add_vertices(graph: Graph) -> None:
+        graph.add_component(Step(_id="root", delay_ms=delay_ms))
+        for index in range(size - 1):
+            graph.add_component(Step(_id=f"leaf-{index}", delay_ms=delay_ms))
+            graph.add_component_edge("root", ("data_output", "data"), f"leaf-{index}")
+
+    return build_payload(add_vertices)
+
+
+def diamond(size: int, delay_ms: int = 0) -> dict:
+    """One root feeding `size - 2` branches that all feed the same sink."""
+
+    def add_vertices(graph: Graph) -> None:
+        graph.add_component(Step(_id="root", delay_ms=delay_ms))
+        graph.add_component(Step(_id="sink", delay_ms=delay_ms))
+        for index in range(size - 2):
+            graph.add_component(Step(_id=f"branch-{index}", delay_ms=delay_ms))
+            graph.add_component_edge("root", ("data_output", "data"), f"branch-{index}")
+            graph.add_component_edge(f"branch-{index}", ("data_output", "data"), "sink")
+
+    return build_payload(add_vertices)
+
+
+def loop(size: int, delay_ms: int = 0) -> dict:
+    """A loop whose body is a chain of `size - 2` steps, with a sink on its Done output."""
+
+    def add_vertices(graph: Graph) -> None:
+        graph.add_component(LoopComponent(_id="loop"))
+        graph.add_component(Step(_id="sink", delay_ms=delay_ms))
+        graph.add_component_edge("loop", ("done", "data"), "sink")
+        for index in range(size - 2):
+            graph.add_component(Step(_id=f"body-{index}", delay_ms=delay_ms))
+            if index:
+                graph.add_component_edge(f"body-{index - 1}", ("data_output", "data"), f"body-{index}")
+            else:
+                graph.add_component_edge("loop", ("item", "data"), "body-0")
+
+    payload = build_payload(add_vertices)
+    # The loop input is an output handle, which add_component_edge cannot create
+    last = f"body-{size - 3}"
+    payload["edges"].append(
+        {
+            "source": last,
+            "target": "loop",
+            "data": {
+                "sourceHandle": {"dataType": "Step", "id": last, "name": "data_output", "output_types": ["Data"]},
+                "targetHandle": {"dataType": "LoopComponent", "id": "loop", "name": "item", "output_types": ["Data"]},
+            },
+        }
+    )
+    return payload
+
+
+SHAPES = {"chain": chain, "fan_out": fan_out, "diamond": diamond, "loop": loop}
+
+
+def prepared_graph(payload: dict) -> Graph:
+    graph = Graph.from_payload(payload)
+    graph.prepare()
+    if "loop" in graph.vertex_map:
+        graph.get_vertex("loop").update_raw_params(
+            {"data": [Data(text=str(index)) for index in range(LOOP_ITEMS)]}, overwrite=True
+        )
+    return graph
+
+
+def lookup_edges(graph: Graph) -> None:
+    """Runs the per-vertex edge lookups of graph preparation."""
+    for vertex in graph.vertices:
+        graph.get_vertex_edges(vertex.id)
+        graph.get_vertices_with_target(vertex.id)
+        vertex.incoming_edges  # noqa: B018
+        vertex.outgoing_edges  # noqa: B018
+
+
+def timed(func: Callable[[], T]) -> tuple[T, float]:
+    """Returns the result of the function and the seconds it took."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def vertex_builds(shape: str, size: int) -> int:
+    """Returns the number of vertex builds in a run, counting every iteration of a loop body."""
+    return size + (LOOP_ITEMS - 1) * (size - 2) if shape == "loop" else size
+
+
+def record(results: list[dict], shape: str, size: int, delay_ms: int, metric: str, value: float, unit: str) -> None:
+    results.append({"shape": shape, "size": size, "delay_ms": delay_ms, "metric": metric, "value": value, "unit": unit})
+
+
+@pytest.fixture(scope="module")
+def results(tmp_path_factory):
+    records: list[dict] = []
+    yield records
+    output = os.getenv("LANGFLOW_BENCHMARK_OUTPUT") or tmp_path_factory.getbasetemp() / "graph_engine.json"
+    Path(output).write_text(
+        json.dumps(
+            {
+                "suite": "graph_engine",
+                "langflow_version": get_version_info()["version"],
+                "python_version": platform.python_version(),
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "results": records,
+            },
+            indent=2,
+        )
+    )
+
+
+@pytest.mark.parametrize("size", PREPARE_SIZES)
+@pytest.mark.parametrize("shape", SHAPES)
+def test_graph_preparation(results, shape, size):
+    """Benchmark building, preparing and sorting a graph."""
+    payload = SHAPES[shape](size)
+
+    graph, from_payload_time = timed(lambda: Graph.from_payload(payload))
+    _, prepare_time = timed(graph.prepare)
+    # Sorting is cheap and runs at the start of every run, so take the best of a few
+    sort_vertices_time = min(timed(graph.sort_vertices)[1] for _ in range(3))
+    edge_lookups_time = min(timed(lambda: lookup_edges(graph))[1] for _ in range(3))
+
+    assert len(graph.vertices) == size
+    record(results, shape, size, 0, "from_payload", from_payload_time, "s")
+    record(results, shape, size, 0, "prepare", prepare_time, "s")
+    record(results, shape, size, 0, "sort_vertices", sort_vertices_time, "s")
+    record(results, shape, size, 0, "edge_lookups_per_vertex", edge_lookups_time / size, "s")
+
+
+@pytest.mark.parametrize("delay_ms", [0, 5])
+@pytest.mark.parametrize("size", PROCESS_SIZES)
+@pytest.mark.parametrize("shape", SHAPES)
+async def test_graph_process(results, shape, size, delay_ms):
+    """Benchmark running a graph, in vertex builds per second."""
+    graph = prepared_graph(SHAPES[shape](size, delay_ms))
+
+    start = time.perf_counter()
+    await graph.process(fallback_to_env_vars=False)
+    duration = time.perf_counter() - start
+
+    assert all(vertex.built for vertex in graph.vertices)
+    record(results, shape, size, delay_ms, "process", duration, "s")
+    record(results, shape, size, delay_ms, "process_throughput", vertex_builds(shape, size) / duration, "vertices/s")
+
+
+@pytest.mark.parametrize("size", MEMORY_SIZES)
+@pytest.mark.parametrize("shape", SHAPES)
+async def test_graph_process_memory(results, shape, size):
+    """Benchmark the peak memory allocated while running a graph."""
+    graph = prepared_graph(SHAPES[shape](size))
+
+    tracemalloc.start()
+    try:
+        await graph.process(fallback_to_env_vars=False)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert all(vertex.built for vertex in graph.vertices)
+    record(results, shape, size, 0, "process_peak_memory", peak, "bytes")
@@ -0,0 +1,92 @@
+import time
+
+import pytest
+from langflow.components.inputs import ChatInput  # noqa: F401
+from langflow.custom import Component
+from langflow.graph import Graph
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class Relay(Component):
+    display_name = "Relay"
+    description = "Passes the text it receives to the next component."
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text", value="hello"),
+    ]
+    outputs = [
+        Output(display_name="Message", name="relay", method="relay"),
+    ]
+
+    def relay(self) -> Message:
+        return Message(text=self.text)
+
+
+def build_chain_payload(size: int) -> dict:
+    graph = Graph()
+    for index in range(size):
+        graph.add_component(Relay(_id=f"relay-{index}"))
+        if index:
+            graph.add_component_edge(f"relay-{index - 1}", ("relay", "text"), f"relay-{index}")
+    graph.initialize()
+    return graph.dump()["data"]
+
+
+def best_time(func, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def lookup_edges(graph: Graph) -> int:
+    """Runs the per-vertex edge lookups of graph preparation, returning the number of edges found."""
+    found = 0
+    for vertex in graph.vertices:
+        found += len(graph.get_vertex_edges(vertex.id)) + len(vertex.incoming_edges) + len(vertex.outgoing_edges)
+    return found
+
+
+def scan_edges(graph: Graph) -> int:
+    """Runs the same lookups by scanning the edge list, as they were done before the edges were indexed."""
+    found = 0
+    for vertex in graph.vertices:
+        found += sum(vertex.id in {edge.source_id, edge.target_id} for edge in graph.edges)
+        found += sum(edge.target_id == vertex.id for edge in graph.edges)
+        found += sum(edge.source_id == vertex.id for edge in graph.edges)
+    return found
+
+
+@pytest.fixture(scope="module")
+def graphs():
+    return {size: Graph.from_payload(build_chain_payload(size)) for size in (50, 400)}
+
+
+def test_edge_indexes_match_the_edge_list(graphs):
+    """The indexed lookups used during graph preparation return what a scan of the edges would."""
+    graph = graphs[400]
+
+    for vertex in graph.vertices:
+        vertex_edges = [edge for edge in graph.edges if vertex.id in {edge.source_id, edge.target_id}]
+        assert graph.get_vertex_edges(vertex.id) == vertex_edges
+        assert vertex.incoming_edges == [edge for edge in graph.edges if edge.target_id == vertex.id]
+        assert vertex.outgoing_edges == [edge for edge in graph.edges if edge.source_id == vertex.id]
+
+
+def test_edge_lookups_scale_with_vertex_degree(graphs, record_property):
+    """Benchmark the per-vertex edge lookups against a scan of the edge list.
+
+    The cost per vertex of a scan grows with the number of edges (8x here), while the indexes only
+    depend on the degree of the vertex. The timings vary too much between CI runners to be
+    asserted, so they are reported as properties of the test.
+    """
+    for name, lookup in {"scan": scan_edges, "index": lookup_edges}.items():
+        per_vertex = {}
+        for size, graph in graphs.items():
+            assert lookup(graph) == scan_edges(graph)
+            per_vertex[size] = best_time(lambda graph=graph, lookup=lookup: lookup(graph)) / size
+            record_property(f"{name}_seconds_per_vertex_{size}", per_vertex[size])
+        record_property(f"{name}_growth", per_vertex[400] / per_vertex[50])
@@ -1,6 +1,13 @@
+import copy
 from unittest.mock import patch
 
-from langflow.api.utils import get_suggestion_message
+import pytest
+from langflow.api.utils import get_suggestion_message, update_cached_graph_from_data
+from langflow.custom import Component
+from langflow.graph import Graph
+from langflow.graph.vertex.base import Vertex
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
 from langflow.services.database.models.flow.utils import get_outdated_components
 from langflow.utils.version import get_version_info
 
@@ -43,3 +50,114 @@ def test_get_outdated_components():
         result = get_outdated_components(flow)
         # Assert the result is as expected
         assert result == expected_outdated_components
+
+
+class Echo(Component):
+    display_name = "Echo"
+    description = "Returns the text it receives."
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text", value="hello"),
+    ]
+    outputs = [
+        Output(display_name="Message", name="echo", method="echo"),
+    ]
+
+    def echo(self) -> Message:
+        return Message(text=self.text)
+
+
+class FakeChatService:
+    snapshot_graphs = False
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    async def get_cache(self, key):  # noqa: ARG002
+        return {"result": self.graph, "type": type(self.graph)}
+
+
+@pytest.fixture
+def payload():
+    graph = Graph()
+    graph.add_component(Echo(_id="first"))
+    graph.add_component(Echo(_id="second"))
+    graph.add_component_edge("first", ("echo", "text"), "second")
+    graph.initialize()
+    return copy.deepcopy(graph.dump()["data"])
+
+
+@pytest.fixture
+async def cached_graph(payload):
+    graph = Graph.from_payload(copy.deepcopy(payload), "flow", user_id="user")
+    await graph.process(fallback_to_env_vars=False, use_cache=False)
+    return graph
+
+
+def set_text(payload, node_id, text):
+    payload = copy.deepcopy(payload)
+    node = next(node for node in payload["nodes"] if node["id"] == node_id)
+    node["data"]["node"]["template"]["text"]["value"] = text
+    return payload
+
+
+async def test_cached_graph_is_updated_from_changed_node_data(payload, cached_graph):
+    payload = set_text(payload, "second", "changed")
+
+    graph = await update_cached_graph_from_data("flow", payload, FakeChatService(cached_graph), user_id="user")
+
+    assert graph is not None
+    assert graph is not cached_graph
+    assert graph.get_vertex("first").built
+    assert not graph.get_vertex("second").built
+    assert graph.run_id
+    # The cached graph other jobs may use is left as it was
+    assert cached_graph.get_vertex("second").built
+
+
+async def test_structural_changes_build_the_graph_again(payload, cached_graph):
+    payload = {**payload, "edges": []}
+
+    assert await update_cached_graph_from_data("flow", payload, FakeChatService(cached_graph), user_id="user") is None
+
+
+async def test_graphs_cached_for_other_users_are_not_updated(payload, cached_graph):
+    payload = set_text(payload, "second", "changed")
+
+    assert await update_cached_graph_from_data("flow", payload, FakeChatService(cached_graph), user_id="other") is None
+
+
+@pytest.fixture
+def built_vertices(monkeypatch):
+    built = []
+    build = Vertex.build
+
+    async def build_and_record(self, *args, **kwargs):
+        if kwargs.get("requester") is None:
+            built.append(self.id)
+        return await build(self, *args, **kwargs)
+
+    monkeypatch.setattr(Vertex, "build", build_and_record)
+    return built
+
+
+async def test_updated_graph_builds_again_only_the_changed_vertices(payload, cached_graph, built_vertices):
+    payload = set_text(payload, "second", "changed")
+    graph = await update_cached_graph_from_data("flow", payload, FakeChatService(cached_graph), user_id="user")
+
+    await graph.process(fallback_to_env_vars=False, use_cache=False)
+
+    assert built_vertices == ["second"]
+    assert graph.get_vertex("second").built
+    # The results are only kept once
+    await graph.process(fallback_to_env_vars=False, use_cache=False)
+    assert built_vertices == ["second", "first", "second"]
+
+
+async def test_updated_graph_builds_everything_again_for_other_inputs(payload, cached_graph, built_vertices):
+    payload = set_text(payload, "second", "changed")
+    graph = await update_cached_graph_from_data("flow", payload, FakeChatService(cached_graph), user_id="user")
+
+    await graph.build_vertex("first", user_id="user", inputs_dict={"input_value": "other"})
+
+    assert built_vertices == ["first"]
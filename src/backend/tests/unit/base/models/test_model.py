@@ -0,0 +1,87 @@
+import threading
+from collections.abc import AsyncIterator
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langflow.base.models.model import LCModelComponent
+from langflow.field_typing import LanguageModel
+
+
+class SyncChatModel(BaseChatModel):
+    @property
+    def _llm_type(self) -> str:
+        return "sync-fake"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:  # noqa: ARG002
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=f"sync: {messages[-1].content}"))])
+
+
+class AsyncChatModel(SyncChatModel):
+    @property
+    def _llm_type(self) -> str:
+        return "async-fake"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:  # noqa: ARG002
+        msg = "The sync path should not be used"
+        raise AssertionError(msg)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:  # noqa: ARG002
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=f"async: {messages[-1].content}"))])
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs) -> AsyncIterator[ChatGenerationChunk]:  # noqa: ARG002
+        for token in ("async", " ", "stream"):
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+
+
+class FakeModelComponent(LCModelComponent):
+    display_name = "Fake Model"
+    inputs = [*LCModelComponent._base_inputs]
+
+    model_class: type[BaseChatModel] = SyncChatModel
+    build_threads: list[int] | None = None
+
+    def build_model(self) -> LanguageModel:
+        if self.build_threads is not None:
+            self.build_threads.append(threading.get_ident())
+        return self.model_class()
+
+
+def test_supports_native_async():
+    assert not LCModelComponent.supports_native_async(SyncChatModel())
+    assert LCModelComponent.supports_native_async(AsyncChatModel())
+    assert LCModelComponent.supports_native_async(AsyncChatModel(), stream=True)
+    assert LCModelComponent.supports_native_async(AsyncChatModel().bind(stop=["\n"]))
+
+
+@pytest.mark.parametrize(
+    ("model_class", "expected"),
+    [(SyncChatModel, "sync: hello"), (AsyncChatModel, "async: hello")],
+)
+async def test_text_response_uses_async_path_when_supported(model_class, expected):
+    component = FakeModelComponent(input_value="hello", stream=False)
+    component.model_class = model_class
+
+    assert await component.text_response() == expected
+
+
+async def test_text_response_streams_async_chunks():
+    component = FakeModelComponent(input_value="hello", stream=True)
+    component.model_class = AsyncChatModel
+
+    result = await component.text_response()
+
+    assert isinstance(result, AsyncIterator)
+    assert "".join([chunk.content async for chunk in result]) == "async stream"
+
+
+async def test_model_is_built_off_the_event_loop():
+    component = FakeModelComponent(input_value="hello", stream=False)
+    component.model_class = AsyncChatModel
+    component.build_threads = []
+
+    await component.text_response()
+
+    assert component.build_threads
+    assert threading.get_ident() not in component.build_threads
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+from langflow.components.inputs import TextInputComponent
+from langflow.components.logic.loop import LoopComponent
+from langflow.components.processing.parse_data import ParseDataComponent
+from langflow.custom import Component
+from langflow.exceptions.component import ComponentBuildError
+from langflow.graph import Graph
+from langflow.io import DataInput, MessageTextInput, Output
+from langflow.schema import Data
+
+
+class Shout(Component):
+    display_name = "Shout"
+    inputs = [
+        DataInput(name="data", display_name="Data"),
+        MessageTextInput(name="suffix", display_name="Suffix", value=""),
+    ]
+    outputs = [Output(display_name="Data", name="shout", method="shout")]
+
+    async def shout(self) -> Data:
+        concurrency = self.ctx["concurrency"]
+        concurrency["running"] += 1
+        concurrency["peak"] = max(concurrency["peak"], concurrency["running"])
+        self.ctx["calls"].append(self.data.text)
+        try:
+            if self.data.text == self.ctx["fail_on"]:
+                msg = "Cannot shout"
+                raise ValueError(msg)
+            # Make later items finish before earlier ones
+            await asyncio.sleep(0.01 * (3 - len(self.ctx["calls"]) % 3))
+            return Data(text=self.data.text.upper() + self.suffix)
+        finally:
+            concurrency["running"] -= 1
+
+
+def build_loop_graph(words: str, *, calls: list, fail_on: str | None = None, **loop_kwargs) -> Graph:
+    graph = Graph()
+    graph.add_component(LoopComponent(_id="loop", **loop_kwargs))
+    graph.add_component(TextInputComponent(_id="suffix", input_value="!"))
+    graph.add_component(Shout(_id="shout"))
+    graph.add_component(ParseDataComponent(_id="parse"))
+    graph.add_component_edge("loop", ("item", "data"), "shout")
+    graph.add_component_edge("suffix", ("text", "suffix"), "shout")
+    graph.add_component_edge("loop", ("done", "data"), "parse")
+    graph.initialize()
+    payload = graph.dump()["data"]
+    # The loop input is an output handle, which add_component_edge cannot create
+    payload["edges"].append(
+        {
+            "source": "shout",
+            "target": "loop",
+            "data": {
+                "sourceHandle": {"dataType": "Shout", "id": "shout", "name": "shout", "output_types": ["Data"]},
+                "targetHandle": {"dataType": "LoopComponent", "id": "loop", "name": "item", "output_types": ["Data"]},
+            },
+        }
+    )
+    graph = Graph.from_payload(payload)
+    graph.context = {"calls": calls, "fail_on": fail_on, "concurrency": {"running": 0, "peak": 0}}
+    graph.prepare()
+    graph.get_vertex("loop").update_raw_params({"data": [Data(text=word) for word in words]}, overwrite=True)
+    return graph
+
+
+async def run_loop(graph: Graph) -> list:
+    async for _ in graph.async_start():
+        pass
+    return graph.get_vertex("loop").results["done"]
+
+
+async def test_parallel_mode_runs_the_body_once_per_item_in_input_order():
+    calls: list = []
+    graph = build_loop_graph("abcde", calls=calls, mode="Parallel", max_concurrency=2)
+
+    results = await run_loop(graph)
+
+    assert [data.text for data in results] == ["A!", "B!", "C!", "D!", "E!"]
+    assert sorted(calls) == ["a", "b", "c", "d", "e"]
+    assert graph.get_vertex("parse").results["text"].text == "A!\nB!\nC!\nD!\nE!"
+
+
+async def test_parallel_mode_limits_concurrency():
+    graph = build_loop_graph("abcdefg", calls=[], mode="Parallel", max_concurrency=2, batch_size=3)
+
+    results = await run_loop(graph)
+
+    assert len(results) == 7
+    assert graph.context["concurrency"]["peak"] == 2
+
+
+@pytest.mark.parametrize(
+    ("on_error", "expected"),
+    [
+        ("Skip", ["A!", "B!", "D!"]),
+        ("Include Error", ["A!", "B!", "error", "D!"]),
+    ],
+)
+async def test_parallel_mode_handles_errors_per_item(on_error, expected):
+    graph = build_loop_graph("abcd", calls=[], fail_on="c", mode="Parallel", on_error=on_error, batch_size=2)
+
+    results = await run_loop(graph)
+
+    assert [("error" if "Cannot shout" in data.data.get("error", "") else data.text) for data in results] == expected
+
+
+async def test_parallel_mode_fails_on_error_by_default():
+    graph = build_loop_graph("abcd", calls=[], fail_on="c", mode="Parallel")
+
+    with pytest.raises(ComponentBuildError, match="Error running the loop body for item 2"):
+        await run_loop(graph)
+
+
+async def test_parallel_items_run_without_cache_tracing_or_profiling(monkeypatch):
+    graph = build_loop_graph("ab", calls=[], mode="Parallel")
+    item_runs = []
+    process = Graph.process
+
+    async def record_process(self, **kwargs):
+        if self is not graph:
+            item_runs.append((kwargs.get("use_cache"), kwargs.get("profile"), self.tracing_service))
+        return await process(self, **kwargs)
+
+    monkeypatch.setattr(Graph, "process", record_process)
+
+    await run_loop(graph)
+
+    assert item_runs == [(False, False, None), (False, False, None)]
@@ -252,3 +252,42 @@ async def test_component_streaming_message():
             tokens.append(event)
 
     assert len(tokens) > 0
+
+
+class ConcurrentOutputsComponent(Component):
+    """Test component whose outputs only finish when both of them are running."""
+
+    def build(self) -> None:
+        pass
+
+    async def get_first(self) -> str:
+        self.log("first log")
+        self.started.append("first")
+        await self.both_started.wait()
+        return "first"
+
+    async def get_second(self) -> str:
+        self.started.append("second")
+        self.both_started.set()
+        self.log("second log")
+        return "second"
+
+
+@pytest.mark.usefixtures("client")
+async def test_component_build_results_evaluates_concurrent_outputs_together():
+    component = ConcurrentOutputsComponent()
+    component.started = []
+    component.both_started = asyncio.Event()
+    component._outputs_map = {
+        "first": Output(name="first", method="get_first", concurrent=True),
+        "second": Output(name="second", method="get_second", concurrent=True),
+    }
+
+    results, artifacts = await asyncio.wait_for(component._build_results(), timeout=5)
+
+    assert component.started == ["first", "second"]
+    assert list(results) == ["first", "second"]
+    assert results == {"first": "first", "second": "second"}
+    assert list(artifacts) == ["first", "second"]
+    assert [log.message for log in component._output_logs["first"]] == ["first log"]
+    assert [log.message for log in component._output_logs["second"]] == ["second log"]
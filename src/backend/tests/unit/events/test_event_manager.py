@@ -4,7 +4,7 @@ import time
 import uuid
 
 import pytest
-from langflow.events.event_manager import EventManager
+from langflow.events.event_manager import EventManager, TokenStream, create_default_event_manager
 from langflow.schema.log import LoggableType
 
 
@@ -210,3 +210,83 @@ class TestEventManager:
         # Accessing a non-registered event callback should return the 'noop' function
         callback = event_manager.on_non_existing_event
         assert callback.__name__ == "noop"
+
+
+class TestTokenStream:
+    @staticmethod
+    def _token_chunks(queue: asyncio.Queue) -> list[str]:
+        chunks = []
+        while not queue.empty():
+            _, str_data, _ = queue.get_nowait()
+            event = json.loads(str_data.decode("utf-8"))
+            assert event["event"] == "token"
+            chunks.append(event["data"]["chunk"])
+        return chunks
+
+    def test_chunks_are_coalesced_until_flush(self):
+        queue = asyncio.Queue()
+        token_stream = TokenStream(create_default_event_manager(queue), "message-id", flush_interval=60)
+
+        for chunk in ["Hello", " ", "World", "!"]:
+            token_stream.add(chunk)
+
+        assert queue.empty()
+        token_stream.flush()
+        assert self._token_chunks(queue) == ["Hello World!"]
+        assert token_stream.text == "Hello World!"
+
+    def test_size_threshold_flushes(self):
+        queue = asyncio.Queue()
+        token_stream = TokenStream(create_default_event_manager(queue), "message-id", flush_interval=60, flush_size=5)
+
+        for chunk in ["ab", "cd", "ef", "g"]:
+            token_stream.add(chunk)
+        token_stream.flush()
+
+        assert self._token_chunks(queue) == ["abcdef", "g"]
+
+    def test_zero_interval_sends_every_chunk(self):
+        queue = asyncio.Queue()
+        token_stream = TokenStream(create_default_event_manager(queue), "message-id", flush_interval=0)
+
+        for chunk in ["a", "b", "c"]:
+            token_stream.add(chunk)
+        token_stream.flush()
+
+        assert self._token_chunks(queue) == ["a", "b", "c"]
+
+    async def test_buffer_is_flushed_when_the_stream_pauses(self):
+        queue = asyncio.Queue()
+        token_stream = TokenStream(create_default_event_manager(queue), "message-id", flush_interval=0.05)
+
+        token_stream.add("Hello")
+        token_stream.add(" World")
+        assert queue.empty()
+
+        await asyncio.sleep(0.1)
+        assert self._token_chunks(queue) == ["Hello World"]
+
+        token_stream.add("!")
+        token_stream.flush()
+        await asyncio.sleep(0.1)
+        assert self._token_chunks(queue) == ["!"]
+
+    async def test_cancelled_stream_sends_no_more_tokens(self):
+        queue = asyncio.Queue()
+        token_stream = TokenStream(create_default_event_manager(queue), "message-id", flush_interval=0.05)
+
+        token_stream.add("Hello")
+        token_stream.cancel()
+
+        await asyncio.sleep(0.1)
+        assert queue.empty()
+        assert token_stream.text == "Hello"
+
+    def test_without_event_manager_only_builds_text(self):
+        token_stream = TokenStream(None, "message-id")
+
+        token_stream.add("a")
+        token_stream.add("b")
+        token_stream.flush()
+
+        assert token_stream.text == "ab"
@@ -1,3 +1,4 @@
+import copy
 import logging
 from collections import deque
 
@@ -131,6 +132,57 @@ def test_graph_functional_start_end():
     assert results[-1] == Finish()
 
 
+def test_graph_edge_indexes_follow_edge_changes():
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(_id="chat_output")
+    text_output = TextOutputComponent(_id="text_output")
+    graph = Graph()
+    for component in (chat_input, chat_output, text_output):
+        graph.add_component(component)
+    graph.add_component_edge("chat_input", ("message", "input_value"), "chat_output")
+    graph.add_component_edge("chat_input", ("message", "input_value"), "text_output")
+    graph.prepare()
+
+    assert {edge.target_id for edge in graph.get_vertex_edges("chat_input")} == {"chat_output", "text_output"}
+    assert graph.get_vertex_edges("chat_input", is_source=False) == []
+    assert graph.get_vertex("text_output").incoming_edges == graph.get_vertex_edges("text_output")
+    assert graph.get_edge("chat_input", "text_output").target_id == "text_output"
+    assert [vertex.id for vertex in graph.get_vertices_with_target("chat_output")] == ["chat_input"]
+
+    graph.remove_vertex("text_output")
+
+    assert graph.get_vertex_edges("text_output") == []
+    assert graph.get_edge("chat_input", "text_output") is None
+    assert [edge.target_id for edge in graph.get_vertex_edges("chat_input")] == ["chat_output"]
+
+
+def test_graph_update_from_payload_only_resets_downstream_vertices():
+    chat_input = ChatInput(_id="chat_input")
+    text_output = TextOutputComponent(_id="text_output")
+    chat_output = ChatOutput(_id="chat_output")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output.set(input_value=text_output.text_response)
+    payload = Graph(chat_input, chat_output).dump()["data"]
+    graph = Graph.from_payload(copy.deepcopy(payload))
+    for vertex in graph.vertices:
+        vertex.built = True
+    unchanged_vertex = graph.get_vertex("chat_input")
+
+    assert graph.update_from_payload(copy.deepcopy(payload)) == set()
+
+    node = next(node for node in payload["nodes"] if node["id"] == "text_output")
+    node["data"]["node"]["template"]["input_value"]["value"] = "changed"
+    invalidated = graph.update_from_payload(payload)
+
+    assert invalidated == {"text_output", "chat_output"}
+    assert graph.get_vertex("chat_input") is unchanged_vertex
+    assert unchanged_vertex.built is True
+    assert graph.get_vertex("text_output").built is False
+    assert graph.get_vertex("chat_output").built is False
+    assert {edge.target_id for edge in graph.get_vertex_edges("text_output")} == {"text_output", "chat_output"}
+    assert graph.get_edge("text_output", "chat_output").source_id == "text_output"
+
+
 @pytest.mark.skip(reason="Temporarily disabled")
 def test_graph_set_with_valid_component():
     tool = YfinanceToolComponent()
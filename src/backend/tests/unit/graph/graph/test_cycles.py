@@ -109,6 +109,48 @@ def test_cycle_in_graph_max_iterations():
         list(graph.start(max_iterations=2, config={"output": {"cache": False}}))
 
 
+def test_cycle_analysis_is_computed_once_per_graph():
+    text_input = TextInputComponent(_id="text_input")
+    router = ConditionalRouterComponent(_id="router")
+    text_input.set(input_value=router.false_response)
+    router.set(input_text=text_input.text_response, match_text="test", operator="equals")
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=router.true_response)
+
+    graph = Graph(text_input, text_output)
+
+    analysis = graph.cycle_analysis
+    assert graph.cycle_analysis is analysis
+    assert graph.is_cyclic is True
+    assert graph.cycle_vertices == {"text_input", "router"}
+    assert graph.cycles == [("router", "text_input")]
+    assert {vertex.id for vertex in graph.get_all_successors(graph.get_vertex("text_input"))} == {
+        "text_input",
+        "router",
+        "text_output",
+    }
+    with pytest.raises(ValueError, match="Graph contains a cycle"):
+        graph.topological_sort()
+
+
+def test_unpickled_graph_keeps_its_cycle_vertices_runnable():
+    text_input = TextInputComponent(_id="text_input")
+    router = ConditionalRouterComponent(_id="router")
+    text_input.set(input_value=router.false_response)
+    router.set(input_text=text_input.text_response, match_text="test", operator="equals")
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=router.true_response)
+    graph = Graph(text_input, text_output)
+    graph.prepare()
+
+    # What unpickling does, without pickling the components
+    restored = Graph.__new__(Graph)
+    restored.__setstate__(graph.__getstate__())
+
+    assert restored.run_manager.cycle_vertices == {"text_input", "router"}
+    assert not restored.run_manager.is_blocked("text_input")
+
+
 def test_that_outputs_cache_is_set_to_false_in_cycle():
     chat_input = ChatInput(_id="chat_input")
     router = ConditionalRouterComponent(_id="router")
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+from langflow.components.inputs import ChatInput  # noqa: F401
+from langflow.custom import Component
+from langflow.exceptions.component import ComponentBuildError
+from langflow.graph import Graph
+from langflow.io import IntInput, MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class SleepComponent(Component):
+    display_name = "Sleep"
+    description = "Waits for a while and appends its id to the text."
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text"),
+        IntInput(name="delay_ms", display_name="Delay (ms)", value=0),
+    ]
+    outputs = [
+        Output(display_name="Message", name="text_output", method="run"),
+    ]
+
+    async def run(self) -> Message:
+        if self.delay_ms < 0:
+            msg = "Negative delay"
+            raise ValueError(msg)
+        events = self.graph.context.setdefault("events", [])
+        running = self.graph.context.setdefault("running", set())
+        running.add(self._id)
+        self.graph.context["max_running"] = max(self.graph.context.get("max_running", 0), len(running))
+        events.append(("start", self._id))
+        await asyncio.sleep(self.delay_ms / 1000)
+        running.discard(self._id)
+        events.append(("end", self._id))
+        return Message(text=f"{self.text or ''}{self._id}")
+
+
+def build_graph(delays: dict[str, int], edges: list[tuple[str, str]]) -> Graph:
+    graph = Graph()
+    for vertex_id, delay in delays.items():
+        graph.add_component(SleepComponent(_id=vertex_id, delay_ms=delay))
+    for source, target in edges:
+        graph.add_component_edge(source, ("text_output", "text"), target)
+    graph.prepare()
+    return graph
+
+
+@pytest.fixture
+def skewed_graph():
+    # root feeds a slow branch and a fast chain; the fast chain should not wait for the slow branch
+    return build_graph(
+        {"root": 0, "slow": 200, "fast": 0, "after_fast": 0},
+        [("root", "slow"), ("root", "fast"), ("fast", "after_fast")],
+    )
+
+
+async def test_dataflow_starts_vertices_without_layer_barrier(skewed_graph):
+    await skewed_graph.process(fallback_to_env_vars=False, execution_mode="dataflow")
+
+    events = skewed_graph.context["events"]
+    assert events.index(("start", "after_fast")) < events.index(("end", "slow"))
+    assert skewed_graph.get_vertex("after_fast").built_object["text_output"].text == "rootfastafter_fast"
+    assert skewed_graph.get_vertex("slow").built_object["text_output"].text == "rootslow"
+
+
+async def test_layered_waits_for_the_whole_layer(skewed_graph):
+    await skewed_graph.process(fallback_to_env_vars=False, execution_mode="layered")
+
+    events = skewed_graph.context["events"]
+    assert events.index(("start", "after_fast")) > events.index(("end", "slow"))
+
+
+async def test_dataflow_respects_max_concurrency():
+    graph = build_graph(
+        {"root": 0, "a": 50, "b": 50, "c": 50, "d": 50},
+        [("root", "a"), ("root", "b"), ("root", "c"), ("root", "d")],
+    )
+
+    await graph.process(fallback_to_env_vars=False, execution_mode="dataflow", max_concurrency=2)
+
+    assert graph.context["max_running"] == 2
+    assert all(graph.get_vertex(vertex_id).built for vertex_id in "abcd")
+
+
+async def test_dataflow_raises_vertex_errors():
+    graph = build_graph({"root": 0, "slow": 500, "child": -1}, [("root", "slow"), ("root", "child")])
+
+    with pytest.raises(ComponentBuildError, match="Negative delay"):
+        await graph.process(fallback_to_env_vars=False, execution_mode="dataflow")
+    assert not graph.get_vertex("slow").built
+
+
+def test_execution_mode_is_read_from_payload(skewed_graph):
+    payload = skewed_graph.dump()["data"]
+    payload["execution_mode"] = "dataflow"
+
+    graph = Graph.from_payload(payload)
+
+    assert graph.execution_mode == "dataflow"
+    assert graph._get_execution_settings(None, None)[0] == "dataflow"
+    assert graph._get_execution_settings("layered", None)[0] == "layered"
@@ -0,0 +1,101 @@
+import gc
+
+import pandas as pd
+import pytest
+from langflow.graph.graph.memory import BuiltObjectLedger, enforce_memory_budgets
+from langflow.utils.memory import estimate_size
+
+
+class FakeVertex:
+    def __init__(self, vertex_id, *, built=True, frozen=False, is_output=False, is_releasable=True):
+        self.id = vertex_id
+        self.built = built
+        self.frozen = frozen
+        self.is_releasable = is_releasable
+        self.is_input = False
+        self.is_output = is_output
+        self.is_interface_component = False
+        self.is_state = False
+        self.needs_rehydration = False
+
+    def release_built_objects(self):
+        self.needs_rehydration = True
+
+
+class FakeGraph:
+    def __init__(self, successor_map, **vertices):
+        self.successor_map = successor_map
+        self.vertex_map = {vertex_id: FakeVertex(vertex_id, **options) for vertex_id, options in vertices.items()}
+        self.vertices_to_run = set(self.vertex_map)
+        self.cycle_vertices = set()
+
+
+@pytest.fixture
+def ledger():
+    return BuiltObjectLedger()
+
+
+def test_estimate_size_follows_references_once():
+    rows = [{"text": str(index) * 1000} for index in range(10)]
+
+    assert estimate_size(rows) > 10_000
+    assert estimate_size([rows, rows]) < estimate_size(rows) + 100
+    assert estimate_size(pd.DataFrame({"text": [str(index) * 1000 for index in range(10)]})) > 10_000
+
+
+def test_estimate_size_stops_after_max_objects():
+    rows = [str(index) * 100 for index in range(1000)]
+
+    assert estimate_size(rows, max_objects=10) < estimate_size(rows)
+
+
+def test_ledger_forgets_collected_graphs(ledger):
+    graph = FakeGraph({})
+    ledger.record(graph, "A", 100)
+    ledger.record(graph, "B", 50)
+    ledger.record(graph, "A", 10)
+
+    assert ledger.graph_total(graph) == 60
+    assert ledger.total == 60
+
+    del graph
+    gc.collect()
+
+    assert ledger.total == 0
+    assert ledger.graphs() == []
+
+
+def test_graph_budget_releases_the_largest_objects_no_longer_needed(ledger):
+    # A feeds B, which was not built yet, so only C and D can be released
+    graph = FakeGraph({"A": ["B"], "B": [], "C": [], "D": []}, A={}, B={"built": False}, C={}, D={})
+    for vertex_id, size in {"A": 500, "C": 300, "D": 100}.items():
+        ledger.record(graph, vertex_id, size)
+
+    released = enforce_memory_budgets(graph, graph_budget=700, worker_budget=None, ledger=ledger)
+
+    assert released == ["C"]
+    assert graph.vertex_map["C"].needs_rehydration is True
+    assert ledger.graph_total(graph) == 600
+
+
+def test_frozen_output_and_unreleasable_vertices_keep_their_objects(ledger):
+    graph = FakeGraph({}, A={"frozen": True}, B={"is_output": True}, C={"is_releasable": False})
+    ledger.record(graph, "A", 500)
+    ledger.record(graph, "B", 500)
+    ledger.record(graph, "C", 500)
+
+    assert enforce_memory_budgets(graph, graph_budget=0, worker_budget=None, ledger=ledger) == []
+
+
+def test_worker_budget_releases_the_least_recently_updated_graphs_first(ledger):
+    old_graph = FakeGraph({}, A={})
+    new_graph = FakeGraph({}, A={})
+    ledger.record(old_graph, "A", 500)
+    ledger.record(new_graph, "A", 500)
+
+    released = enforce_memory_budgets(new_graph, graph_budget=None, worker_budget=600, ledger=ledger)
+
+    assert released == []
+    assert old_graph.vertex_map["A"].needs_rehydration is True
+    assert new_graph.vertex_map["A"].needs_rehydration is False
+    assert ledger.total == 500
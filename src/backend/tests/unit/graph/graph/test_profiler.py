@@ -0,0 +1,136 @@
+import asyncio
+import time
+
+import pytest
+from langflow.components.inputs import ChatInput  # noqa: F401
+from langflow.custom import Component
+from langflow.graph import Graph
+from langflow.graph.graph import profiler as profiler_module
+from langflow.graph.graph.profiler import GraphProfiler, get_graph_profile, list_graph_profiles, store_graph_profile
+from langflow.io import IntInput, MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class Wait(Component):
+    display_name = "Wait"
+    description = "Waits for a while and passes the text on."
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text"),
+        IntInput(name="delay_ms", display_name="Delay (ms)", value=0),
+    ]
+    outputs = [
+        Output(display_name="Message", name="text_output", method="run"),
+    ]
+
+    def run(self) -> Message:
+        time.sleep(self.delay_ms / 1000)
+        return Message(text=f"{self.text or ''}{self._id}")
+
+
+class AsyncWait(Wait):
+    display_name = "Async Wait"
+
+    async def run(self) -> Message:
+        await asyncio.sleep(self.delay_ms / 1000)
+        return Message(text=f"{self.text or ''}{self._id}")
+
+
+def build_graph() -> Graph:
+    graph = Graph()
+    graph.add_component(Wait(_id="first", delay_ms=30))
+    graph.add_component(AsyncWait(_id="second", delay_ms=20))
+    graph.add_component_edge("first", ("text_output", "text"), "second")
+    return graph
+
+
+@pytest.fixture(autouse=True)
+def clear_profiles(monkeypatch):
+    monkeypatch.setattr(profiler_module, "_profiles", profiler_module.OrderedDict())
+
+
+async def test_process_records_a_profile_per_vertex():
+    graph = build_graph()
+
+    await graph.process(fallback_to_env_vars=False, profile=True)
+
+    profiler = get_graph_profile(graph.run_id)
+    assert profiler is graph.profiler
+    report = profiler.report()
+    builds = {vertex["vertex_id"]: vertex for vertex in report["vertices"]}
+    assert list(builds) == ["first", "second"]
+    assert builds["first"]["execution"] >= 0.03
+    assert builds["second"]["execution"] >= 0.02
+    # The sync method runs in a worker thread and the async one does not
+    assert len([span for span in profiler.builds[0].spans if span[0] == "thread_queue_wait"]) == 1
+    assert not [span for span in profiler.builds[1].spans if span[0] == "thread_queue_wait"]
+    # The second vertex waits for the first one to finish
+    assert builds["second"]["waiting_on_predecessors"] == builds["first"]["finished_at"]
+    assert builds["second"]["scheduling_delay"] >= 0
+    assert builds["first"]["waiting_on_predecessors"] == 0
+    assert report["duration"] >= builds["second"]["finished_at"]
+    assert report["totals"]["execution"] == pytest.approx(builds["first"]["execution"] + builds["second"]["execution"])
+    assert "waiting_on_predecessors" not in report["totals"]
+
+
+async def test_process_does_not_profile_by_default():
+    graph = build_graph()
+
+    await graph.process(fallback_to_env_vars=False)
+
+    assert graph.profiler is None
+    assert get_graph_profile(graph.run_id) is None
+
+
+async def test_unpickled_graph_builds_without_a_profiler():
+    graph = build_graph()
+    await graph.process(fallback_to_env_vars=False, profile=True)
+
+    # What unpickling does, without pickling the components defined in this module
+    unpickled = Graph.__new__(Graph)
+    unpickled.__setstate__(graph.__getstate__())
+    await unpickled.build_vertex("first")
+
+    assert unpickled.profiler is None
+
+
+async def test_chrome_trace_nests_phases_under_builds():
+    graph = build_graph()
+    await graph.process(fallback_to_env_vars=False, profile=True)
+
+    trace = graph.profiler.chrome_trace()
+
+    events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    builds = [event for event in events if event["cat"] == "vertex"]
+    assert [event["name"] for event in builds] == ["Wait", "Async Wait"]
+    for build in builds:
+        phases = [
+            event
+            for event in events
+            if event["cat"] == "phase" and event["args"]["vertex_id"] == build["args"]["vertex_id"]
+        ]
+        assert {event["name"] for event in phases} >= {"build_params", "execution"}
+        for phase in phases:
+            assert phase["tid"] == build["tid"]
+            assert build["ts"] <= phase["ts"]
+            assert phase["ts"] + phase["dur"] <= build["ts"] + build["dur"] + 1
+
+
+def test_store_keeps_the_most_recent_profiles(monkeypatch):
+    from langflow.services.deps import get_settings_service
+
+    monkeypatch.setattr(get_settings_service().settings, "graph_profiles_max", 2)
+    for run_id in ("a", "b", "c"):
+        store_graph_profile(GraphProfiler(run_id=run_id))
+
+    assert get_graph_profile("a") is None
+    assert get_graph_profile("b") is not None
+    assert get_graph_profile("c") is not None
+
+
+def test_profiles_can_be_listed_per_user():
+    store_graph_profile(GraphProfiler(run_id="a", flow_id="flow", user_id="alice"))
+    store_graph_profile(GraphProfiler(run_id="b", flow_id="flow", user_id="bob"))
+
+    assert [profiler.run_id for profiler in list_graph_profiles(user_id="alice")] == ["a"]
+    assert [profiler.run_id for profiler in list_graph_profiles("flow")] == ["b", "a"]
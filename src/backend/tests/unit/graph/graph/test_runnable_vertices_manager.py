@@ -206,3 +206,37 @@ def test_add_to_vertices_being_run(data):
     manager.add_to_vertices_being_run(vertex_id)
 
     assert vertex_id in manager.vertices_being_run
+
+
+def test_remove_from_predecessors_updates_pending_counts(data):
+    manager = RunnableVerticesManager.from_dict(data)
+
+    assert manager.pending_counts == {"A": 0, "B": 1, "C": 1, "D": 2}
+    assert manager.is_blocked("D") is True
+
+    manager.remove_from_predecessors("B")
+    manager.remove_from_predecessors("B")
+
+    assert manager.pending_counts["D"] == 1
+    manager.remove_from_predecessors("C")
+
+    assert manager.pending_counts["D"] == 0
+    assert manager.is_blocked("D") is False
+    assert manager.are_all_predecessors_fulfilled("D", is_loop=False) is True
+
+
+def test_cycle_vertices_are_not_blocked(data):
+    manager = RunnableVerticesManager.from_dict(data)
+    manager.add_to_cycle_vertices("D")
+
+    assert manager.is_blocked("D") is False
+
+
+def test_pickle_rebuilds_pending_counts(data):
+    manager = RunnableVerticesManager.from_dict(data)
+    manager.remove_from_predecessors("A")
+
+    result = pickle.loads(pickle.dumps(manager))  # noqa: S301
+
+    assert result.pending_counts == manager.pending_counts
+    assert result.all_predecessors_are_fulfilled() is False
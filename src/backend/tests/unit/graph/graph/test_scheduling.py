@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+from langflow.graph.graph.scheduling import BuildTimeHistory, PrioritySemaphore, get_critical_path_priorities
+from langflow.graph.graph.utils import analyze_cycles
+
+
+def test_build_time_history_smooths_durations():
+    history = BuildTimeHistory(smoothing=0.5)
+
+    history.record("flow", "A", "OpenAIModel", 4.0)
+    history.record("flow", "A", "OpenAIModel", 2.0)
+
+    assert history.estimate("flow", "A", "OpenAIModel") == 3.0
+
+
+def test_build_time_history_falls_back_to_the_component_type():
+    history = BuildTimeHistory()
+    history.record("flow", "A", "OpenAIModel", 2.0)
+
+    assert history.estimate("other_flow", "B", "OpenAIModel") == 2.0
+    assert history.estimate("other_flow", "B", "ChatInput") is None
+
+
+def test_build_time_history_drops_the_oldest_vertices():
+    history = BuildTimeHistory(max_entries=1)
+    history.record("flow", "A", "TypeA", 1.0)
+    history.record("flow", "B", "TypeB", 2.0)
+
+    # Only the type level average is left for A
+    history.record("flow", "C", "TypeA", 5.0)
+
+    assert history.estimate("flow", "A", "TypeA") == pytest.approx(2.2)
+
+
+def test_critical_path_priorities_follow_the_longest_path():
+    successor_map = {"input": ["llm", "parser"], "llm": ["output"], "parser": ["output"], "output": []}
+    edges = [(source, target) for source, targets in successor_map.items() for target in targets]
+    durations = {"input": 0.1, "llm": 5.0, "parser": 0.2, "output": 0.1}
+
+    priorities = get_critical_path_priorities(successor_map, durations, analyze_cycles(edges, list(successor_map)))
+
+    assert priorities["output"] == pytest.approx(0.1)
+    assert priorities["llm"] == pytest.approx(5.1)
+    assert priorities["parser"] == pytest.approx(0.3)
+    assert priorities["input"] == pytest.approx(5.2)
+
+
+def test_critical_path_priorities_treat_cycles_as_one_unit():
+    successor_map = {"A": ["B"], "B": ["C"], "C": ["B", "D"], "D": []}
+    edges = [(source, target) for source, targets in successor_map.items() for target in targets]
+    durations = dict.fromkeys(successor_map, 1.0)
+
+    priorities = get_critical_path_priorities(successor_map, durations, analyze_cycles(edges, list(successor_map)))
+
+    assert priorities == {"D": 1.0, "B": 3.0, "C": 3.0, "A": 4.0}
+
+
+async def test_priority_semaphore_wakes_the_highest_priority_first():
+    semaphore = PrioritySemaphore(1)
+    order = []
+
+    async def run(name, priority):
+        async with semaphore.slot(priority):
+            order.append(name)
+
+    await semaphore.acquire()
+    tasks = [asyncio.create_task(run(name, priority)) for name, priority in [("low", 1.0), ("high", 5.0), ("mid", 2.0)]]
+    await asyncio.sleep(0)
+    semaphore.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["high", "mid", "low"]
+
+
+async def test_priority_semaphore_skips_cancelled_waiters():
+    semaphore = PrioritySemaphore(1)
+    await semaphore.acquire()
+    cancelled = asyncio.create_task(semaphore.acquire(10.0))
+    waiting = asyncio.create_task(semaphore.acquire(1.0))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    semaphore.release()
+    await asyncio.wait_for(waiting, timeout=1)
+
+    assert cancelled.cancelled()
+    assert semaphore._value == 0
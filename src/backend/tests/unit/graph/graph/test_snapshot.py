@@ -0,0 +1,158 @@
+import pandas as pd
+import pytest
+from langflow.custom import Component
+from langflow.graph import Graph
+from langflow.graph.graph.snapshot import (
+    SNAPSHOT_VERSION,
+    GraphSnapshotError,
+    dump_graph_snapshot,
+    is_graph_snapshot,
+    is_plain_data,
+    load_graph_snapshot,
+)
+from langflow.io import MessageTextInput, Output
+from langflow.schema.data import Data
+from langflow.schema.message import Message
+
+
+class Echo(Component):
+    display_name = "Echo"
+    description = "Returns the text it receives."
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text", value="hello"),
+    ]
+    outputs = [
+        Output(display_name="Message", name="echo", method="echo"),
+    ]
+
+    def echo(self) -> Message:
+        return Message(text=self.text)
+
+
+class Client:
+    def __init__(self, text):
+        self.text = text
+
+
+class ClientBuilder(Component):
+    display_name = "Client Builder"
+    description = "Returns the text it receives and a client built from it."
+    releasable = True
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text", value="hello"),
+    ]
+    outputs = [
+        Output(display_name="Message", name="echo", method="echo"),
+        Output(display_name="Client", name="client", method="build_client"),
+    ]
+
+    def echo(self) -> Message:
+        return Message(text=self.text)
+
+    def build_client(self) -> Client:
+        return Client(self.text)
+
+
+@pytest.fixture
+def graph():
+    graph = Graph()
+    graph.add_component(Echo(_id="first"))
+    graph.add_component(Echo(_id="second"))
+    graph.add_component_edge("first", ("echo", "text"), "second")
+    graph.initialize()
+    graph = Graph.from_payload(graph.dump()["data"], flow_id="flow", flow_name="Flow")
+    graph.sort_vertices()
+    return graph
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ({"text": "hello", "items": [1, 2.0, None]}, True),
+        (Message(text="hello"), True),
+        ([Data(data={"a": 1})], True),
+        (pd.DataFrame({"a": [1]}), True),
+        (object(), False),
+        ({"client": object()}, False),
+    ],
+)
+def test_is_plain_data(value, expected):
+    assert is_plain_data(value) is expected
+
+
+def test_snapshot_keeps_structure_run_state_and_plain_results(graph):
+    first = graph.get_vertex("first")
+    first.built = True
+    first.built_object = Message(text="hello")
+    first.results = {"echo": first.built_object}
+    graph.run_manager.remove_from_predecessors("first")
+
+    loaded = load_graph_snapshot(dump_graph_snapshot(graph))
+
+    assert loaded.flow_id == "flow"
+    assert loaded.flow_name == "Flow"
+    assert [vertex.id for vertex in loaded.vertices] == ["first", "second"]
+    assert len(loaded.edges) == 1
+    assert loaded.vertices_to_run == graph.vertices_to_run
+    assert loaded.run_manager.run_predecessors == graph.run_manager.run_predecessors
+    assert loaded.run_manager.pending_counts == graph.run_manager.pending_counts
+    loaded_first = loaded.get_vertex("first")
+    assert loaded_first.built is True
+    assert loaded_first.built_object == Message(text="hello")
+    assert loaded_first.results == {"echo": Message(text="hello")}
+    assert loaded_first.needs_rehydration is False
+
+
+def test_snapshot_of_live_objects_is_refused_for_components_that_are_not_releasable(graph):
+    first = graph.get_vertex("first")
+    first.built = True
+    first.built_object = object()
+
+    with pytest.raises(GraphSnapshotError, match="side effects"):
+        dump_graph_snapshot(graph)
+
+
+async def test_snapshot_builds_again_only_the_outputs_that_are_not_plain():
+    graph = Graph()
+    graph.add_component(ClientBuilder(_id="builder"))
+    graph.initialize()
+    builder = graph.get_vertex("builder")
+    builder.built = True
+    builder.build_context = {"user_id": None, "inputs": {}, "files": None, "fallback_to_env_vars": False}
+    builder.results = {"echo": Message(text="hello"), "client": Client("hello")}
+    builder.built_object = dict(builder.results)
+
+    loaded_builder = load_graph_snapshot(dump_graph_snapshot(graph)).get_vertex("builder")
+
+    assert loaded_builder.needs_rehydration is True
+    assert set(loaded_builder.results) == {"echo"}
+    echo = loaded_builder.results["echo"]
+
+    await loaded_builder.rehydrate(["client"])
+
+    assert loaded_builder.results["client"].text == "hello"
+    # The plain output is kept instead of being built again
+    assert loaded_builder.results["echo"] is echo
+    assert loaded_builder.needs_rehydration is False
+
+
+def test_snapshot_compression_is_optional(graph):
+    compressed = dump_graph_snapshot(graph)
+    uncompressed = dump_graph_snapshot(graph, compress=False)
+
+    assert is_graph_snapshot(compressed)
+    assert is_graph_snapshot(uncompressed)
+    assert len(compressed) < len(uncompressed)
+    assert [vertex.id for vertex in load_graph_snapshot(uncompressed).vertices] == ["first", "second"]
+
+
+def test_snapshot_from_another_version_is_rejected(graph):
+    data = bytearray(dump_graph_snapshot(graph))
+    data[4] = SNAPSHOT_VERSION + 1
+
+    with pytest.raises(GraphSnapshotError, match="version"):
+        load_graph_snapshot(bytes(data))
+    with pytest.raises(GraphSnapshotError, match="not a graph snapshot"):
+        load_graph_snapshot(b"pickled graph")
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from langflow.components.inputs import ChatInput  # noqa: F401
+from langflow.custom import Component
+from langflow.graph import Graph
+from langflow.graph.graph.template import GraphTemplate, clear_graph_templates, get_graph_template
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class Echo(Component):
+    display_name = "Echo"
+    description = "Returns the text it receives."
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text", value="hello"),
+    ]
+    outputs = [
+        Output(display_name="Message", name="echo", method="echo"),
+    ]
+
+    def echo(self) -> Message:
+        return Message(text=self.text)
+
+
+@pytest.fixture
+def payload():
+    graph = Graph()
+    graph.add_component(Echo(_id="first"))
+    graph.add_component(Echo(_id="second"))
+    graph.add_component_edge("first", ("echo", "text"), "second")
+    graph.initialize()
+    return graph.dump()["data"]
+
+
+def test_instantiate_returns_independent_graphs(payload):
+    template = GraphTemplate(payload, flow_id="flow")
+
+    graph_a = template.instantiate()
+    graph_b = template.instantiate()
+
+    assert graph_a is not graph_b
+    assert graph_a.flow_id == graph_b.flow_id == "flow"
+    assert [vertex.id for vertex in graph_a.vertices] == [vertex.id for vertex in graph_b.vertices]
+    assert len(graph_a.edges) == len(graph_b.edges) == 1
+    assert graph_a.edges[0] is not graph_b.edges[0]
+    vertex_a, vertex_b = graph_a.get_vertex("first"), graph_b.get_vertex("first")
+    assert vertex_a is not vertex_b
+    assert vertex_a.custom_component is not vertex_b.custom_component
+    # The component code is only evaluated once for all the instances
+    assert type(vertex_a.custom_component) is type(vertex_b.custom_component)
+    assert len(template.component_classes) == 1
+
+
+def test_instantiate_applies_tweaks_as_overlay(payload):
+    template = GraphTemplate(payload)
+
+    tweaked = template.instantiate(tweaks={"first": {"text": "tweaked"}})
+    untweaked = template.instantiate()
+
+    assert tweaked.get_vertex("first").params["text"] == "tweaked"
+    assert untweaked.get_vertex("first").params["text"] == "hello"
+    assert payload["nodes"][0]["data"]["node"]["template"]["text"]["value"] == "hello"
+
+
+def test_instances_share_param_plans(payload):
+    template = GraphTemplate(payload)
+
+    graph_a = template.instantiate()
+    plans = dict(template.param_plans)
+    graph_b = template.instantiate()
+
+    assert set(plans) == {"first", "second"}
+    assert all(template.param_plans[vertex_id] is plan for vertex_id, plan in plans.items())
+    assert graph_a.get_vertex("first").params["text"] == graph_b.get_vertex("first").params["text"] == "hello"
+    # Edge params are resolved against the vertices of each instance
+    assert graph_a.get_vertex("second").params["text"] is graph_a.get_vertex("first")
+    assert graph_b.get_vertex("second").params["text"] is graph_b.get_vertex("first")
+
+
+def test_tweaked_instances_do_not_use_param_plans(payload):
+    template = GraphTemplate(payload)
+
+    tweaked = template.instantiate(tweaks={"first": {"text": "tweaked"}})
+
+    assert template.param_plans == {}
+    assert tweaked.get_vertex("first").params["text"] == "tweaked"
+
+
+async def test_instantiated_graph_runs(payload):
+    graph = GraphTemplate(payload).instantiate(tweaks={"first": {"text": "run"}})
+
+    await graph.process(fallback_to_env_vars=False)
+
+    assert graph.get_vertex("second").built_object["echo"].text == "run"
+
+
+def test_get_graph_template_is_keyed_by_updated_at(payload):
+    clear_graph_templates()
+    updated_at = datetime.now(timezone.utc)
+
+    template = get_graph_template(payload, flow_id="flow", updated_at=updated_at)
+
+    assert get_graph_template(payload, flow_id="flow", updated_at=updated_at) is template
+    assert get_graph_template(payload, flow_id="flow", updated_at=updated_at + timedelta(seconds=1)) is not template
+    assert get_graph_template(payload, flow_id="flow", updated_at=None) is not template
@@ -147,6 +147,159 @@ def test_has_cycle():
     assert utils.has_cycle(vertices, edges) is True
 
 
+class TestAnalyzeCycles:
+    def test_finds_components_cycle_vertices_and_edges_in_one_pass(self):
+        edges = [("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"), ("D", "D"), ("D", "E")]
+
+        analysis = utils.analyze_cycles(edges)
+
+        assert analysis.is_cyclic is True
+        assert [sorted(component) for component in analysis.components] == [["E"], ["D"], ["A", "B", "C"]]
+        assert analysis.cycle_vertices == {"A", "B", "C", "D"}
+        assert analysis.cycle_edges == [("C", "A"), ("D", "D")]
+
+    def test_only_analyzes_vertices_reachable_from_the_roots(self):
+        edges = [("A", "B"), ("C", "D"), ("D", "C")]
+
+        analysis = utils.analyze_cycles(edges, roots=["A"])
+
+        assert analysis.components == [["B"], ["A"]]
+        assert analysis.is_cyclic is False
+
+    def test_topological_order(self):
+        edges = [("A", "C"), ("B", "C"), ("C", "D"), ("A", "D")]
+
+        order = utils.analyze_cycles(edges, roots=["A", "B", "C", "D", "E"]).topological_order()
+
+        assert sorted(order) == ["A", "B", "C", "D", "E"]
+        assert all(order.index(source) < order.index(target) for source, target in edges)
+
+    def test_topological_order_raises_for_cycles(self):
+        with pytest.raises(ValueError, match="Graph contains a cycle"):
+            utils.analyze_cycles([("A", "B"), ("B", "A")]).topological_order()
+
+    def test_handles_graphs_deeper_than_the_recursion_limit(self):
+        size = 20_000
+        edges = [(index, index + 1) for index in range(size)]
+
+        assert utils.analyze_cycles(edges).is_cyclic is False
+        analysis = utils.analyze_cycles([*edges, (size, 0)])
+        assert len(analysis.cycle_vertices) == size + 1
+        assert analysis.cycle_edges == [(size, 0)]
+
+
+class TestReachabilityIndex:
+    def test_successors_and_predecessors(self, graph):
+        index = utils.ReachabilityIndex(list(graph), {vertex: data["successors"] for vertex, data in graph.items()})
+
+        assert sorted(index.successors("A")) == sorted(utils.get_successors(graph, "A"))
+        assert sorted(index.successors("K")) == ["O", "P", "Q", "R", "S", "T", "U", "V", "W", "X", "Y", "Z"]
+        assert sorted(index.predecessors("I")) == ["C", "J", "N"]
+        assert index.successors("Z") == []
+        assert index.is_upstream("N", "G") is True
+        assert index.is_upstream("G", "N") is False
+        assert index.upstream(["B", "M"]) == {"A", "B", "C", "I", "J", "M", "N"}
+
+    def test_results_are_in_topological_order(self, graph):
+        index = utils.ReachabilityIndex(list(graph), {vertex: data["successors"] for vertex, data in graph.items()})
+
+        order = index.successors("N")
+        assert all(order.index(source) < order.index(target) for source, target in [("C", "B"), ("D", "F"), ("K", "O")])
+
+    def test_vertices_in_a_cycle_reach_each_other(self, graph_with_loop):
+        successor_map = {vertex: data["successors"] for vertex, data in graph_with_loop.items()}
+        index = utils.ReachabilityIndex(list(graph_with_loop), successor_map)
+
+        assert "Loop" in index.successors("Loop")
+        assert index.is_upstream("YouTube Transcripts", "Parse Data 1") is True
+        assert "Playlist Extractor" not in index.successors("Playlist Extractor")
+        assert index.downstream(["Parse Data 2"]) == {"Parse Data 2", "Message to Data", "Split Text", "Chroma DB"}
+
+
+def _node(node_id, value="", position=0):
+    return {"id": node_id, "position": {"x": position, "y": 0}, "data": {"id": node_id, "value": value}}
+
+
+def _edge(source, target, field="input_value"):
+    return {
+        "source": source,
+        "target": target,
+        "data": {"sourceHandle": {"id": source, "name": "output"}, "targetHandle": {"id": target, "fieldName": field}},
+    }
+
+
+class TestDiffGraphData:
+    def test_identical_payloads_have_no_changes(self):
+        nodes = [_node("A"), _node("B")]
+        edges = [_edge("A", "B")]
+
+        diff = utils.diff_graph_data(nodes, edges, copy.deepcopy(nodes), copy.deepcopy(edges))
+
+        assert diff.is_empty
+        assert diff.touched_vertices == set()
+
+    def test_moving_a_node_is_not_a_change(self):
+        diff = utils.diff_graph_data([_node("A")], [], [_node("A", position=100)], [])
+
+        assert diff.is_empty
+
+    def test_changed_added_and_removed_vertices(self):
+        old_nodes = [_node("A"), _node("B"), _node("C")]
+        new_nodes = [_node("A"), _node("B", value="new"), _node("D")]
+
+        diff = utils.diff_graph_data(old_nodes, [_edge("A", "C")], new_nodes, [_edge("A", "D")])
+
+        assert diff.added_vertices == ["D"]
+        assert diff.removed_vertices == ["C"]
+        assert diff.changed_vertices == ["B"]
+        assert diff.added_edges == [utils.get_edge_key(_edge("A", "D"))]
+        assert diff.removed_edges == [utils.get_edge_key(_edge("A", "C"))]
+        assert diff.touched_vertices == {"B", "D"}
+
+    def test_rewiring_an_edge_touches_its_target(self):
+        nodes = [_node("A"), _node("B")]
+
+        diff = utils.diff_graph_data(nodes, [_edge("A", "B")], nodes, [_edge("A", "B", field="system_message")])
+
+        assert diff.added_vertices == diff.removed_vertices == diff.changed_vertices == []
+        assert diff.touched_vertices == {"B"}
+        assert diff.is_structural
+
+    def test_changing_node_data_is_not_structural(self):
+        diff = utils.diff_graph_data([_node("A"), _node("B")], [], [_node("A"), _node("B", value="new")], [])
+
+        assert diff.changed_vertices == ["B"]
+        assert not diff.is_structural
+
+
+@pytest.mark.parametrize(
+    ("stop_component_id", "start_component_id"),
+    [("Chroma DB", None), ("Message to Data", None), (None, "Parse Data 2"), (None, "Loop"), ("Missing", None)],
+)
+def test_get_sorted_vertices_with_reachability_matches_graph_walk(
+    graph_with_loop, stop_component_id, start_component_id
+):
+    successor_map = {vertex: data["successors"] for vertex, data in graph_with_loop.items()}
+    predecessor_map = {vertex: data["predecessors"] for vertex, data in graph_with_loop.items()}
+    kwargs = {
+        "vertices_ids": list(graph_with_loop),
+        "cycle_vertices": {"Loop", "Parse Data 1", "YouTube Transcripts"},
+        "stop_component_id": stop_component_id,
+        "start_component_id": start_component_id,
+        "in_degree_map": {vertex: len(data["predecessors"]) for vertex, data in graph_with_loop.items()},
+        "successor_map": successor_map,
+        "predecessor_map": predecessor_map,
+        "get_vertex_predecessors": lambda vertex_id: predecessor_map[vertex_id],
+        "get_vertex_successors": lambda vertex_id: successor_map[vertex_id],
+        "is_cyclic": True,
+    }
+
+    expected = utils.get_sorted_vertices(**kwargs)
+    reachability = utils.ReachabilityIndex(list(graph_with_loop), successor_map)
+
+    assert utils.get_sorted_vertices(**kwargs, reachability=reachability) == expected
+
+
 class TestFindCycleEdge:
     # Detects a cycle in a simple directed graph
     def test_detects_cycle_in_simple_graph(self):
@@ -0,0 +1,141 @@
+import pytest
+from langflow.components.inputs import ChatInput  # noqa: F401
+from langflow.custom import Component
+from langflow.graph import Graph
+from langflow.graph.vertex import result_cache
+from langflow.graph.vertex.result_cache import (
+    UnhashableValueError,
+    VertexResultCache,
+    fingerprint,
+    get_vertex_result_cache_stats,
+)
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+from langflow.services.cache.service import ThreadingInMemoryCache
+from langflow.services.deps import get_settings_service
+
+
+class Upper(Component):
+    display_name = "Upper"
+    description = "Returns the text in upper case."
+    memoize = True
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text", value="hello"),
+    ]
+    outputs = [
+        Output(display_name="Message", name="upper", method="upper"),
+    ]
+
+    def upper(self) -> Message:
+        self.graph.context["calls"].append(self._id)
+        return Message(text=self.text.upper())
+
+
+class Lower(Upper):
+    display_name = "Lower"
+    memoize = False
+
+    def upper(self) -> Message:
+        self.graph.context["calls"].append(self._id)
+        return Message(text=self.text.lower())
+
+
+@pytest.fixture
+def vertex_result_cache(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "vertex_result_cache_enabled", True)
+    cache = VertexResultCache(ThreadingInMemoryCache(), ttl=60, max_entry_size=1024 * 1024)
+    monkeypatch.setattr(result_cache, "_vertex_result_cache", cache)
+    return cache
+
+
+async def run_graph(calls: list[str], text: str = "hello") -> Graph:
+    graph = Graph(context={"calls": calls})
+    graph.add_component(Upper(_id="upper", text=text))
+    graph.add_component(Lower(_id="lower"))
+    graph.add_component_edge("upper", ("upper", "text"), "lower")
+    graph.prepare()
+    await graph.process(fallback_to_env_vars=False)
+    return graph
+
+
+async def test_memoized_vertex_is_not_built_again(vertex_result_cache):
+    calls: list[str] = []
+
+    first = await run_graph(calls)
+    second = await run_graph(calls)
+
+    # Upper is memoized, Lower is not and still receives the memoized result
+    assert calls == ["upper", "lower", "lower"]
+    assert second.get_vertex("upper").built_object["upper"].text == "HELLO"
+    assert second.get_vertex("lower").built_object["upper"].text == "hello"
+    assert second.get_vertex("upper").artifacts == first.get_vertex("upper").artifacts
+    assert vertex_result_cache.stats.hits == 1
+    assert vertex_result_cache.stats.stores == 1
+
+
+async def test_different_inputs_are_not_shared(vertex_result_cache):
+    calls: list[str] = []
+
+    await run_graph(calls, text="hello")
+    graph = await run_graph(calls, text="bye")
+
+    assert calls == ["upper", "lower", "upper", "lower"]
+    assert graph.get_vertex("upper").built_object["upper"].text == "BYE"
+    assert vertex_result_cache.stats.misses == 2
+
+
+async def test_expired_and_oversized_results_are_rebuilt(vertex_result_cache):
+    calls: list[str] = []
+    vertex_result_cache.ttl = -1
+
+    await run_graph(calls)
+    await run_graph(calls)
+
+    assert calls.count("upper") == 2
+    assert vertex_result_cache.stats.expired == 1
+
+    vertex_result_cache.ttl = 60
+    vertex_result_cache.max_entry_size = 1
+    vertex_result_cache.cache_service.clear()
+
+    await run_graph(calls)
+    await run_graph(calls)
+
+    assert calls.count("upper") == 4
+    assert vertex_result_cache.stats.skipped == 2
+
+
+async def test_key_depends_on_upstream_results(vertex_result_cache):
+    graph = Graph(context={"calls": []})
+    graph.add_component(Lower(_id="lower"))
+    graph.add_component(Upper(_id="upper"))
+    graph.add_component_edge("lower", ("upper", "text"), "upper")
+    graph.prepare()
+    await graph.process(fallback_to_env_vars=False)
+    vertex = graph.get_vertex("upper")
+
+    key = vertex_result_cache.build_key(vertex, vertex.custom_component, {})
+    graph.get_vertex("lower").results["upper"] = Message(text="changed")
+
+    assert vertex_result_cache.build_key(vertex, vertex.custom_component, {}) != key
+    assert get_vertex_result_cache_stats()["hit_ratio"] == 0.0
+
+
+async def test_disabled_by_default():
+    calls: list[str] = []
+
+    await run_graph(calls)
+    await run_graph(calls)
+
+    assert calls.count("upper") == 2
+
+
+def test_fingerprint_ignores_timestamps_and_rejects_objects():
+    first = Message(text="hi", timestamp="2024-01-01 00:00:00 UTC")
+    second = Message(text="hi", timestamp="2025-01-01 00:00:00 UTC")
+
+    assert fingerprint({"message": first}) == fingerprint({"message": second})
+    assert fingerprint(first) != fingerprint(Message(text="bye"))
+    with pytest.raises(UnhashableValueError):
+        fingerprint({"client": object()})
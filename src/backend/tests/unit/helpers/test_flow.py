@@ -0,0 +1,111 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from langflow.components.inputs import ChatInput  # noqa: F401
+from langflow.custom import Component
+from langflow.graph import Graph
+from langflow.graph.graph.template import clear_graph_templates
+from langflow.helpers import flow as flow_helpers
+from langflow.helpers.flow import load_flow
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class Echo(Component):
+    display_name = "Echo"
+    description = "Returns the text it receives."
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text", value="hello"),
+    ]
+    outputs = [
+        Output(display_name="Message", name="echo", method="echo"),
+    ]
+
+    def echo(self) -> Message:
+        return Message(text=self.text)
+
+
+class FakeSession:
+    def __init__(self, flows: dict):
+        self.flows = flows
+        self.gets = 0
+
+    async def get(self, _model, flow_id):
+        self.gets += 1
+        return self.flows.get(str(flow_id))
+
+    async def exec(self, statement):
+        # The only query is the lookup of the ID and updated_at of a flow by its ID
+        flow_id = next(iter(statement.compile().params.values()))
+        flow = self.flows.get(str(flow_id))
+        return SimpleNamespace(first=lambda: (flow.id, flow.updated_at) if flow else None)
+
+
+@pytest.fixture
+def flow():
+    graph = Graph()
+    graph.add_component(Echo(_id="first"))
+    graph.add_component(Echo(_id="second"))
+    graph.add_component_edge("first", ("echo", "text"), "second")
+    graph.initialize()
+    return SimpleNamespace(
+        id=uuid4(), name="Echo flow", data=graph.dump()["data"], updated_at=datetime.now(timezone.utc)
+    )
+
+
+@pytest.fixture
+def session(monkeypatch, flow):
+    session = FakeSession({str(flow.id): flow})
+
+    @asynccontextmanager
+    async def session_scope():
+        yield session
+
+    monkeypatch.setattr(flow_helpers, "session_scope", session_scope)
+    monkeypatch.setattr(flow_helpers, "_subflow_cache", None)
+    clear_graph_templates()
+    return session
+
+
+async def test_load_flow_reuses_the_cached_flow(session, flow):
+    graph_a = await load_flow(user_id="user", flow_id=str(flow.id))
+    graph_b = await load_flow(user_id="user", flow_id=str(flow.id), tweaks={"first": {"text": "tweaked"}})
+
+    assert session.gets == 1
+    assert graph_a is not graph_b
+    assert graph_a.get_vertex("first") is not graph_b.get_vertex("first")
+    assert graph_a.flow_id == graph_b.flow_id == str(flow.id)
+    assert graph_b.user_id == "user"
+    assert graph_a.get_vertex("first").raw_params["text"] == "hello"
+    assert graph_b.get_vertex("first").raw_params["text"] == "tweaked"
+
+
+async def test_saved_flow_is_loaded_again(session, flow):
+    await load_flow(user_id="user", flow_id=str(flow.id))
+    flow.data["nodes"][0]["data"]["node"]["template"]["text"]["value"] = "saved"
+    # Saved by another worker, which leaves the cache of this one untouched
+    flow.updated_at = datetime.now(timezone.utc) + timedelta(seconds=1)
+
+    graph = await load_flow(user_id="user", flow_id=str(flow.id))
+
+    assert session.gets == 2
+    assert graph.get_vertex(flow.data["nodes"][0]["id"]).raw_params["text"] == "saved"
+
+
+async def test_subflow_cache_can_be_disabled(session, flow, monkeypatch):
+    settings = flow_helpers.get_settings_service().settings
+    monkeypatch.setattr(settings, "subflow_cache_size", 0)
+
+    await load_flow(user_id="user", flow_id=str(flow.id))
+    await load_flow(user_id="user", flow_id=str(flow.id))
+
+    assert session.gets == 2
+
+
+async def test_load_flow_raises_for_missing_flow(session):  # noqa: ARG001
+    with pytest.raises(ValueError, match="not found"):
+        await load_flow(user_id="user", flow_id=str(uuid4()))
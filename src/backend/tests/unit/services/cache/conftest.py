@@ -0,0 +1,177 @@
+"""A Redis fake for the cache service tests."""
+
+import asyncio
+import time
+import uuid
+
+import pytest
+
+
+class FakePubSub:
+    def __init__(self, server):
+        self._server = server
+        self._queue = asyncio.Queue()
+        self._channels = set()
+
+    async def subscribe(self, channel):
+        self._channels.add(channel)
+        self._server.subscribers.setdefault(channel, []).append(self._queue)
+
+    async def listen(self):
+        async with self._server.listening:
+            self._server.listeners += 1
+            self._server.listening.notify_all()
+        while True:
+            yield await self._queue.get()
+
+    async def reset(self):
+        for channel in self._channels:
+            self._server.subscribers[channel].remove(self._queue)
+        self._channels.clear()
+
+
+class FakePipeline:
+    """Queues commands and runs them together, like a MULTI/EXEC transaction."""
+
+    def __init__(self, client, *, transaction):
+        self._client = client
+        self.transaction = transaction
+        self._commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._commands.append((getattr(self._client, name), args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        self._client._check()
+        return [await command(*args, **kwargs) for command, args, kwargs in self._commands]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._commands.clear()
+
+
+class FakeLock:
+    """A lock that expires after its lease, like the locks of redis-py."""
+
+    def __init__(self, client, name, timeout, sleep, blocking_timeout, *, thread_local):
+        self._client = client
+        self._name = name
+        self.thread_local = thread_local
+        self._timeout = timeout
+        self._sleep = sleep
+        self._blocking_timeout = blocking_timeout
+        self._token = uuid.uuid4().hex
+
+    async def acquire(self):
+        start = time.monotonic()
+        while True:
+            self._client._check()
+            locks = self._client._server.locks
+            holder = locks.get(self._name)
+            if holder is None or holder[1] <= time.monotonic():
+                locks[self._name] = (self._token, time.monotonic() + self._timeout)
+                return True
+            if time.monotonic() - start >= self._blocking_timeout:
+                return False
+            await asyncio.sleep(self._sleep)
+
+    async def release(self):
+        self._client._check()
+        if self._client._server.locks.get(self._name, (None,))[0] == self._token:
+            del self._client._server.locks[self._name]
+
+
+class FakeRedis:
+    """The commands of the asyncio Redis client used by the caches, kept in memory.
+
+    Clients created with `connection` share the data and channels, like workers connected to the same server.
+    """
+
+    def __init__(self, server=None):
+        self._server = server or self
+        if server is None:
+            self.data = {}
+            self.subscribers = {}
+            self.locks = {}
+            # Notified when a subscriber starts listening, so tests can wait for the workers to subscribe
+            self.listening = asyncio.Condition()
+            self.listeners = 0
+        self.available = True
+
+    def connection(self):
+        return FakeRedis(self._server)
+
+    def _check(self):
+        if not self.available:
+            msg = "Redis is not available"
+            raise ConnectionError(msg)
+
+    async def ping(self):
+        self._check()
+        return True
+
+    async def get(self, key):
+        self._check()
+        return self._server.data.get(key)
+
+    async def setex(self, key, _expiration_time, value):
+        self._check()
+        self._server.data[key] = value
+        return True
+
+    async def delete(self, *keys):
+        self._check()
+        return sum(self._server.data.pop(key, None) is not None for key in keys)
+
+    async def exists(self, key):
+        self._check()
+        return int(key in self._server.data)
+
+    async def flushdb(self):
+        self._check()
+        self._server.data.clear()
+
+    async def hgetall(self, key):
+        self._check()
+        return {field.encode(): value for field, value in self._server.data.get(key, {}).items()}
+
+    async def hset(self, key, mapping):
+        self._check()
+        self._server.data.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def hdel(self, key, *fields):
+        self._check()
+        entry = self._server.data.get(key, {})
+        return sum(entry.pop(field, None) is not None for field in fields)
+
+    async def expire(self, key, _expiration_time):
+        self._check()
+        return int(key in self._server.data)
+
+    def pipeline(self, *, transaction=True):
+        return FakePipeline(self, transaction=transaction)
+
+    async def publish(self, channel, message):
+        self._check()
+        queues = self._server.subscribers.get(channel, [])
+        for queue in queues:
+            queue.put_nowait({"type": "message", "channel": channel, "data": message.encode()})
+        return len(queues)
+
+    def pubsub(self):
+        return FakePubSub(self._server)
+
+    def lock(self, name, *, timeout, sleep, blocking_timeout, thread_local=True):
+        return FakeLock(self, name, timeout, sleep, blocking_timeout, thread_local=thread_local)
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
@@ -0,0 +1,106 @@
+import pytest
+from langflow.services.cache.eviction import BoundedStore, FrequencySketch, get_key_namespace
+from langflow.services.cache.service import AsyncInMemoryCache, ThreadingInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS
+
+
+def _store(**kwargs):
+    return BoundedStore(sizer=len, **kwargs)
+
+
+def _put(store, key, value):
+    return store.put(key, {"value": value})
+
+
+def test_get_key_namespace():
+    assert get_key_namespace("graph:flow", {"graph"}) == "graph"
+    assert get_key_namespace("session:abc:hash", {"graph"}) == "default"
+    assert get_key_namespace("graph", {"graph"}) == "default"
+    assert get_key_namespace(1, {"graph"}) == "default"
+
+
+def test_frequency_sketch_counts_and_ages():
+    sketch = FrequencySketch(width=16)
+    for _ in range(20):
+        sketch.increment("a")
+
+    assert sketch.frequency("a") == 15
+    assert sketch.frequency("b") <= sketch.frequency("a")
+
+    sketch._age()
+
+    assert sketch.frequency("a") == 7
+
+
+def test_lru_evicts_the_least_recently_used_bytes():
+    store = _store(max_bytes=10)
+    _put(store, "a", "aaaa")
+    _put(store, "b", "bbbb")
+    store.get("a")
+    _put(store, "c", "cccc")
+
+    assert "a" in store
+    assert "b" not in store
+    assert "c" in store
+    assert store.stats()["default"] == {"entries": 2, "bytes": 8, "evictions": 1}
+
+
+def test_entries_over_the_budget_are_not_stored():
+    store = _store(max_bytes=10)
+    _put(store, "a", "aaaa")
+
+    assert _put(store, "a", "a" * 11) is False
+    assert "a" not in store
+    assert len(store) == 0
+
+
+def test_namespaces_only_evict_their_own_entries():
+    store = _store(max_bytes=100, namespace_budgets={"graph": 10})
+    _put(store, "other", "o" * 50)
+    _put(store, "graph:a", "a" * 6)
+    _put(store, "graph:b", "b" * 6)
+
+    assert "other" in store
+    assert "graph:a" not in store
+    assert store.stats() == {
+        "default": {"entries": 1, "bytes": 50, "evictions": 0},
+        "graph": {"entries": 1, "bytes": 6, "evictions": 1},
+    }
+
+
+@pytest.mark.parametrize(("policy", "keeps_hot_entries"), [("tinylfu", True), ("lru", False)])
+def test_tinylfu_keeps_frequently_used_entries_over_a_scan(policy, keeps_hot_entries):
+    store = _store(max_bytes=100, policy=policy)
+    hot_keys = [f"hot{index}" for index in range(9)]
+    for key in hot_keys:
+        _put(store, key, "h" * 10)
+    for _ in range(3):
+        for key in hot_keys:
+            store.get(key)
+
+    for index in range(20):
+        _put(store, f"cold{index}", "c" * 10)
+
+    assert all(key in store for key in hot_keys) is keeps_hot_entries
+    assert store.stats()["default"]["bytes"] <= 100
+
+
+def test_threading_cache_is_bounded_by_bytes():
+    cache = ThreadingInMemoryCache(max_bytes=4096)
+    cache.set("a", "a" * 3000)
+    cache.set("b", "b" * 3000)
+
+    assert cache.get("a") is CACHE_MISS
+    assert cache.get("b") == "b" * 3000
+    assert cache.eviction_stats()["default"]["evictions"] == 1
+
+
+async def test_async_cache_keeps_namespace_budgets_apart():
+    cache = AsyncInMemoryCache(namespace_budgets={"session": 4096})
+    await cache.set("graph:flow", "g" * 10_000)
+    await cache.set("session:a", "a" * 3000)
+    await cache.set("session:b", "b" * 3000)
+
+    assert await cache.get("graph:flow") == "g" * 10_000
+    assert await cache.get("session:a") is CACHE_MISS
+    assert await cache.get("session:b") == "b" * 3000
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+from langflow.services.cache.locks import DistributedLock, StripedLocks
+
+
+def test_striped_locks_use_a_fixed_number_of_locks():
+    locks = StripedLocks(asyncio.Lock, stripes=4)
+
+    assert locks["flow"] is locks["flow"]
+    assert len({id(locks[f"flow{index}"]) for index in range(100)}) <= 4
+    assert len(locks) == 4
+
+
+def test_striped_locks_need_a_stripe():
+    with pytest.raises(ValueError, match="at least one stripe"):
+        StripedLocks(asyncio.Lock, stripes=0)
+
+
+async def test_distributed_lock_serializes_workers(fake_redis):
+    first = DistributedLock(fake_redis.connection(), lease=5)
+    second = DistributedLock(fake_redis.connection(), lease=5)
+    events = []
+    held = asyncio.Event()
+
+    async def write(lock, name):
+        async with lock.hold("graph:flow") as acquired:
+            assert acquired
+            events.append(f"{name} start")
+            held.set()
+            await asyncio.sleep(0.1)
+            events.append(f"{name} end")
+
+    first_write = asyncio.create_task(write(first, "first"))
+    await held.wait()
+    await asyncio.gather(first_write, write(second, "second"))
+
+    assert events == ["first start", "first end", "second start", "second end"]
+    assert fake_redis.locks == {}
+
+
+async def test_distributed_lock_expires_after_its_lease(fake_redis):
+    hung_worker = fake_redis.connection().lock("langflow:lock:graph:flow", timeout=0.1, sleep=0.01, blocking_timeout=1)
+    assert await hung_worker.acquire()
+
+    async with DistributedLock(fake_redis.connection(), lease=1).hold("graph:flow") as acquired:
+        assert acquired
+
+
+async def test_distributed_lock_goes_on_without_redis(fake_redis):
+    client = fake_redis.connection()
+    client.available = False
+
+    async with DistributedLock(client, lease=1).hold("graph:flow") as acquired:
+        assert acquired is False
@@ -0,0 +1,74 @@
+import pytest
+from langflow.services.cache.metrics import CacheMetrics, export_cache_metrics
+from langflow.services.cache.service import RedisCache, ThreadingInMemoryCache
+
+
+class FakeOpenTelemetry:
+    def __init__(self):
+        self.gauges = {}
+
+    def update_gauge(self, metric_name, value, labels):
+        self.gauges[metric_name, tuple(sorted(labels.items()))] = value
+
+
+def test_metrics_are_kept_per_known_namespace():
+    metrics = CacheMetrics()
+    metrics.record("get", "graph:flow", 0.2, hit=True)
+    metrics.record("get", "graph:other", 0.4, hit=False)
+    metrics.record("set", "session:abc:hash", 0.1, size=100)
+    metrics.record("delete", "some-id", 0.3)
+
+    snapshot = metrics.snapshot()
+
+    assert set(snapshot) == {"graph", "session", "default"}
+    assert snapshot["graph"]["hits"] == 1
+    assert snapshot["graph"]["misses"] == 1
+    assert snapshot["graph"]["hit_ratio"] == 0.5
+    assert snapshot["graph"]["latency"]["get"]["mean_seconds"] == pytest.approx(0.3)
+    assert snapshot["graph"]["latency"]["get"]["max_seconds"] == 0.4
+    assert snapshot["session"]["bytes_written"] == 100
+    assert snapshot["default"]["deletes"] == 1
+
+
+def test_in_memory_cache_reports_sizes_and_evictions():
+    cache = ThreadingInMemoryCache(namespace_budgets={"graph": 4096})
+    cache.set("graph:a", "a" * 3000)
+    cache.set("graph:b", "b" * 3000)
+    cache.get("graph:a")
+    cache.get("graph:b")
+
+    graph_metrics = cache.get_metrics()["graph"]
+
+    assert graph_metrics["writes"] == 2
+    assert graph_metrics["hits"] == 1
+    assert graph_metrics["misses"] == 1
+    assert graph_metrics["evictions"] == 1
+    assert graph_metrics["entries"] == 1
+    assert graph_metrics["bytes"] > 3000
+
+
+async def test_redis_cache_counts_serialized_bytes(fake_redis):
+    cache = RedisCache(client=fake_redis)
+    await cache.set("vertex_result:sha", {"data": b"x" * 1000})
+    await cache.upsert("vertex_result:sha", {"other": 1})
+    await cache.get("vertex_result:sha")
+
+    vertex_metrics = cache.get_metrics()["vertex_result"]
+
+    assert vertex_metrics["writes"] == 2
+    assert vertex_metrics["hits"] == 1
+    assert vertex_metrics["misses"] == 0
+    assert vertex_metrics["bytes_written"] > 2000
+
+
+def test_export_sets_a_gauge_per_namespace():
+    cache = ThreadingInMemoryCache()
+    cache.set("graph:a", 1)
+    cache.get("graph:a")
+    ot = FakeOpenTelemetry()
+
+    export_cache_metrics(ot, cache)
+
+    assert ot.gauges["cache_hits", (("namespace", "graph"),)] == 1
+    assert ot.gauges["cache_entries", (("namespace", "graph"),)] == 1
+    assert ("cache_operation_seconds", (("namespace", "graph"), ("operation", "get"))) in ot.gauges
@@ -0,0 +1,54 @@
+import pickle
+
+import pytest
+from langflow.services.cache.compression import ValueCompressor
+from langflow.services.cache.service import RedisCache
+from langflow.services.cache.utils import CACHE_MISS
+
+
+@pytest.fixture
+def hash_cache(fake_redis):
+    return RedisCache(client=fake_redis, hash_entries=True)
+
+
+async def test_hash_entries_are_updated_field_by_field(hash_cache, fake_redis):
+    await hash_cache.set("flow", {"result": "graph", "type": str})
+    written = hash_cache.stats()["bytes_written"]
+
+    await hash_cache.upsert("flow", {"result": "new graph"})
+
+    assert await hash_cache.get("flow") == {"result": "new graph", "type": str}
+    assert set(fake_redis.data["flow"]) == {"result", "type"}
+    assert hash_cache.stats()["bytes_written"] - written == len(pickle.dumps("new graph"))
+
+
+async def test_hash_entries_keep_values_that_are_not_dictionaries(hash_cache):
+    await hash_cache.set("count", 1)
+    assert await hash_cache.get("count") == 1
+
+    await hash_cache.upsert("count", {"a": 1})
+    assert await hash_cache.get("count") == {"a": 1}
+
+    await hash_cache.upsert("count", [1, 2])
+    assert await hash_cache.get("count") == [1, 2]
+    assert await hash_cache.get("missing") is CACHE_MISS
+
+
+async def test_large_values_are_compressed(fake_redis):
+    cache = RedisCache(client=fake_redis, compression="zlib", compression_threshold=100)
+    value = {"text": "a" * 10_000}
+
+    await cache.set("flow", value)
+    await cache.set("small", "a")
+
+    assert await cache.get("flow") == value
+    assert await cache.get("small") == "a"
+    assert len(fake_redis.data["flow"]) < 1000
+    assert cache.stats()["values_compressed"] == 1
+
+
+def test_compressor_reads_values_written_without_compression():
+    data = pickle.dumps("a" * 1000)
+
+    assert ValueCompressor("zlib", threshold=100).decompress(data) == data
+    assert ValueCompressor().decompress(ValueCompressor("zlib", threshold=100).compress(data)) == data
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+from langflow.services.cache.service import RedisCache
+from langflow.services.cache.tiered import TieredCache
+from langflow.services.cache.utils import CACHE_MISS
+
+
+@pytest.fixture
+async def workers(fake_redis):
+    caches = [TieredCache(RedisCache(client=fake_redis.connection()), max_size=10) for _ in range(2)]
+    for cache in caches:
+        cache._ensure_listener()
+    # The workers are subscribed once they listen to the channel
+    async with fake_redis.listening:
+        await asyncio.wait_for(fake_redis.listening.wait_for(lambda: fake_redis.listeners == len(caches)), timeout=5)
+    assert all(cache._subscribed for cache in caches)
+    yield caches
+    for cache in caches:
+        await cache.teardown()
+
+
+async def test_reads_are_served_locally_after_the_first_one(workers, fake_redis):
+    first, _ = workers
+    await first.set("flow", {"a": 1})
+    fake_redis.data.clear()
+
+    assert await first.get("flow") == {"a": 1}
+
+
+async def test_writes_invalidate_the_copies_of_other_workers(workers):
+    first, second = workers
+    await first.set("flow", {"a": 1})
+    assert await second.get("flow") == {"a": 1}
+
+    await first.upsert("flow", {"b": 2})
+    await asyncio.sleep(0)
+
+    assert await second.get("flow") == {"a": 1, "b": 2}
+
+    await second.delete("flow")
+    await asyncio.sleep(0)
+
+    assert await first.get("flow") is CACHE_MISS
+
+
+async def test_falls_back_to_the_local_cache_without_redis(workers, fake_redis):
+    first, _ = workers
+    first.redis_cache.client.available = False
+
+    await first.set("flow", {"a": 1})
+    first._subscribed = False
+
+    assert await first.get("flow") == {"a": 1}
+    assert fake_redis.data == {}
+
+
+async def test_upsert_of_hash_entries_merges_in_redis(fake_redis):
+    first, second = (
+        TieredCache(RedisCache(client=fake_redis.connection(), hash_entries=True), max_size=10) for _ in range(2)
+    )
+    await first.set("flow", {"a": 1})
+
+    await second.upsert("flow", {"b": 2})
+
+    assert await second.get("flow") == {"a": 1, "b": 2}
+    assert await first.get("flow") == {"a": 1, "b": 2}
+    await first.teardown()
+    await second.teardown()
@@ -16,8 +16,9 @@ def opentelemetry_instance():
 def test_init(opentelemetry_instance):
     assert isinstance(opentelemetry_instance, OpenTelemetry)
     assert len(opentelemetry_instance._metrics) > 1
-    assert len(opentelemetry_instance._metrics) == len(opentelemetry_instance._metrics_registry) == 2
+    assert len(opentelemetry_instance._metrics) == len(opentelemetry_instance._metrics_registry) == 12
     assert "file_uploads" in opentelemetry_instance._metrics
+    assert "cache_hits" in opentelemetry_instance._metrics
 
 
 def test_gauge(opentelemetry_instance):
@@ -39,6 +40,19 @@ def test_gauge_with_up_down_counter_method(opentelemetry_instance):
         opentelemetry_instance.up_down_counter("file_uploads", 1, labels=fixed_labels)
 
 
+def test_gauge_refreshers_run_at_most_once_per_interval(opentelemetry_instance, monkeypatch):
+    calls = []
+    opentelemetry_instance.add_gauge_refresher("test", lambda: calls.append(1))
+    monkeypatch.setattr(OpenTelemetry, "_gauges_refreshed_at", 0.0)
+    try:
+        opentelemetry_instance._refresh_gauges()
+        opentelemetry_instance._refresh_gauges()
+    finally:
+        opentelemetry_instance._gauge_refreshers.pop("test")
+
+    assert calls == [1]
+
+
 def test_increment_counter(opentelemetry_instance):
     opentelemetry_instance.increment_counter(metric_name="num_files_uploaded", value=5, labels=fixed_labels)
 
@@ -0,0 +1,120 @@
+import asyncio
+import contextvars
+import math
+import threading
+from types import SimpleNamespace
+
+import pytest
+from langflow.custom import Component
+from langflow.template.field.base import Output
+from langflow.utils import executors
+from langflow.utils.executors import ExecutorPool, get_executor_pools_stats, run_in_process, shutdown_executor_pools
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+class FactorialComponent(Component):
+    outputs = [Output(display_name="Factorial", name="factorial", method="build_factorial")]
+
+    async def build_factorial(self) -> int:
+        return await self.run_in_process(math.factorial, 20)
+
+
+@pytest.fixture
+def pool():
+    pool = ExecutorPool("test", 1)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def process_pool_size(monkeypatch):
+    settings = SimpleNamespace(executor_process_pool_size=1, executor_cpu_pool_size=1)
+    monkeypatch.setattr(executors, "get_settings_service", lambda: SimpleNamespace(settings=settings))
+    monkeypatch.setattr(executors, "_pools", {})
+    yield settings
+    shutdown_executor_pools()
+
+
+def _completed_by_pool() -> dict[str, int]:
+    return {stats["name"]: stats["completed"] for stats in get_executor_pools_stats()}
+
+
+async def test_run_returns_the_result_and_counts_the_call(pool):
+    result = await pool.run(lambda a, b: a + b, 1, 2)
+
+    assert result == 3
+    assert pool.stats() == {
+        "name": "test",
+        "type": "thread",
+        "max_workers": 1,
+        "queued": 0,
+        "running": 0,
+        "completed": 1,
+        "failed": 0,
+    }
+
+
+async def test_run_counts_failures(pool):
+    def fail():
+        msg = "boom"
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="boom"):
+        await pool.run(fail)
+
+    assert pool.stats()["failed"] == 1
+
+
+async def test_run_keeps_the_context(pool):
+    request_id.set("abc")
+
+    assert await pool.run(request_id.get) == "abc"
+
+
+async def test_stats_report_queue_depth(pool):
+    loop = asyncio.get_running_loop()
+    started = asyncio.Event()
+    release = threading.Event()
+
+    def block():
+        loop.call_soon_threadsafe(started.set)
+        release.wait()
+
+    first = asyncio.create_task(pool.run(block))
+    second = asyncio.create_task(pool.run(lambda: None))
+    await asyncio.wait_for(started.wait(), timeout=5)
+
+    assert pool.stats()["queued"] == 1
+    assert pool.stats()["running"] == 1
+
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    assert pool.stats()["queued"] == 0
+
+    release.set()
+    await first
+    assert pool.stats()["running"] == 0
+
+
+@pytest.mark.usefixtures("process_pool_size")
+async def test_components_run_picklable_functions_in_the_process_pool():
+    assert await FactorialComponent().build_factorial() == math.factorial(20)
+
+    assert _completed_by_pool() == {"process": 1}
+
+
+@pytest.mark.usefixtures("process_pool_size")
+async def test_functions_that_cannot_be_pickled_run_on_the_cpu_threads():
+    assert await run_in_process(lambda value: value * 2, 21) == 42
+
+    assert _completed_by_pool() == {"cpu": 1}
+
+
+async def test_disabled_process_pool_runs_on_the_cpu_threads(process_pool_size):
+    process_pool_size.executor_process_pool_size = 0
+
+    assert await run_in_process(math.factorial, 5) == 120
+
+    assert _completed_by_pool() == {"cpu": 1}